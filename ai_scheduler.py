@@ -0,0 +1,41 @@
+# ai_scheduler.py - 적군 판단 시분할 스케줄러 (판단은 버킷별로 몇 틱에 한 번, 이동은 매 틱)
+
+from config import *
+
+
+class AIScheduler:
+    """적군을 버킷으로 나눠 틱마다 한 버킷만 판단(상태 결정, 시야, 군집 회피)하게 함
+
+    틱당 판단 수가 예산을 넘으면 남은 적군은 다음 틱으로 미뤄 먼저 판단
+    예산을 시간 대신 판단 횟수로 잡아 헤드리스/리플레이에서도 같은 결과가 나옴
+    """
+
+    def __init__(self, interval=AI_THINK_INTERVAL, budget=AI_THINK_BUDGET, far_factor=AI_LOD_FAR_THINK_FACTOR):
+        self.interval = interval      # 판단 주기 (틱)
+        self.budget = budget          # 틱당 최대 판단 수
+        self.far_factor = far_factor  # 먼 적군은 interval * far_factor 틱마다 판단
+        self.tick = 0
+        self.assigned = 0
+        self.overdue = []         # 예산 초과로 미뤄진 적군 (다음 틱에 먼저 판단)
+        self.deferred = 0         # 지금까지 미뤄진 판단 수 (통계)
+
+    def assign(self, enemy):
+        """새 적군을 버킷에 차례로 배정 (판단 시점이 틱마다 고르게 퍼지도록)"""
+        enemy.ai_bucket = self.assigned % self.interval
+        enemy.ai_phase = (self.assigned // self.interval) % self.far_factor  # 먼 적군끼리도 엇갈리게
+        self.assigned += 1
+
+    def schedule(self, enemies):
+        """이번 틱에 판단할 적군 집합 (미뤄진 적군 먼저, 그 다음 이번 차례 버킷)"""
+        self.tick += 1
+        bucket = self.tick % self.interval
+        far_phase = (self.tick // self.interval) % self.far_factor
+        due = [enemy for enemy in self.overdue if not enemy.is_dead]
+        waiting = set(due)
+        due.extend(enemy for enemy in enemies
+                   if enemy.ai_bucket == bucket and not enemy.is_dead and
+                   (enemy.full_detail or enemy.ai_phase == far_phase) and enemy not in waiting)
+
+        self.overdue = due[self.budget:]
+        self.deferred += len(self.overdue)
+        return set(due[:self.budget])
@@ -0,0 +1,259 @@
+# bench.py - 고정 시드 시나리오 벤치마크 (헤드리스 / 렌더링, 서브시스템별 시간을 JSON으로 기록)
+
+import json
+import math
+import os
+import platform
+import sys
+import time
+import pygame
+import numpy as np
+from config import *
+from utils import clamp
+from particles import null_particles
+from surface_cache import surface_cache
+from text_cache import text_cache
+from profiler import Profiler
+from simulation import Simulation, PlayerInput, KeyState, ScriptedController, BotController
+
+
+class ScenarioController(ScriptedController):
+    """스크립트 입력 + 틱마다 실행하는 시나리오 동작 (적 보충, 폭발, 상자 파괴 등)"""
+
+    def __init__(self, inputs=(), on_tick=None):
+        super().__init__(inputs)
+        self.on_tick = on_tick
+
+    def next_input(self, simulation):
+        if self.on_tick is not None:
+            self.on_tick(simulation)
+        return super().next_input(simulation)
+
+
+def _make_invulnerable(player):
+    """벤치마크 도중 플레이어가 죽어서 시나리오가 끝나지 않도록"""
+    player.hp = player.max_hp = 10 ** 9
+
+
+def _spawn_enemies(simulation, count, min_radius, max_radius, arc=(0.0, 2 * math.pi)):
+    """플레이어 주변 고리(또는 부채꼴) 영역에 장애물을 피해 적군 배치"""
+    player = simulation.player
+    enemy_manager = simulation.enemy_manager
+    random = simulation.rng.gameplay
+    spawned = 0
+    for _ in range(count * 20):
+        if spawned >= count:
+            break
+        angle = random.uniform(*arc)
+        radius = random.uniform(min_radius, max_radius)
+        x = clamp(player.x + math.cos(angle) * radius, ENEMY_SIZE, WORLD_WIDTH - ENEMY_SIZE)
+        y = clamp(player.y + math.sin(angle) * radius, ENEMY_SIZE, WORLD_HEIGHT - ENEMY_SIZE)
+        if simulation.obstacle_manager.check_collision_circle(x, y, ENEMY_SIZE // 2):
+            continue
+        enemy = enemy_manager.create_enemy(x, y)
+        enemy.chase_range = WORLD_WIDTH  # 보이기만 하면 추격
+        enemy_manager.add_enemy(enemy)
+        spawned += 1
+    return spawned
+
+
+def _alive_count(simulation):
+    return sum(1 for enemy in simulation.enemy_manager.enemies if not enemy.is_dead)
+
+
+def _scenario_crowd_chase(simulation):
+    """200 enemies chasing an idle player"""
+    _make_invulnerable(simulation.player)
+    _spawn_enemies(simulation, 200, 150, 700)
+    return ScenarioController()
+
+
+def _scenario_shotgun_crowd(simulation):
+    """shotgun spam into a crowd that is topped up to 120 enemies"""
+    player = simulation.player
+    _make_invulnerable(player)
+    arc = (-math.pi / 4, math.pi / 4)
+    _spawn_enemies(simulation, 120, 150, 600, arc)
+
+    def refill(simulation):
+        if simulation.tick % 30 == 0:
+            _spawn_enemies(simulation, 120 - _alive_count(simulation), 300, 600, arc)
+
+    aim = (player.x + 300, player.y)
+    inputs = [PlayerInput(KeyState([pygame.K_2]), (True, False, False), aim),
+              PlayerInput(KeyState([pygame.K_2]), (False, False, False), aim)]
+    return ScenarioController(inputs, refill)
+
+
+def _scenario_explosions(simulation):
+    """10 simultaneous explosions around the player every explosion cycle"""
+    player = simulation.player
+    _make_invulnerable(player)
+    _spawn_enemies(simulation, 100, 100, 400)
+
+    def explode(simulation):
+        if simulation.tick % EXPLOSION_DURATION == 0:
+            enemies = simulation.enemy_manager.get_enemies()
+            for i in range(10):
+                angle = 2 * math.pi * i / 10
+                position = (player.x + math.cos(angle) * 250, player.y + math.sin(angle) * 250)
+                player._create_explosion(enemies, simulation.camera, position)
+            _spawn_enemies(simulation, 100 - _alive_count(simulation), 100, 400)
+
+    return ScenarioController(on_tick=explode)
+
+
+def _scenario_crates_destroyed(simulation):
+    """every destructible obstacle is destroyed one by one, camera following"""
+    player = simulation.player
+    _make_invulnerable(player)
+    crates = [o for o in simulation.obstacle_manager.get_obstacles() if o.destructible]
+
+    def destroy_next(simulation):
+        if simulation.tick % 5 == 0 and crates:
+            crate = crates.pop(0)
+            crate.take_damage(crate.hp)
+            player.x = player.prev_x = crate.x + crate.width / 2
+            player.y = player.prev_y = crate.y + crate.height / 2
+
+    return ScenarioController(on_tick=destroy_next)
+
+
+def _scenario_bot_match(simulation):
+    """a normal match played by the built-in bot"""
+    return BotController(simulation.seed)
+
+
+SCENARIOS = {
+    'crowd_chase': _scenario_crowd_chase,
+    'shotgun_crowd': _scenario_shotgun_crowd,
+    'explosions': _scenario_explosions,
+    'crates_destroyed': _scenario_crates_destroyed,
+    'bot_match': _scenario_bot_match,
+}
+
+
+def run_scenario(name, ticks=BENCH_TICKS, seed=BENCH_SEED, render=False, screen=None):
+    """시나리오 하나를 고정 틱 수만큼 실행하고 결과 딕셔너리 반환 (렌더링은 틱마다 한 프레임)"""
+    renderer = None
+    if render:
+        from renderer import GameRenderer
+        renderer = GameRenderer()
+        clock = pygame.time.Clock()
+        if screen is None:
+            screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    # 헤드리스에서는 월드 파티클을 빈 풀로 보냄
+    simulation = Simulation(seed, renderer.particles if renderer is not None else null_particles)
+    controller = SCENARIOS[name](simulation)
+
+    surface_before = surface_cache.stats()
+    text_before = text_cache.stats()
+    chunk_renders_before = simulation.obstacle_manager.static_layer.renders
+
+    profiler = Profiler()
+    peaks = {'enemies': 0, 'bullets': 0, 'particles': 0}
+    started = time.perf_counter()
+    for _ in range(ticks):
+        if simulation.game_over:
+            break
+        with profiler.section('frame'):
+            simulation.step(controller.next_input(simulation), profiler)
+            if renderer is not None:
+                renderer.update(profiler)
+                renderer.draw(screen, simulation, clock, 1.0, profiler)
+        profiler.end_frame()
+
+        peaks['enemies'] = max(peaks['enemies'], len(simulation.enemy_manager.enemies))
+        peaks['bullets'] = max(peaks['bullets'], len(simulation.bullet_manager))
+        if renderer is not None:
+            # 헤드리스에서는 파티클을 만들지 않으므로 렌더링 모드에서만 집계
+            particles = renderer.particles.count + renderer.effects.particles.count
+            peaks['particles'] = max(peaks['particles'], particles)
+    elapsed = time.perf_counter() - started
+
+    surface_after = surface_cache.stats()
+    text_after = text_cache.stats()
+    return {
+        'scenario': name,
+        'description': SCENARIOS[name].__doc__,
+        'mode': 'render' if render else 'headless',
+        'seed': seed,
+        'ticks': simulation.tick,
+        'seconds': elapsed,
+        'ticks_per_second': simulation.tick / elapsed if elapsed > 0 else 0.0,
+        'sections': profiler.summary(),
+        'peak_counts': peaks,
+        'caches': {
+            'surface_hits': surface_after['hits'] - surface_before['hits'],
+            'surface_misses': surface_after['misses'] - surface_before['misses'],
+            'surface_entries': surface_after['entries'],
+            'text_hits': text_after['hits'] - text_before['hits'],
+            'text_misses': text_after['misses'] - text_before['misses'],
+            'static_chunk_renders': simulation.obstacle_manager.static_layer.renders - chunk_renders_before,
+        },
+        'result': simulation.result(),
+    }
+
+
+def _print_run(run):
+    print(f"{run['scenario']} [{run['mode']}] {run['ticks']} ticks, "
+          f"{run['ticks_per_second']:.0f} ticks/s")
+    for name, stats in run['sections'].items():
+        print(f"  {name:<20} mean {stats['mean_ms']:7.3f} ms  p95 {stats['p95_ms']:7.3f} ms  "
+              f"p99 {stats['p99_ms']:7.3f} ms")
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Elite Combat Arena benchmark scenarios")
+    parser.add_argument('scenarios', nargs='*', help="scenario names (default: all)")
+    parser.add_argument('--ticks', type=int, default=BENCH_TICKS)
+    parser.add_argument('--seed', type=int, default=BENCH_SEED)
+    parser.add_argument('--mode', choices=('headless', 'render', 'both'), default='both')
+    parser.add_argument('--output', default=BENCH_OUTPUT, help="JSON result path")
+    parser.add_argument('--list', action='store_true', help="list scenarios and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, setup in SCENARIOS.items():
+            print(f"{name:<20} {setup.__doc__}")
+        return 0
+
+    names = args.scenarios or list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    modes = {'headless': (False,), 'render': (True,), 'both': (False, True)}[args.mode]
+    screen = None
+    if True in modes:
+        # 창 없이 렌더링 경로를 측정
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        pygame.init()
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    runs = []
+    for name in names:
+        for render in modes:
+            run = run_scenario(name, args.ticks, args.seed, render, screen)
+            _print_run(run)
+            runs.append(run)
+
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'numpy': np.__version__,
+        'bullet_engine': BULLET_ENGINE,
+        'runs': runs,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
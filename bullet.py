@@ -2,13 +2,59 @@
 
 import pygame
 import math
-import random
+from collections import namedtuple
+import numpy as np
 from config import *
 from utils import *
+from spatial import SpatialGrid
+from particles import null_particles
+from surface_cache import surface_cache
+
+
+def sweep_enemies(start_x, start_y, end_x, end_y, bullet_size, enemy_grid):
+    """이동 선분에서 가장 먼저 닿는 적군 (브로드 페이즈: 선분 주변 셀) - (적군, t) 반환"""
+    reach = bullet_size + ENEMY_SIZE // 2
+    candidates = enemy_grid.query(min(start_x, end_x) - reach, min(start_y, end_y) - reach,
+                                  max(start_x, end_x) + reach, max(start_y, end_y) + reach)
+
+    hit_enemy = None
+    hit_t = None
+    for enemy in candidates:
+        if not enemy.is_dead:
+            t = segment_circle_entry(start_x, start_y, end_x, end_y,
+                                     enemy.x, enemy.y, bullet_size + enemy.size // 2)
+            if t is not None and (hit_t is None or t < hit_t):
+                hit_enemy, hit_t = enemy, t
+    return hit_enemy, hit_t
+
+
+def emit_sparks(particles, rng, x, y, weapon_type):
+    """비행 중 스파크 파티클 한 묶음 (저격총은 더 많이)"""
+    spark_count = 2 if weapon_type == 'SNIPER' else 1
+    random = rng.cosmetic
+    for _ in range(spark_count):
+        # 파티클 엔진은 프레임 단위로 움직이므로 틱 단위 값을 환산
+        particles.emit(x + random.uniform(-2, 2),
+                       y + random.uniform(-2, 2),
+                       random.uniform(-1, 1) * BULLET_STEPS_PER_FRAME,
+                       random.uniform(-1, 1) * BULLET_STEPS_PER_FRAME,
+                       15 / BULLET_STEPS_PER_FRAME, random.uniform(1, 3), YELLOW)
+
+
+def create_hit_effect(x, y, weapon_type):
+    """총알 히트 효과 생성 (두 총알 매니저 공용)"""
+    # 무기별 다른 히트 효과
+    if weapon_type == 'SNIPER':
+        # 저격총은 더 강한 효과
+        pass
+    # 나중에 effects 시스템과 연동
 
 
 class Bullet:
-    def __init__(self, start_x, start_y, vx, vy, damage, color, weapon_type):
+    def __init__(self, start_x, start_y, vx, vy, damage, color, weapon_type, rng,
+                 particles=null_particles):
+        self.rng = rng
+        self.particles = particles
         self.x = start_x
         self.y = start_y
         self.vx = vx
@@ -20,6 +66,10 @@ class Bullet:
         self.lifetime = BULLET_LIFETIME
         self.trail = []
 
+        # 스윕 충돌용 직전 위치
+        self.prev_x = start_x
+        self.prev_y = start_y
+
         # 무기별 특수 효과
         if weapon_type == 'SNIPER':
             self.size = 6  # 더 큰 총알
@@ -27,44 +77,33 @@ class Bullet:
         else:
             self.glow_intensity = 150
 
-        # 총알 효과
-        self.spark_particles = []
-
-    def update(self):
-        # 위치 업데이트
-        self.x += self.vx
-        self.y += self.vy
-        self.lifetime -= 1
-
-        # 트레일 업데이트
-        self.trail.append((self.x, self.y))
+        # 스파크 생성 타이머 (틱 단위)
+        self.spark_timer = 0
+
+    def update(self, dt=1.0):
+        # 위치 업데이트 (dt = 이번 스텝이 몇 틱 분량인지)
+        self.prev_x, self.prev_y = self.x, self.y
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+        self.lifetime -= dt
+
+        # 트레일 업데이트 (큰 스텝이면 중간 지점도 채워서 트레일 길이 유지)
+        trail_steps = max(1, int(round(dt)))
+        for i in range(1, trail_steps + 1):
+            ratio = i / trail_steps
+            self.trail.append((lerp(self.prev_x, self.x, ratio), lerp(self.prev_y, self.y, ratio)))
         trail_length = 12 if self.weapon_type == 'SNIPER' else 8
         if len(self.trail) > trail_length:
-            self.trail.pop(0)
+            del self.trail[:-trail_length]
 
         # 글로우 효과 감소
-        self.glow_intensity = max(50, self.glow_intensity - 2)
-
-        # 스파크 파티클 생성 (저격총은 더 많이)
-        spark_count = 2 if self.weapon_type == 'SNIPER' else 1
-        if len(self.spark_particles) < spark_count * 3:
-            for _ in range(spark_count):
-                self.spark_particles.append({
-                    'x': self.x + random.uniform(-2, 2),
-                    'y': self.y + random.uniform(-2, 2),
-                    'vx': random.uniform(-1, 1),
-                    'vy': random.uniform(-1, 1),
-                    'life': 15,
-                    'size': random.uniform(1, 3)
-                })
-
-        # 스파크 파티클 업데이트
-        for particle in self.spark_particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['life'] -= 1
-            if particle['life'] <= 0:
-                self.spark_particles.remove(particle)
+        self.glow_intensity = max(50, self.glow_intensity - 2 * dt)
+
+        # 스파크 파티클 생성 (저격총은 더 많이) - 수명 15틱 동안 최대 3묶음이 유지되도록 5틱마다
+        self.spark_timer -= dt
+        if self.spark_timer <= 0:
+            self.spark_timer += 5
+            emit_sparks(self.particles, self.rng, self.x, self.y, self.weapon_type)
 
         # 월드 경계 체크
         if (self.x < 0 or self.x > WORLD_WIDTH or
@@ -76,23 +115,20 @@ class Bullet:
         if not camera.is_visible(self.x, self.y, self.size):
             return
 
-        screen_x, screen_y = camera.world_to_screen(self.x, self.y)
+        screen_x, screen_y = camera.world_to_screen(*camera.lerp_position(self.prev_x, self.prev_y,
+                                                                           self.x, self.y))
 
         # 트레일 그리기
         for i, (trail_x, trail_y) in enumerate(self.trail):
             trail_screen_x, trail_screen_y = camera.world_to_screen(trail_x, trail_y)
             alpha = int(255 * (i / len(self.trail)) * 0.7)
             if alpha > 0:
-                trail_surface = pygame.Surface((self.size * 2, self.size * 2))
-                trail_surface.set_alpha(alpha)
-                trail_surface.fill(self.color)
+                trail_surface = surface_cache.filled(self.size * 2, self.color, alpha)
                 screen.blit(trail_surface, (trail_screen_x - self.size, trail_screen_y - self.size))
 
         # 글로우 효과
         glow_size = self.size * 8 if self.weapon_type == 'SNIPER' else self.size * 6
-        glow_surface = pygame.Surface((glow_size, glow_size))
-        glow_surface.set_alpha(self.glow_intensity // 4)
-        glow_surface.fill(self.color)
+        glow_surface = surface_cache.filled(glow_size, self.color, int(self.glow_intensity) // 4)
         screen.blit(glow_surface, (screen_x - glow_size // 2, screen_y - glow_size // 2))
 
         # 메인 총알
@@ -103,16 +139,6 @@ class Bullet:
         if self.weapon_type == 'SNIPER':
             pygame.draw.circle(screen, YELLOW, (int(screen_x), int(screen_y)), self.size - 2)
 
-        # 스파크 파티클
-        for particle in self.spark_particles:
-            particle_screen_x, particle_screen_y = camera.world_to_screen(particle['x'], particle['y'])
-            alpha = int(255 * (particle['life'] / 15))
-            if alpha > 0:
-                spark_surface = pygame.Surface((int(particle['size'] * 2), int(particle['size'] * 2)))
-                spark_surface.set_alpha(alpha)
-                spark_surface.fill(YELLOW)
-                screen.blit(spark_surface, (particle_screen_x - particle['size'],
-                                            particle_screen_y - particle['size']))
 
     def is_alive(self):
         return self.lifetime > 0
@@ -126,84 +152,61 @@ class Bullet:
 
 
 class BulletManager:
-    def __init__(self):
+    def __init__(self, rng, particles=null_particles):
+        self.rng = rng
+        self.particles = particles
         self.bullets = []
 
     def add_bullet(self, start_x, start_y, vx, vy, damage, color, weapon_type):
-        bullet = Bullet(start_x, start_y, vx, vy, damage, color, weapon_type)
+        bullet = Bullet(start_x, start_y, vx, vy, damage, color, weapon_type, self.rng, self.particles)
         self.bullets.append(bullet)
 
-    def update(self, enemies, obstacle_manager):
-        # 총알 업데이트
-        for bullet in self.bullets[:]:
-            bullet.update()
+    def update(self, enemies, obstacle_manager, enemy_grid=None, enemy_store=None):
+        # 브로드 페이즈: 적군 공간 해시 (EnemyManager와 공유, 없으면 직접 구축)
+        # enemy_store는 ArrayBulletManager와 같은 호출을 받기 위한 인자 (여기서는 쓰지 않음)
+        if enemy_grid is None:
+            enemy_grid = SpatialGrid(ENEMY_GRID_CELL_SIZE)
+            for enemy in enemies:
+                enemy_grid.insert(enemy, enemy.x, enemy.y, enemy.x, enemy.y)
 
-            # 생존 체크
-            if not bullet.is_alive():
-                self.bullets.remove(bullet)
-                continue
+        # 총알 업데이트 (스윕 충돌이므로 큰 스텝으로 적게 돌려도 충돌을 놓치지 않음)
+        dt = BULLET_STEPS_PER_FRAME / BULLET_SUBSTEPS
+        for _ in range(BULLET_SUBSTEPS):
+            self._step(enemy_grid, obstacle_manager, dt)
 
-            # 장애물 충돌 체크
-            bullet_rect = pygame.Rect(bullet.x - bullet.size, bullet.y - bullet.size,
-                                      bullet.size * 2, bullet.size * 2)
-            hit_obstacle = obstacle_manager.check_collision_rect(bullet_rect)
-            if hit_obstacle:
-                # 파괴 가능한 장애물에 데미지
-                if hit_obstacle.destructible:
-                    hit_obstacle.take_damage(bullet.damage // 2)  # 총알 데미지의 절반
-                self.bullets.remove(bullet)
-                continue
-
-            # 적군과의 충돌 체크
-            bullet_x, bullet_y = bullet.get_position()
-            for enemy in enemies:
-                if not enemy.is_dead:
-                    enemy_dist = distance((bullet_x, bullet_y), (enemy.x, enemy.y))
-                    if enemy_dist <= (bullet.size + enemy.size // 2):
-                        # 히트!
-                        enemy.take_damage(bullet.damage)
-                        self._create_hit_effect(bullet_x, bullet_y, bullet.weapon_type)
-                        self.bullets.remove(bullet)
-                        break
-        # 총알 업데이트
-        for bullet in self.bullets[:]:
-            bullet.update()
+    def _step(self, enemy_grid, obstacle_manager, dt):
+        """총알 한 스텝 이동 및 이동 경로 전체에 대한 충돌 처리"""
+        surviving_bullets = []
+        for bullet in self.bullets:
+            bullet.update(dt)
 
             # 생존 체크
             if not bullet.is_alive():
-                self.bullets.remove(bullet)
                 continue
 
-            # 장애물 충돌 체크
-            bullet_rect = pygame.Rect(bullet.x - bullet.size, bullet.y - bullet.size,
-                                      bullet.size * 2, bullet.size * 2)
-            hit_obstacle = obstacle_manager.check_collision_rect(bullet_rect)
+            # 이동 선분을 따라 가장 먼저 닿는 장애물과 적군을 찾음
+            start_x, start_y = bullet.prev_x, bullet.prev_y
+            hit_obstacle, obstacle_t = obstacle_manager.sweep_collision(
+                start_x, start_y, bullet.x, bullet.y, bullet.size)
+            hit_enemy, enemy_t = sweep_enemies(start_x, start_y, bullet.x, bullet.y,
+                                               bullet.size, enemy_grid)
+
+            if hit_enemy and (not hit_obstacle or enemy_t <= obstacle_t):
+                # 히트!
+                bullet.x = lerp(start_x, bullet.x, enemy_t)
+                bullet.y = lerp(start_y, bullet.y, enemy_t)
+                hit_enemy.take_damage(bullet.damage)
+                create_hit_effect(bullet.x, bullet.y, bullet.weapon_type)
+                continue
+
             if hit_obstacle:
                 # 파괴 가능한 장애물에 데미지
                 if hit_obstacle.destructible:
                     hit_obstacle.take_damage(bullet.damage // 2)  # 총알 데미지의 절반
-                self.bullets.remove(bullet)
                 continue
 
-            # 적군과의 충돌 체크
-            bullet_x, bullet_y = bullet.get_position()
-            for enemy in enemies:
-                if not enemy.is_dead:
-                    enemy_dist = distance((bullet_x, bullet_y), (enemy.x, enemy.y))
-                    if enemy_dist <= (bullet.size + enemy.size // 2):
-                        # 히트!
-                        enemy.take_damage(bullet.damage)
-                        self._create_hit_effect(bullet_x, bullet_y, bullet.weapon_type)
-                        self.bullets.remove(bullet)
-                        break
-
-    def _create_hit_effect(self, x, y, weapon_type):
-        """총알 히트 효과 생성"""
-        # 무기별 다른 히트 효과
-        if weapon_type == 'SNIPER':
-            # 저격총은 더 강한 효과
-            pass
-        # 나중에 effects 시스템과 연동
+            surviving_bullets.append(bullet)
+        self.bullets = surviving_bullets
 
     def draw(self, screen, camera):
         for bullet in self.bullets:
@@ -211,6 +214,382 @@ class BulletManager:
 
     def get_bullets(self):
         return self.bullets
-    def get_dfie:
-        print("jefjef
-        gtfydhresrgvjok
+
+    def __len__(self):
+        return len(self.bullets)
+
+
+# 배열 기반 총알의 읽기 전용 스냅샷 (get_bullets 반환용)
+BulletState = namedtuple('BulletState', ['x', 'y', 'vx', 'vy', 'damage', 'color', 'weapon_type', 'size'])
+
+
+class ArrayBulletManager:
+    """구조체 배열(SoA) 방식 총알 저장소 - 이동/수명/경계 처리를 NumPy로 일괄 계산"""
+
+    WEAPON_IDS = list(WEAPON_TYPES)
+
+    def __init__(self, rng, particles=null_particles, capacity=256):
+        self.rng = rng
+        self.particles = particles
+        self.count = 0
+        self._allocate(capacity)
+
+        # 장애물 경계 배열 캐시
+        self._obstacle_cache = None
+        self._obstacle_cache_key = None
+
+    def _allocate(self, capacity):
+        """배열 (재)할당 - 기존 데이터는 유지"""
+        old_count = self.count
+        old = getattr(self, 'x', None)
+        fields = {
+            'x': np.float64, 'y': np.float64, 'prev_x': np.float64, 'prev_y': np.float64,
+            'vx': np.float64, 'vy': np.float64, 'lifetime': np.float64, 'age': np.float64,
+            'spark_timer': np.float64,
+            'damage': np.int32, 'size': np.int32, 'weapon_id': np.int16,
+        }
+        for name, dtype in fields.items():
+            array = np.zeros(capacity, dtype=dtype)
+            if old is not None:
+                array[:old_count] = getattr(self, name)[:old_count]
+            setattr(self, name, array)
+
+        colors = np.zeros((capacity, 3), dtype=np.uint8)
+        if old is not None:
+            colors[:old_count] = self.colors[:old_count]
+        self.colors = colors
+        self.capacity = capacity
+
+    def add_bullet(self, start_x, start_y, vx, vy, damage, color, weapon_type):
+        if self.count >= self.capacity:
+            self._allocate(self.capacity * 2)
+
+        i = self.count
+        self.x[i] = self.prev_x[i] = start_x
+        self.y[i] = self.prev_y[i] = start_y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.lifetime[i] = BULLET_LIFETIME
+        self.age[i] = 0
+        self.spark_timer[i] = 0
+        self.damage[i] = damage
+        self.size[i] = 6 if weapon_type == 'SNIPER' else BULLET_SIZE
+        self.weapon_id[i] = self.WEAPON_IDS.index(weapon_type)
+        self.colors[i] = color
+        self.count += 1
+
+    def update(self, enemies, obstacle_manager, enemy_grid=None, enemy_store=None):
+        if self.count == 0:
+            return
+
+        # 브로드 페이즈: 적군 공간 해시 (EnemyManager와 공유, 없으면 직접 구축)
+        if enemy_grid is None:
+            enemy_grid = SpatialGrid(ENEMY_GRID_CELL_SIZE)
+            for enemy in enemies:
+                enemy_grid.insert(enemy, enemy.x, enemy.y, enemy.x, enemy.y)
+        enemy_cells = self._enemy_cells(enemies, enemy_store, enemy_grid.cell_size)
+
+        dt = BULLET_STEPS_PER_FRAME / BULLET_SUBSTEPS
+        for _ in range(BULLET_SUBSTEPS):
+            self._step(enemy_cells, enemy_grid, obstacle_manager, dt)
+
+    def _step(self, enemy_cells, enemy_grid, obstacle_manager, dt):
+        """일괄 이동 + 수명/경계 컬링 후 남은 총알만 스윕 충돌 검사"""
+        n = self.count
+        if n == 0:
+            return
+
+        # 벡터화된 적분
+        x, y = self.x[:n], self.y[:n]
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+        x += self.vx[:n] * dt
+        y += self.vy[:n] * dt
+        self.lifetime[:n] -= dt
+        self.age[:n] += dt
+
+        # 스파크 파티클 (Bullet.update와 같은 주기와 모양)
+        spark_timer = self.spark_timer[:n]
+        spark_timer -= dt
+        sparking = np.flatnonzero(spark_timer <= 0)
+        if len(sparking):
+            spark_timer[sparking] += 5
+            for i in sparking.tolist():
+                emit_sparks(self.particles, self.rng, x[i], y[i], self.WEAPON_IDS[self.weapon_id[i]])
+
+        # 수명 및 월드 경계 컬링
+        keep = ((self.lifetime[:n] > 0) &
+                (x >= 0) & (x <= WORLD_WIDTH) & (y >= 0) & (y <= WORLD_HEIGHT))
+
+        # 충돌 검사 (남은 총알만) - 장애물/적군 모두 일괄 계산 후 명중한 총알만 순서대로 처리
+        alive = np.flatnonzero(keep)
+        if len(alive) == 0:
+            self._compact(keep)
+            return
+
+        obstacle_t = self._sweep_obstacles_batch(alive, obstacle_manager)
+        enemy_t = self._sweep_enemies_batch(alive, enemy_cells)
+
+        # 배치 결과는 후보 선별용 - 닿는 총알만 BulletManager와 같은 정밀 스윕으로 대상과 t를 다시 구함
+        # (같은 t일 때 고르는 대상, 같은 스텝에서 앞선 총알이 바꾼 상태까지 두 엔진 결과가 같음)
+        for k in np.flatnonzero(np.isfinite(obstacle_t) | np.isfinite(enemy_t)):
+            i = alive[k]
+            start_x, start_y = float(self.prev_x[i]), float(self.prev_y[i])
+            end_x, end_y = float(x[i]), float(y[i])
+            size = int(self.size[i])
+
+            hit_obstacle = hit_t = hit_enemy = target_t = None
+            if np.isfinite(obstacle_t[k]):
+                hit_obstacle, hit_t = obstacle_manager.sweep_collision(start_x, start_y, end_x, end_y, size)
+            if np.isfinite(enemy_t[k]):
+                hit_enemy, target_t = sweep_enemies(start_x, start_y, end_x, end_y, size, enemy_grid)
+
+            if hit_enemy and (not hit_obstacle or target_t <= hit_t):
+                # 히트! (BulletManager와 같이 명중 지점으로 옮기고 히트 효과)
+                x[i] = lerp(start_x, end_x, target_t)
+                y[i] = lerp(start_y, end_y, target_t)
+                hit_enemy.take_damage(int(self.damage[i]))
+                create_hit_effect(x[i], y[i], self.WEAPON_IDS[self.weapon_id[i]])
+                keep[i] = False
+            elif hit_obstacle:
+                if hit_obstacle.destructible:
+                    hit_obstacle.take_damage(int(self.damage[i]) // 2)  # 총알 데미지의 절반
+                keep[i] = False
+
+        self._compact(keep)
+
+    def _obstacle_arrays(self, obstacle_manager):
+        """장애물 경계 배열과 셀별 장애물 인덱스 (장애물 구성이 바뀔 때만 재구축)
+
+        셀은 장애물 매니저의 공간 그리드 셀을 그대로 씀 - 셀 번호 c의 장애물 인덱스는
+        cell_items[cell_start[c]:cell_start[c + 1]] (셀 번호 = (cy - min_cy) * cols + (cx - min_cx))
+        """
+        cache_key = (id(obstacle_manager), obstacle_manager.version)
+        if self._obstacle_cache_key != cache_key:
+            grid = obstacle_manager.grid
+            obstacles = [o for o in obstacle_manager.obstacles if not o.destroyed]
+            bounds = np.array([(o.x, o.y, o.x + o.width, o.y + o.height) for o in obstacles],
+                              dtype=np.float64).reshape(-1, 4)
+
+            order = {id(o): i for i, o in enumerate(obstacles)}
+            keys = [key for key, items in grid.cells.items() if any(id(o) in order for o in items)]
+            if keys:
+                min_cx = min(cx for cx, _ in keys)
+                min_cy = min(cy for _, cy in keys)
+                cols = max(cx for cx, _ in keys) - min_cx + 1
+                rows = max(cy for _, cy in keys) - min_cy + 1
+            else:
+                min_cx = min_cy = 0
+                cols = rows = 1
+            members = [[] for _ in range(cols * rows)]
+            for cx, cy in keys:
+                members[(cy - min_cy) * cols + cx - min_cx] = [order[id(o)] for o in grid.cells[(cx, cy)]
+                                                               if id(o) in order]
+            cell_start = np.zeros(cols * rows + 1, dtype=np.intp)
+            cell_start[1:] = np.cumsum([len(items) for items in members])
+            cell_items = np.array([i for items in members for i in items], dtype=np.intp)
+
+            self._obstacle_cache = (obstacles, bounds, cell_start, cell_items,
+                                    (grid.cell_size, min_cx, min_cy, cols, rows))
+            self._obstacle_cache_key = cache_key
+        return self._obstacle_cache
+
+    def _sweep_obstacles_batch(self, alive, obstacle_manager):
+        """총알 이동 선분 x 장애물 슬랩 검사 - 총알별 가장 이른 t (닿지 않으면 inf)
+
+        브로드 페이즈: 선분을 감싸는 사각형(패딩 포함)이 걸치는 그리드 셀의 장애물만 짝지어 검사
+        """
+        obstacles, bounds, cell_start, cell_items, layout = self._obstacle_arrays(obstacle_manager)
+        hit_t = np.full(len(alive), np.inf)
+        if len(obstacles) == 0:
+            return hit_t
+
+        # 총알별 셀 범위 (장애물이 있는 셀 범위로 자름 - 범위 밖 셀에는 장애물이 없음)
+        cell_size, min_cx, min_cy, cols, rows = layout
+        start_x, start_y = self.prev_x[alive], self.prev_y[alive]
+        end_x, end_y = self.x[alive], self.y[alive]
+        padding = self.size[alive].astype(np.float64)
+        cx0 = np.clip(np.floor((np.minimum(start_x, end_x) - padding) / cell_size) - min_cx, 0, cols - 1)
+        cx1 = np.clip(np.floor((np.maximum(start_x, end_x) + padding) / cell_size) - min_cx, 0, cols - 1)
+        cy0 = np.clip(np.floor((np.minimum(start_y, end_y) - padding) / cell_size) - min_cy, 0, rows - 1)
+        cy1 = np.clip(np.floor((np.maximum(start_y, end_y) + padding) / cell_size) - min_cy, 0, rows - 1)
+        cx0, cx1, cy0, cy1 = (v.astype(np.intp) for v in (cx0, cx1, cy0, cy1))
+
+        # (총알, 셀) 쌍 -> (총알, 장애물) 쌍으로 펼침 (여러 셀에 걸친 장애물은 중복되지만 최솟값에는 영향 없음)
+        width = cx1 - cx0 + 1
+        cell_counts = width * (cy1 - cy0 + 1)
+        bullet = np.repeat(np.arange(len(alive)), cell_counts)
+        local = np.arange(len(bullet)) - np.repeat(np.cumsum(cell_counts) - cell_counts, cell_counts)
+        cell = (cy0[bullet] + local // width[bullet]) * cols + cx0[bullet] + local % width[bullet]
+        pair_counts = cell_start[cell + 1] - cell_start[cell]
+        pair_bullet = np.repeat(bullet, pair_counts)
+        if len(pair_bullet) == 0:
+            return hit_t
+        offset = np.arange(len(pair_bullet)) - np.repeat(np.cumsum(pair_counts) - pair_counts, pair_counts)
+        pair_obstacle = cell_items[np.repeat(cell_start[cell], pair_counts) + offset]
+
+        # 쌍별 슬랩 검사
+        pair_padding = padding[pair_bullet]
+        t_enter = np.zeros(len(pair_bullet))
+        t_exit = np.ones(len(pair_bullet))
+        for start, end, low, high in ((start_x, end_x, bounds[:, 0], bounds[:, 2]),
+                                      (start_y, end_y, bounds[:, 1], bounds[:, 3])):
+            start = start[pair_bullet]
+            delta = end[pair_bullet] - start
+            low = low[pair_obstacle] - pair_padding
+            high = high[pair_obstacle] + pair_padding
+            with np.errstate(divide='ignore', invalid='ignore'):
+                t1 = (low - start) / delta
+                t2 = (high - start) / delta
+            # 축 방향 이동이 없으면 범위 안일 때만 통과
+            still = delta == 0
+            inside = (start >= low) & (start <= high)
+            near = np.where(still, np.where(inside, -np.inf, np.inf), np.minimum(t1, t2))
+            far = np.where(still, np.where(inside, np.inf, -np.inf), np.maximum(t1, t2))
+            np.maximum(t_enter, near, out=t_enter)
+            np.minimum(t_exit, far, out=t_exit)
+
+        hit = t_enter <= t_exit
+        np.minimum.at(hit_t, pair_bullet[hit], t_enter[hit])
+        return hit_t
+
+    def _enemy_cells(self, enemies, enemy_store, cell_size):
+        """적군 위치/반지름 배열과 셀 번호 순 정렬 (적군은 총알 업데이트 중에 움직이지 않으므로 틱당 한 번)
+
+        저장소가 있으면 배열 뷰를 그대로 쓰고 없으면 목록에서 만듦 - 죽은 적군도 들어 있지만
+        배치 결과는 후보 선별용이라 정밀 스윕에서 걸러짐
+        셀은 공간 해시와 같은 크기에 월드 밖으로 한 칸까지 여유 (EnemyStore.apply_separation과 같은 방식)
+        """
+        if enemy_store is not None:
+            x, y, size = enemy_store.view('x'), enemy_store.view('y'), enemy_store.view('size')
+        else:
+            x = np.array([enemy.x for enemy in enemies], dtype=np.float64)
+            y = np.array([enemy.y for enemy in enemies], dtype=np.float64)
+            size = np.array([enemy.size for enemy in enemies], dtype=np.int32)
+
+        columns = int(WORLD_WIDTH // cell_size) + 4
+        rows = int(WORLD_HEIGHT // cell_size) + 4
+        cell = (self._cell_index(y, cell_size, rows) * columns +
+                self._cell_index(x, cell_size, columns))
+        order = np.argsort(cell, kind='stable')
+        return x, y, (size // 2).astype(np.float64), order, cell[order], (cell_size, columns, rows)
+
+    @staticmethod
+    def _cell_index(value, cell_size, count):
+        return np.clip(np.floor(value / cell_size).astype(np.intp), -1, count - 3) + 1
+
+    def _sweep_enemies_batch(self, alive, enemy_cells):
+        """총알 이동 선분 x 적군 원 교차 검사 - 총알별 가장 이른 t (닿지 않으면 inf)
+
+        브로드 페이즈: 선분을 감싸는 사각형(적군 반지름만큼 패딩)이 걸치는 셀 행마다
+        셀 번호 순으로 정렬된 적군의 해당 구간만 짝지어 검사
+        """
+        enemy_x, enemy_y, enemy_radius, order, sorted_cells, layout = enemy_cells
+        hit_t = np.full(len(alive), np.inf)
+        if len(enemy_x) == 0:
+            return hit_t
+        cell_size, columns, rows = layout
+
+        start_x, start_y = self.prev_x[alive], self.prev_y[alive]
+        end_x, end_y = self.x[alive], self.y[alive]
+        bullet_size = self.size[alive].astype(np.float64)
+        reach = bullet_size + enemy_radius.max()
+        cx0 = self._cell_index(np.minimum(start_x, end_x) - reach, cell_size, columns)
+        cx1 = self._cell_index(np.maximum(start_x, end_x) + reach, cell_size, columns)
+        cy0 = self._cell_index(np.minimum(start_y, end_y) - reach, cell_size, rows)
+        cy1 = self._cell_index(np.maximum(start_y, end_y) + reach, cell_size, rows)
+
+        # (총알, 셀 행) 하나는 정렬된 셀 번호에서 연속 구간 -> (총알, 적군) 쌍으로 펼침
+        row_counts = cy1 - cy0 + 1
+        bullet = np.repeat(np.arange(len(alive)), row_counts)
+        row = cy0[bullet] + np.arange(len(bullet)) - np.repeat(np.cumsum(row_counts) - row_counts, row_counts)
+        begin = np.searchsorted(sorted_cells, row * columns + cx0[bullet], 'left')
+        counts = np.searchsorted(sorted_cells, row * columns + cx1[bullet], 'right') - begin
+        pair_bullet = np.repeat(bullet, counts)
+        if len(pair_bullet) == 0:
+            return hit_t
+        local = np.arange(len(pair_bullet)) - np.repeat(np.cumsum(counts) - counts, counts)
+        pair_enemy = order[np.repeat(begin, counts) + local]
+
+        # 쌍별로 segment_circle_entry와 같은 근의 공식
+        pair_start_x = start_x[pair_bullet]
+        pair_start_y = start_y[pair_bullet]
+        dx = end_x[pair_bullet] - pair_start_x
+        dy = end_y[pair_bullet] - pair_start_y
+        radius = bullet_size[pair_bullet] + enemy_radius[pair_enemy]
+        fx = pair_start_x - enemy_x[pair_enemy]
+        fy = pair_start_y - enemy_y[pair_enemy]
+        c = fx * fx + fy * fy - radius * radius
+        a = dx * dx + dy * dy
+        b = 2 * (fx * dx + fy * dy)
+        discriminant = b * b - 4 * a * c
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = (-b - np.sqrt(discriminant)) / (2 * a)
+        t = np.where((discriminant >= 0) & (a > 0) & (t >= 0) & (t <= 1), t, np.inf)
+        t = np.where(c <= 0, 0.0, t)
+
+        np.minimum.at(hit_t, pair_bullet, t)
+        return hit_t
+
+    def _compact(self, keep):
+        """살아남은 총알을 배열 앞쪽으로 모음"""
+        n = self.count
+        survivors = int(np.count_nonzero(keep))
+        if survivors == n:
+            return
+        for name in ('x', 'y', 'prev_x', 'prev_y', 'vx', 'vy', 'lifetime', 'age', 'spark_timer',
+                     'damage', 'size', 'weapon_id', 'colors'):
+            array = getattr(self, name)
+            array[:survivors] = array[:n][keep]
+        self.count = survivors
+
+    def draw(self, screen, camera):
+        for i in range(self.count):
+            x, y = self.x[i], self.y[i]
+            size = int(self.size[i])
+            if not camera.is_visible(x, y, size):
+                continue
+
+            color = tuple(int(c) for c in self.colors[i])
+            is_sniper = self.WEAPON_IDS[self.weapon_id[i]] == 'SNIPER'
+            screen_x, screen_y = camera.world_to_screen(*camera.lerp_position(self.prev_x[i], self.prev_y[i],
+                                                                               x, y))
+
+            # 트레일 (직선 비행이므로 속도 역방향으로 재구성)
+            trail_length = min(12 if is_sniper else 8, int(self.age[i]))
+            for step in range(trail_length):
+                back = trail_length - 1 - step
+                alpha = int(255 * (step / trail_length) * 0.7)
+                if alpha > 0:
+                    trail_surface = surface_cache.filled(size * 2, color, alpha)
+                    screen.blit(trail_surface, (screen_x - self.vx[i] * back - size,
+                                                screen_y - self.vy[i] * back - size))
+
+            # 글로우 효과
+            glow_intensity = max(50, (255 if is_sniper else 150) - 2 * self.age[i])
+            glow_size = size * 8 if is_sniper else size * 6
+            glow_surface = surface_cache.filled(glow_size, color, int(glow_intensity) // 4)
+            screen.blit(glow_surface, (screen_x - glow_size // 2, screen_y - glow_size // 2))
+
+            # 메인 총알
+            center = (int(screen_x), int(screen_y))
+            pygame.draw.circle(screen, WHITE, center, size)
+            pygame.draw.circle(screen, color, center, size - 1)
+            if is_sniper:
+                pygame.draw.circle(screen, YELLOW, center, size - 2)
+
+    def get_bullets(self):
+        return [BulletState(float(self.x[i]), float(self.y[i]), float(self.vx[i]), float(self.vy[i]),
+                            int(self.damage[i]), tuple(int(c) for c in self.colors[i]),
+                            self.WEAPON_IDS[self.weapon_id[i]], int(self.size[i]))
+                for i in range(self.count)]
+
+    def __len__(self):
+        return self.count
+
+
+def create_bullet_manager(rng, particles=null_particles):
+    """설정(BULLET_ENGINE)에 맞는 총알 매니저 생성"""
+    if BULLET_ENGINE == 'array':
+        return ArrayBulletManager(rng, particles)
+    return BulletManager(rng, particles)
\ No newline at end of file
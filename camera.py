@@ -7,22 +7,26 @@ from utils import *
 
 
 class Camera:
-    def __init__(self):
+    def __init__(self, rng):
+        self.rng = rng  # 화면 흔들림은 rng.cosmetic
         self.x = 0
         self.y = 0
+        self.prev_x = 0   # 직전 틱의 카메라 위치 (렌더링 보간용)
+        self.prev_y = 0
+        self.view_x = 0   # 화면 변환에 쓰는 위치 (시뮬레이션 중에는 x, y와 같음)
+        self.view_y = 0
+        self.alpha = 1.0  # 렌더링 보간 비율 (1.0 = 마지막 틱 그대로)
         self.target_x = 0
         self.target_y = 0
         self.shake_x = 0
         self.shake_y = 0
         self.shake_intensity = 0
 
-    def update(self, player_pos, mouse_pos):
-        """카메라 업데이트 - 플레이어와 마우스 위치 고려"""
+    def update(self, player_pos, world_mouse_pos):
+        """카메라 업데이트 - 플레이어와 마우스 위치(월드 좌표) 고려"""
         player_x, player_y = player_pos
-
-        # 마우스 위치를 월드 좌표로 변환
-        world_mouse_x = mouse_pos[0] + self.x
-        world_mouse_y = mouse_pos[1] + self.y
+        world_mouse_x, world_mouse_y = world_mouse_pos
+        self.prev_x, self.prev_y = self.x, self.y
 
         # 플레이어와 마우스 사이의 중점 계산
         offset_x = (world_mouse_x - player_x) * CAMERA_MOUSE_INFLUENCE
@@ -43,31 +47,42 @@ class Camera:
         # 부드러운 카메라 이동
         self.x = lerp(self.x, self.target_x, CAMERA_SMOOTH)
         self.y = lerp(self.y, self.target_y, CAMERA_SMOOTH)
+        self.view_x, self.view_y = self.x, self.y
+        self.alpha = 1.0
 
         # 화면 흔들림 업데이트
         if self.shake_intensity > 0:
-            import random
-            self.shake_x = random.uniform(-self.shake_intensity, self.shake_intensity)
-            self.shake_y = random.uniform(-self.shake_intensity, self.shake_intensity)
+            self.shake_x = self.rng.cosmetic.uniform(-self.shake_intensity, self.shake_intensity)
+            self.shake_y = self.rng.cosmetic.uniform(-self.shake_intensity, self.shake_intensity)
             self.shake_intensity -= 0.5
         else:
             self.shake_x = 0
             self.shake_y = 0
 
+    def interpolate(self, alpha):
+        """렌더링용 보간 - 직전 틱과 마지막 틱 사이 alpha 지점에서 화면을 그림"""
+        self.alpha = alpha
+        self.view_x = lerp(self.prev_x, self.x, alpha)
+        self.view_y = lerp(self.prev_y, self.y, alpha)
+
+    def lerp_position(self, prev_x, prev_y, x, y):
+        """객체의 직전 틱/현재 위치를 렌더링 보간 비율로 섞음"""
+        return (lerp(prev_x, x, self.alpha), lerp(prev_y, y, self.alpha))
+
     def add_shake(self, intensity):
         """화면 흔들림 추가"""
         self.shake_intensity = max(self.shake_intensity, intensity)
 
     def world_to_screen(self, world_x, world_y):
         """월드 좌표를 스크린 좌표로 변환"""
-        screen_x = world_x - self.x + self.shake_x
-        screen_y = world_y - self.y + self.shake_y
+        screen_x = world_x - self.view_x + self.shake_x
+        screen_y = world_y - self.view_y + self.shake_y
         return (screen_x, screen_y)
 
     def screen_to_world(self, screen_x, screen_y):
         """스크린 좌표를 월드 좌표로 변환"""
-        world_x = screen_x + self.x - self.shake_x
-        world_y = screen_y + self.y - self.shake_y
+        world_x = screen_x + self.view_x - self.shake_x
+        world_y = screen_y + self.view_y - self.shake_y
         return (world_x, world_y)
 
     def is_visible(self, world_x, world_y, size=0):
@@ -81,8 +96,8 @@ class Camera:
     def get_visible_area(self):
         """현재 보이는 월드 영역 반환"""
         return {
-            'left': self.x,
-            'right': self.x + SCREEN_WIDTH,
-            'top': self.y,
-            'bottom': self.y + SCREEN_HEIGHT
+            'left': self.view_x,
+            'right': self.view_x + SCREEN_WIDTH,
+            'top': self.view_y,
+            'bottom': self.view_y + SCREEN_HEIGHT
         }
\ No newline at end of file
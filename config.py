@@ -3,7 +3,26 @@
 # 화면 설정
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
-FPS = 60
+FPS = 60                 # 렌더링 최대 프레임
+SIMULATION_TICK_RATE = 60  # 초당 시뮬레이션 틱 수 (프레임 단위 타이머는 모두 틱 단위)
+MAX_CATCH_UP_STEPS = 5     # 렌더링이 밀렸을 때 한 프레임에 따라잡는 최대 틱 수
+HEADLESS_MAX_TICKS = 60 * 60 * 10  # 헤드리스 실행에서 경기당 최대 틱 수 (10분)
+SNAPSHOT_COMPRESS_LEVEL = 6        # 시뮬레이션 스냅샷 zlib 압축 레벨
+STATE_HASH_SIZE = 8                # 상태 해시 바이트 수
+REPLAY_HASH_INTERVAL = 60          # 리플레이에 상태 해시를 기록하는 간격 (틱)
+
+# 벤치마크 설정
+BENCH_TICKS = 1200                 # 시나리오당 실행 틱 수
+BENCH_SEED = 1234                  # 시나리오 시드 (커밋 간 비교를 위해 고정)
+BENCH_OUTPUT = "bench_results.json"
+
+# 프로파일러 오버레이 (F3)
+PROFILER_HISTORY = FPS * 3       # 그래프에 남기는 프레임 수 (약 3초)
+PROFILER_COLUMN_WIDTH = 2        # 프레임 하나의 막대 폭 (픽셀)
+PROFILER_GRAPH_WIDTH = PROFILER_HISTORY * PROFILER_COLUMN_WIDTH
+PROFILER_GRAPH_HEIGHT = 100
+PROFILER_GRAPH_SCALE_MS = 33.3   # 그래프 높이에 해당하는 프레임 시간 (밀리초)
+PROFILER_LEGEND_INTERVAL = 30    # 범례 수치를 갱신하는 간격 (프레임)
 
 # 맵 설정 (훨씬 큰 월드)
 WORLD_WIDTH = 3000
@@ -73,6 +92,9 @@ WEAPON_TYPES = {
 # 총알 설정
 BULLET_SIZE = 4
 BULLET_LIFETIME = 180    # 3초
+BULLET_STEPS_PER_FRAME = 2  # 프레임당 총알이 이동하는 틱 수
+BULLET_SUBSTEPS = 1      # 프레임당 총알 업데이트 횟수 (스윕 충돌이라 1회로 충분)
+BULLET_ENGINE = "object"  # object: 총알 객체 리스트, array: NumPy 배열 저장소 (대량 발사용)
 
 # 적군 설정 (AI 강화)
 ENEMY_SIZE = 25
@@ -83,6 +105,24 @@ ENEMY_ATTACK_DAMAGE = 15 # 적군 공격 데미지
 ENEMY_ATTACK_RANGE = 35  # 공격 범위
 ENEMY_SIGHT_RANGE = 200  # 시야 범위
 ENEMY_SMART_MOVE_CHANCE = 0.3  # 30% 확률로 스마트 이동
+VISIBILITY_CELL_SIZE = 16      # 플레이어 가시성 캐시 셀 크기 (픽셀)
+ENEMY_CROWD_RADIUS = 40        # 적군끼리 밀어내는 거리
+ENEMY_GRID_CELL_SIZE = 40      # 적군 공간 해시 셀 크기 (픽셀)
+ENEMY_RASTER_RESOLUTION = 4    # 적군 이동 커널의 장애물 래스터 칸 크기 (픽셀)
+NAV_CELL_SIZE = 20             # 경로 탐색 점유 격자 셀 크기 (가장 좁은 건물 입구 25px보다 작게)
+NAV_FLOW_MAX_DISTANCE = 80     # 플로우 필드를 퍼뜨리는 최대 거리 (셀, 4방향 걸음 수)
+NAV_FLOW_LOOKAHEAD = 30        # 플로우 방향으로 잡는 이동 목표 거리 (픽셀)
+NAV_FLOW_MIN_INTERVAL = 6      # 플레이어 셀 이동으로 다시 계산하는 최소 간격 (틱, 장애물 파괴는 즉시)
+NAV_FLOW_DIRECT_RANGE = 40     # 이 거리 안에서는 플로우 없이 플레이어를 직접 추격 (픽셀)
+NAV_PATH_QUERY_BUDGET = 2      # 틱마다 처리하는 경로 요청 수 (나머지는 다음 틱으로)
+NAV_PATH_MAX_EXPANSIONS = 6000 # 격자 A* 한 번에 펼치는 최대 셀 수
+NAV_WAYPOINT_RADIUS = 12       # 웨이포인트에 도착했다고 보는 거리 (픽셀)
+NAV_PATH_WALL_PENALTY = 20     # 장애물에 붙은 셀을 지날 때 더하는 비용 (직선 한 칸 = 10)
+AI_THINK_INTERVAL = 4          # 적군 판단 주기 (틱, 버킷별로 엇갈려 실행 - 이동은 매 틱)
+AI_THINK_BUDGET = 64           # 틱당 최대 판단 수 (넘으면 다음 틱으로 미룸)
+AI_LOD_VIEW_MARGIN = 150       # 화면 밖이라도 이 여백 안의 적군은 전체 AI (픽셀)
+AI_LOD_NEAR_DISTANCE = 600     # 플레이어와 이 거리 안의 적군은 화면 밖이어도 전체 AI (픽셀)
+AI_LOD_FAR_THINK_FACTOR = 4    # 먼 적군은 판단 주기의 이 배수마다만 판단 (시야 검사 포함)
 
 # 폭발 설정
 EXPLOSION_RADIUS = 80
@@ -97,6 +137,7 @@ CAMERA_MAX_OFFSET = 150  # 최대 오프셋
 # 미니맵 설정
 MINIMAP_SIZE = 150
 MINIMAP_SCALE = 0.1      # 실제 맵 대비 축소 비율
+MINIMAP_UPDATE_INTERVAL = 6  # 미니맵 적군/체력팩 마커를 다시 그리는 간격 (프레임)
 
 # 물리 법칙 설정
 GRAVITY = 0.5
@@ -117,6 +158,8 @@ HEALTH_PACK_SIZE = 20
 # 맵 환경 설정
 MAP_THEME = "industrial"  # industrial, nature, sci-fi
 DECORATION_COUNT = 30
+STATIC_CHUNK_SIZE = 256                 # 정적 월드 레이어 청크 크기 (픽셀)
+STATIC_LAYER_COLORKEY = (255, 0, 255)   # 정적 레이어의 투명 색상 (월드 요소에 쓰지 않는 색)
 
 # 장애물 설정
 OBSTACLE_TYPES = {
@@ -125,12 +168,21 @@ OBSTACLE_TYPES = {
     'METAL': {'destructible': True, 'hp': 100, 'color': (169, 169, 169)},
     'PILLAR': {'destructible': False, 'hp': 0, 'color': (105, 105, 105)}
 }
+OBSTACLE_GRID_CELL_SIZE = 100  # 장애물 공간 인덱스 셀 크기 (픽셀)
 
 # 애니메이션 설정
 PARTICLE_COUNT_HIGH = 30
 PARTICLE_COUNT_MEDIUM = 20
 PARTICLE_COUNT_LOW = 10
+PARTICLE_POOL_SIZE = 4000             # 월드 파티클 풀 최대 개수 (이펙트 총량 조절)
+BACKGROUND_PARTICLE_POOL_SIZE = 200   # 배경 파티클 풀 최대 개수
+PARTICLE_COLOR_STEP = 16              # 색이 변하는 파티클의 색상 양자화 단계
+BACKGROUND_REFRESH_INTERVAL = 10      # 배경 그라디언트를 다시 계산하는 간격 (프레임, 1이면 매 프레임 정확히)
 SCREEN_SHAKE_INTENSITY = 5
+SURFACE_CACHE_SIZE = 512        # 반투명 서피스 캐시 최대 개수
+SURFACE_CACHE_ALPHA_STEP = 4    # 캐시 키로 쓰는 알파 양자화 단계
+TEXT_CACHE_SIZE = 256           # 렌더링된 텍스트 캐시 최대 개수
+LEVEL_UP_SCALE_STEP = 0.1       # 레벨업 텍스트 크기 단계 (단계별 폰트를 미리 생성)
 
 # UI 설정
 UI_HEIGHT = 120
\ No newline at end of file
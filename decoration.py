@@ -1,13 +1,16 @@
 # decoration.py - 맵 장식 시스템
 
 import pygame
-import random
 import math
 from config import *
+from utils import draw_rect_outline
+from surface_cache import surface_cache
+from static_layer import StaticLayer
 
 
 class Decoration:
-    def __init__(self, x, y, decoration_type):
+    def __init__(self, x, y, decoration_type, rng):
+        random = rng.cosmetic  # 크기와 조각 배치는 생성 시에만 정함
         self.x = x
         self.y = y
         self.type = decoration_type
@@ -44,12 +47,38 @@ class Decoration:
             self.color = (60, 60, 60)
             self.glow_color = None
             self.animated = False
+            # 작은 조각들 위치 (정적 레이어에 한 번만 그리므로 생성 시 고정)
+            self.pieces = [(random.randint(0, self.width - 5),
+                            random.randint(0, self.height - 5))
+                           for _ in range(3)]
 
     def update(self):
         if self.animated:
             self.animation_timer += 1
 
+    def get_static_bounds(self):
+        """정적 레이어에 그려지는 영역 (파이프 연결부 포함)"""
+        return (self.x - 2, self.y, self.x + self.width + 2, self.y + self.height + 4)
+
+    def draw_static(self, surface, x, y):
+        """움직이지 않는 부분 그리기 (정적 레이어 청크에 한 번만 그림)"""
+        if self.type == "lamp":
+            # 기둥
+            pygame.draw.rect(surface, DARK_GRAY, (x + 8, y, 4, self.height))
+        elif self.type == "pipe":
+            self._draw_pipe(surface, x, y)
+        elif self.type == "vent":
+            self._draw_vent(surface, x, y)
+        elif self.type == "machinery":
+            self._draw_machinery(surface, x, y)
+        elif self.type == "debris":
+            self._draw_debris(surface, x, y)
+
     def draw(self, screen, camera):
+        """애니메이션되는 부분만 그리기 (정적인 부분은 DecorationManager의 정적 레이어)"""
+        if not self.animated:
+            return
+
         # 화면에 보이는지 체크
         if not camera.is_visible(self.x, self.y, max(self.width, self.height)):
             return
@@ -59,19 +88,12 @@ class Decoration:
         # 타입별 그리기
         if self.type == "lamp":
             self._draw_lamp(screen, screen_x, screen_y)
-        elif self.type == "pipe":
-            self._draw_pipe(screen, screen_x, screen_y)
         elif self.type == "vent":
-            self._draw_vent(screen, screen_x, screen_y)
+            self._draw_vent_steam(screen, screen_x, screen_y)
         elif self.type == "machinery":
-            self._draw_machinery(screen, screen_x, screen_y)
-        elif self.type == "debris":
-            self._draw_debris(screen, screen_x, screen_y)
+            self._draw_machinery_led(screen, screen_x, screen_y)
 
     def _draw_lamp(self, screen, screen_x, screen_y):
-        # 기둥
-        pygame.draw.rect(screen, DARK_GRAY, (screen_x + 8, screen_y, 4, self.height))
-
         # 램프 머리
         lamp_intensity = 0.7 + 0.3 * math.sin(self.animation_timer * 0.1)
         lamp_color = tuple(int(c * lamp_intensity) for c in self.color)
@@ -80,9 +102,7 @@ class Decoration:
 
         # 글로우 효과
         if self.glow_color:
-            glow_surface = pygame.Surface((40, 40))
-            glow_surface.set_alpha(int(100 * lamp_intensity))
-            glow_surface.fill(self.glow_color)
+            glow_surface = surface_cache.filled(40, self.glow_color, 100 * lamp_intensity)
             screen.blit(glow_surface, (screen_x - 10, screen_y - 10))
 
     def _draw_pipe(self, screen, screen_x, screen_y):
@@ -91,8 +111,8 @@ class Decoration:
                          (screen_x, screen_y, self.width, self.height))
 
         # 파이프 디테일
-        pygame.draw.rect(screen, (120, 120, 120),
-                         (screen_x + 2, screen_y, self.width - 4, self.height), 2)
+        draw_rect_outline(screen, (120, 120, 120),
+                          (screen_x + 2, screen_y, self.width - 4, self.height), 2)
 
         # 연결부
         for i in range(0, self.height, 20):
@@ -111,12 +131,11 @@ class Decoration:
             pygame.draw.line(screen, BLACK,
                              (screen_x + 5, slot_y), (screen_x + self.width - 5, slot_y), 2)
 
+    def _draw_vent_steam(self, screen, screen_x, screen_y):
         # 애니메이션 효과 (증기)
         if self.animation_timer % 60 < 30:
             steam_alpha = 50
-            steam_surface = pygame.Surface((self.width - 10, 15))
-            steam_surface.set_alpha(steam_alpha)
-            steam_surface.fill(WHITE)
+            steam_surface = surface_cache.filled((self.width - 10, 15), WHITE, steam_alpha)
             screen.blit(steam_surface, (screen_x + 5, screen_y - 10))
 
     def _draw_machinery(self, screen, screen_x, screen_y):
@@ -129,6 +148,7 @@ class Decoration:
         pygame.draw.rect(screen, (40, 40, 40),
                          (screen_x + 5, screen_y + 5, panel_size, panel_size))
 
+    def _draw_machinery_led(self, screen, screen_x, screen_y):
         # LED 표시등 (깜빡임)
         if self.animation_timer % 60 < 30:
             led_color = self.glow_color
@@ -144,19 +164,23 @@ class Decoration:
                          (screen_x, screen_y, self.width, self.height))
 
         # 작은 조각들
-        for _ in range(3):
-            piece_x = screen_x + random.randint(0, self.width - 5)
-            piece_y = screen_y + random.randint(0, self.height - 5)
-            pygame.draw.rect(screen, (80, 80, 80), (piece_x, piece_y, 3, 3))
+        for piece_x, piece_y in self.pieces:
+            pygame.draw.rect(screen, (80, 80, 80), (screen_x + piece_x, screen_y + piece_y, 3, 3))
 
 
 class DecorationManager:
-    def __init__(self):
+    def __init__(self, rng):
         self.decorations = []
-        self._generate_decorations()
+        self._generate_decorations(rng)
+
+        # 움직이지 않는 부분은 청크 단위로 미리 그려둠
+        self.static_layer = StaticLayer()
+        for decoration in self.decorations:
+            self.static_layer.add(decoration)
 
-    def _generate_decorations(self):
+    def _generate_decorations(self, rng):
         """장식 요소 생성"""
+        random = rng.cosmetic
         decoration_types = ["lamp", "pipe", "vent", "machinery", "debris"]
 
         for _ in range(DECORATION_COUNT):
@@ -172,7 +196,7 @@ class DecorationManager:
                 if not (spawn_zone_x <= x <= spawn_zone_x + 600 and
                         spawn_zone_y <= y <= spawn_zone_y + 600):
                     decoration_type = random.choice(decoration_types)
-                    decoration = Decoration(x, y, decoration_type)
+                    decoration = Decoration(x, y, decoration_type, rng)
                     self.decorations.append(decoration)
                     break
 
@@ -183,5 +207,6 @@ class DecorationManager:
             decoration.update()
 
     def draw(self, screen, camera):
+        self.static_layer.draw(screen, camera)
         for decoration in self.decorations:
             decoration.draw(screen, camera)
\ No newline at end of file
@@ -2,143 +2,93 @@
 
 import pygame
 import math
-import random
+import numpy as np
 from config import *
+from particles import ParticleSystem
+
+
+class BackgroundRenderer:
+    """웨이브 그라디언트 배경을 1픽셀 폭 세로줄로 계산해 늘려 그린 뒤 캐시"""
+
+    def __init__(self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT - UI_HEIGHT,
+                 refresh_interval=BACKGROUND_REFRESH_INTERVAL):
+        self.width = width
+        self.height = height
+        self.refresh_interval = refresh_interval
+        self.rows = np.arange(height)
+        self.column = pygame.Surface((1, height))
+        self.surface = pygame.Surface((width, height))
+        self.rendered_time = None
+
+    def _render(self, time):
+        # 더 부드러운 웨이브 효과 (줄마다 색만 다르므로 세로줄 하나만 계산)
+        wave1 = np.sin(time * 0.005 + self.rows * 0.002) * 15
+        wave2 = np.cos(time * 0.008 + self.rows * 0.001) * 10
+
+        # 더 어두운 베이스 색상
+        colors = np.empty((1, self.height, 3), dtype=np.int32)
+        colors[0, :, 0] = 8 + wave1.astype(np.int32)
+        colors[0, :, 1] = 12 + wave2.astype(np.int32)
+        colors[0, :, 2] = 30 + (wave1 + wave2).astype(np.int32)
+        pygame.surfarray.blit_array(self.column, np.clip(colors, 0, 255))
+
+        pygame.transform.scale(self.column, (self.width, self.height), self.surface)
+        self.rendered_time = time
+
+    def draw(self, screen, time):
+        # 웨이브가 매우 느리게 변하므로 몇 프레임마다 한 번만 다시 계산
+        # (다시 계산한 프레임만 줄별 계산과 같고, 그 사이 프레임은 채널당 최대 2 단계 차이)
+        if self.rendered_time is None or abs(time - self.rendered_time) >= self.refresh_interval:
+            self._render(time)
+        screen.blit(self.surface, (0, 0))
 
 
 class VisualEffects:
-    def __init__(self):
-        self.particles = []
+    def __init__(self, rng):
         self.time = 0
-        self.floating_particles = []
+        self.rng = rng
+        # 화면 좌표 배경 파티클 (별, 떠다니는 먼지) - 월드 파티클과 같은 엔진, 별도 풀
+        self.particles = ParticleSystem(BACKGROUND_PARTICLE_POOL_SIZE, rng)
+        self.background = BackgroundRenderer()
 
     def update(self):
         self.time += 1
 
+        random = self.rng.cosmetic
+
         # 배경 파티클 생성 (더 적게, 더 자연스럽게)
         if self.time % 40 == 0:  # 생성 빈도 감소
-            self.particles.append({
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(0, SCREEN_HEIGHT - UI_HEIGHT),
-                'life': 300,  # 더 긴 수명
-                'max_life': 300,
-                'size': random.randint(1, 3),
-                'speed': random.uniform(0.2, 0.8),  # 더 느린 속도
-                'direction': random.uniform(0, 2 * math.pi),
-                'twinkle': random.randint(0, 60)
-            })
-
-        # 떠다니는 파티클 생성
+            direction = random.uniform(0, 2 * math.pi)
+            speed = random.uniform(0.2, 0.8)  # 더 느린 속도
+            self.particles.emit(random.randint(0, SCREEN_WIDTH),
+                                random.randint(0, SCREEN_HEIGHT - UI_HEIGHT),
+                                math.cos(direction) * speed, math.sin(direction) * speed,
+                                300, random.randint(1, 3), WHITE,  # 더 긴 수명
+                                end_color=BLUE, alpha_scale=0.6, twinkle=random.randint(0, 60))
+
+        # 떠다니는 파티클 생성 (생명에 따라 어두워짐)
         if self.time % 80 == 0:
-            self.floating_particles.append({
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': SCREEN_HEIGHT - UI_HEIGHT,
-                'vx': random.uniform(-0.5, 0.5),
-                'vy': random.uniform(-1, -0.3),
-                'life': 400,
-                'max_life': 400,
-                'size': random.randint(2, 5)
-            })
+            self.particles.emit(random.randint(0, SCREEN_WIDTH), SCREEN_HEIGHT - UI_HEIGHT,
+                                random.uniform(-0.5, 0.5), random.uniform(-1, -0.3),
+                                400, random.randint(2, 5), (100, 150, 255),
+                                gravity=-0.01, end_color=BLACK, alpha_scale=0.4)
 
         # 파티클 업데이트
-        self._update_particles()
-        self._update_floating_particles()
-
-    def _update_particles(self):
-        self.particles = [p for p in self.particles if p['life'] > 0]
-        for particle in self.particles:
-            particle['life'] -= 1
-            particle['x'] += math.cos(particle['direction']) * particle['speed']
-            particle['y'] += math.sin(particle['direction']) * particle['speed']
-            particle['twinkle'] = (particle['twinkle'] + 1) % 120
-
-    def _update_floating_particles(self):
-        self.floating_particles = [p for p in self.floating_particles if p['life'] > 0]
-        for particle in self.floating_particles:
-            particle['life'] -= 1
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['vy'] -= 0.01  # 중력 효과
+        self.particles.update()
 
     def draw_background_effect(self, screen):
-        # 부드러운 그라디언트 배경 (그리드 라인 제거)
-        for y in range(SCREEN_HEIGHT - UI_HEIGHT):
-            # 더 부드러운 웨이브 효과
-            wave1 = math.sin(self.time * 0.005 + y * 0.002) * 15
-            wave2 = math.cos(self.time * 0.008 + y * 0.001) * 10
-
-            # 더 어두운 베이스 색상
-            base_r = 8 + int(wave1)
-            base_g = 12 + int(wave2)
-            base_b = 30 + int(wave1 + wave2)
-
-            color = (max(0, min(255, base_r)),
-                     max(0, min(255, base_g)),
-                     max(0, min(255, base_b)))
-            pygame.draw.line(screen, color, (0, y), (SCREEN_WIDTH, y))
-
-        # 배경 파티클 (별처럼 반짝이는 효과)
-        self._draw_background_particles(screen)
-
-        # 떠다니는 파티클
-        self._draw_floating_particles(screen)
-
-    def _draw_background_particles(self, screen):
-        for particle in self.particles:
-            alpha_base = int(255 * (particle['life'] / particle['max_life']) * 0.6)
-
-            # 깜빡이는 효과
-            twinkle_alpha = math.sin(particle['twinkle'] * 0.1) * 0.5 + 0.5
-            alpha = int(alpha_base * twinkle_alpha)
-
-            if alpha > 0:
-                # 다양한 색상의 파티클
-                life_ratio = particle['life'] / particle['max_life']
-                if life_ratio > 0.7:
-                    color = WHITE
-                elif life_ratio > 0.4:
-                    color = CYAN
-                else:
-                    color = BLUE
-
-                particle_surface = pygame.Surface((particle['size'] * 2, particle['size'] * 2))
-                particle_surface.set_alpha(alpha)
-                particle_surface.fill(color)
-                screen.blit(particle_surface, (particle['x'] - particle['size'],
-                                               particle['y'] - particle['size']))
-
-    def _draw_floating_particles(self, screen):
-        for particle in self.floating_particles:
-            alpha = int(255 * (particle['life'] / particle['max_life']) * 0.4)
-            if alpha > 0:
-                # 위로 떠오르는 파티클 (먼지나 에너지 효과)
-                particle_surface = pygame.Surface((particle['size'] * 2, particle['size'] * 2))
-                particle_surface.set_alpha(alpha)
-
-                # 생명에 따른 색상 변화
-                life_ratio = particle['life'] / particle['max_life']
-                color_r = int(100 * life_ratio)
-                color_g = int(150 * life_ratio)
-                color_b = int(255 * life_ratio)
-
-                particle_surface.fill((color_r, color_g, color_b))
-                screen.blit(particle_surface, (particle['x'] - particle['size'],
-                                               particle['y'] - particle['size']))
+        # 부드러운 그라디언트 배경 (미리 그려둔 서피스를 한 번에 복사)
+        self.background.draw(screen, self.time)
+
+        # 배경 파티클 (반짝이는 별, 떠다니는 먼지)
+        self.particles.draw(screen)
 
     def add_impact_effect(self, x, y, color=WHITE, intensity=1.0):
         """충격 효과 추가 (폭발이나 충돌 시 사용)"""
         count = int(10 * intensity)
+        random = self.rng.cosmetic
         for _ in range(count):
             angle = random.uniform(0, 2 * math.pi)
             speed = random.uniform(2, 6) * intensity
-            self.particles.append({
-                'x': x,
-                'y': y,
-                'life': 60,
-                'max_life': 60,
-                'size': random.randint(2, 4),
-                'speed': speed,
-                'direction': angle,
-                'twinkle': 0,
-                'color': color
-            })
\ No newline at end of file
+            self.particles.emit(x, y, math.cos(angle) * speed, math.sin(angle) * speed,
+                                60, random.randint(2, 4), color)
\ No newline at end of file
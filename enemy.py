@@ -2,22 +2,64 @@
 
 import pygame
 import math
-import random
+import numpy as np
 from config import *
 from utils import *
+from visibility import VisibilityMap
+from navigation import NavGrid, FlowField, ObstacleRaster
+from pathfinding import PathService
+from ai_scheduler import AIScheduler
+from enemy_store import EnemyStore, array_field
+from spatial import SpatialGrid
+from particles import null_particles
+from surface_cache import surface_cache
 
 
 class Enemy:
-    def __init__(self, x, y):
+    """적군 하나 - 이동 관련 필드는 EnemyStore 배열의 뷰 (EnemyManager가 배열로 한꺼번에 이동)"""
+
+    x = array_field('x')
+    y = array_field('y')
+    prev_x = array_field('prev_x')
+    prev_y = array_field('prev_y')
+    target_x = array_field('target_x')
+    target_y = array_field('target_y')
+    last_x = array_field('last_x')  # 스택 검사용 직전 위치
+    last_y = array_field('last_y')
+    speed = array_field('speed')
+    aggression_level = array_field('aggression_level')
+    size = array_field('size')
+    stuck_timer = array_field('stuck_timer')
+    attack_cooldown = array_field('attack_cooldown')
+    dodge_timer = array_field('dodge_timer')
+    search_timer = array_field('search_timer')
+    smart_move_timer = array_field('smart_move_timer')
+    patrol_timer = array_field('patrol_timer')
+    navigating = array_field('navigating')
+    separating = array_field('separating')
+    full_detail = array_field('full_detail')
+
+    def __init__(self, x, y, rng, store=None, particles=null_particles):
+        # 이동 필드는 store(보통 EnemyManager.store) 배열에 바로 기록
+        # store 없이 만들면 add_enemy로 등록될 때까지 _fields에 보관
+        self.rng = rng  # AI 판단은 rng.gameplay, 공격 파티클은 rng.cosmetic
+        self.particles = particles
+        self._store = None
+        self._slot = None
+        self._fields = {}
+        if store is not None:
+            store.attach(self)
         self.x = x
         self.y = y
+        self.prev_x = x  # 직전 틱 위치 (렌더링 보간용)
+        self.prev_y = y
         self.size = ENEMY_SIZE
         self.speed = ENEMY_SPEED
         self.hp = ENEMY_HP
         self.max_hp = ENEMY_HP
         self.target_x = x
         self.target_y = y
-        self.state = "patrol"  # patrol, chase, attack, smart_move
+        self.state = "patrol"  # patrol, chase, attack, smart_move, search
         self.chase_range = ENEMY_SIGHT_RANGE
         self.attack_range = ENEMY_ATTACK_RANGE
         self.patrol_timer = 0
@@ -31,14 +73,20 @@ class Enemy:
         self.search_timer = 0
         self.dodge_timer = 0
         self.stuck_timer = 0
-        self.last_position = (x, y)
+        self.last_x = x
+        self.last_y = y
+        self.navigating = False  # 플로우 필드나 경로를 따라 이동 중 (벽에 막혀도 랜덤 탈출 안 함)
+        self.path_request = None  # 처리를 기다리는 경로 요청
+        self.waypoints = []       # 따라가는 경로의 남은 웨이포인트
+        self.ai_bucket = 0        # 판단 버킷 (AIScheduler가 배정)
+        self.ai_phase = 0
+        self.full_detail = True   # 화면이나 플레이어 근처 - False면 간소화 업데이트 (EnemyManager가 갱신)
         self.smart_move_timer = 0
-        self.aggression_level = random.uniform(0.5, 1.5)  # 개체별 공격성
+        self.aggression_level = rng.gameplay.uniform(0.5, 1.5)  # 개체별 공격성
 
         # 공격 시스템
         self.can_attack = True
         self.attack_damage = ENEMY_ATTACK_DAMAGE
-        self.attack_particles = []
 
         # 레벨 스케일링
         self.level_multiplier = 1.0
@@ -63,109 +111,155 @@ class Enemy:
         # 공격성 증가
         self.aggression_level = min(2.0, self.aggression_level * self.level_multiplier)
 
-    def update(self, player_pos, other_enemies, camera, obstacle_manager):
+    def update(self, player_pos, camera, obstacle_manager, visibility, flow_field, path_service, think=True):
+        """판단 한 틱 - think가 False인 틱에는 판단 없이 지난 목표를 유지
+
+        이동, 월드 경계, 쿨다운, 스택 검사는 EnemyManager가 EnemyStore 배열로 한꺼번에 처리
+        full_detail이 False인 먼 적군은 군집 회피와 파티클 생략
+        """
         if self.is_dead:
             self.death_animation += 1
+            self._clear_path()
             return
 
+        if think:
+            self._think(player_pos, obstacle_manager, visibility, flow_field, path_service)
+        elif self.waypoints or self.path_request is not None:
+            # 판단하지 않는 틱에도 경로의 웨이포인트는 따라감
+            self._follow_path()
+
+    def _think(self, player_pos, obstacle_manager, visibility, flow_field, path_service):
+        """상태 결정과 상태별 이동 목표 설정 (AIScheduler가 정한 틱에만)"""
         player_x, player_y = player_pos
         distance_to_player = distance((self.x, self.y), (player_x, player_y))
 
         # AI 상태 결정 (향상된 로직)
-        self._update_ai_state(player_pos, distance_to_player, other_enemies, obstacle_manager)
+        self._update_ai_state(player_pos, distance_to_player, visibility, path_service)
 
         # 상태별 행동
+        self.navigating = False
         if self.state == "patrol":
-            self._patrol()
+            self._patrol(path_service)
+        elif self.state == "search":
+            self._search()
         elif self.state == "chase":
-            self._chase(player_x, player_y, other_enemies, obstacle_manager)
+            self._chase(player_x, player_y, distance_to_player, flow_field)
         elif self.state == "attack":
             self._attack(player_pos)
         elif self.state == "smart_move":
-            self._smart_move(player_x, player_y, other_enemies, obstacle_manager)
-
-        # 이동 실행 (장애물 고려)
-        self._move_towards_target(obstacle_manager)
-
-        # 월드 경계 체크
-        self._check_boundaries()
-
-        # 트레일 업데이트
-        self._update_trail()
+            self._smart_move(player_x, player_y)
 
-        # 쿨다운 업데이트
-        if self.attack_cooldown > 0:
-            self.attack_cooldown -= 1
-        if self.dodge_timer > 0:
-            self.dodge_timer -= 1
-        if self.search_timer > 0:
-            self.search_timer -= 1
-        if self.smart_move_timer > 0:
-            self.smart_move_timer -= 1
-
-        # 공격 파티클 업데이트
-        self._update_attack_particles()
-
-        # 스택 체크
-        self._check_stuck()
-
-    def _update_ai_state(self, player_pos, distance_to_player, other_enemies, obstacle_manager):
+    def _update_ai_state(self, player_pos, distance_to_player, visibility, path_service):
         """향상된 AI 상태 결정"""
-        player_x, player_y = player_pos
-
-        # 플레이어가 시야 내에 있고 장애물에 가리지 않았는가?
+        # 플레이어가 시야 내에 있고 장애물에 가리지 않았는가? (프레임 공유 가시성 캐시)
         can_see_player = (distance_to_player <= self.chase_range and
-                          not obstacle_manager.check_line_collision(self.x, self.y, player_x, player_y))
+                          visibility.can_see_player(self.x, self.y))
 
         if can_see_player:
             self.last_player_pos = player_pos
             self.search_timer = 120  # 2초간 기억
+            self._clear_path()
 
             if distance_to_player <= self.attack_range:
                 self.state = "attack"
             else:
                 # 스마트 이동 확률 체크
-                if (random.random() < ENEMY_SMART_MOVE_CHANCE * self.aggression_level and
+                if (self.rng.gameplay.random() < ENEMY_SMART_MOVE_CHANCE * self.aggression_level and
                         self.smart_move_timer <= 0):
                     self.state = "smart_move"
                     self.smart_move_timer = 60
                 else:
                     self.state = "chase"
         elif self.search_timer > 0 and self.last_player_pos:
-            # 마지막 위치로 이동
-            self.state = "chase"
-            player_x, player_y = self.last_player_pos
+            # 마지막으로 본 위치로 이동 (벽 너머일 수 있으므로 경로를 요청)
+            if self.state != "search":
+                self.state = "search"
+                self._request_path(path_service, *self.last_player_pos)
         else:
+            if self.state != "patrol":
+                self._clear_path()
             self.state = "patrol"
             self.last_player_pos = None
 
-    def _patrol(self):
-        """순찰 행동"""
-        self.patrol_timer += 1
-        if self.patrol_timer >= 180:  # 3초마다 새로운 목표
+    def _patrol(self, path_service):
+        """순찰 행동 - 현재 구역이나 이웃 구역의 지점까지 경로를 따라 이동"""
+        if self.patrol_timer >= 180 and self.path_request is None and not self.waypoints:
+            # 3초마다 새로운 목표 (경로를 따라가는 중이면 도착한 뒤에)
             self.patrol_timer = 0
-            # 현재 위치 근처로 랜덤 이동
-            angle = random.uniform(0, 2 * math.pi)
-            distance_patrol = random.uniform(50, 120)
-            self.target_x = self.x + math.cos(angle) * distance_patrol
-            self.target_y = self.y + math.sin(angle) * distance_patrol
-
-    def _chase(self, player_x, player_y, other_enemies, obstacle_manager):
-        """추격 행동 (향상된)"""
-        # 기본 추격
-        self.target_x = player_x
-        self.target_y = player_y
+            goal = path_service.patrol_point(self.x, self.y, self.rng.gameplay)
+            if goal is not None:
+                self._request_path(path_service, *goal)
+            else:
+                # 현재 위치 근처로 랜덤 이동
+                angle = self.rng.gameplay.uniform(0, 2 * math.pi)
+                distance_patrol = self.rng.gameplay.uniform(50, 120)
+                self.target_x = self.x + math.cos(angle) * distance_patrol
+                self.target_y = self.y + math.sin(angle) * distance_patrol
+
+        self._follow_path()
+
+    def _search(self):
+        """수색 행동 - 마지막으로 본 위치까지 경로를 따라 이동 (경로가 오기 전에는 직접)"""
+        if not self._follow_path():
+            self.target_x, self.target_y = self.last_player_pos
+            self.separating = self.full_detail
+
+    def _request_path(self, path_service, goal_x, goal_y):
+        """경로 요청 (이전 요청과 경로는 버림) - 결과는 이후 틱에 _follow_path가 받음"""
+        self._clear_path()
+        self.path_request = path_service.request(self.x, self.y, goal_x, goal_y)
+
+    def _clear_path(self):
+        if self.path_request is not None:
+            self.path_request.cancel()
+            self.path_request = None
+        self.waypoints = []
+
+    def _follow_path(self):
+        """남은 웨이포인트 중 다음 지점을 이동 목표로 - 따라갈 경로가 없으면 False"""
+        request = self.path_request
+        if request is not None and request.done:
+            self.path_request = None
+            self.waypoints = request.waypoints or []
+
+        waypoints = self.waypoints
+        radius_sq = NAV_WAYPOINT_RADIUS ** 2
+        while waypoints and (waypoints[0][0] - self.x) ** 2 + (waypoints[0][1] - self.y) ** 2 < radius_sq:
+            waypoints.pop(0)
+        if not waypoints:
+            return False
+
+        self.target_x, self.target_y = waypoints[0]
+        self.navigating = True
+        return True
+
+    def _chase(self, player_x, player_y, distance_to_player, flow_field):
+        """추격 행동 - 플로우 필드가 가리키는 방향으로 장애물을 돌아서 접근"""
+        direction = None
+        if distance_to_player > NAV_FLOW_DIRECT_RANGE:
+            direction = flow_field.direction(self.x, self.y)
+
+        if direction is not None:
+            # 플레이어까지 거리만큼 앞을 목표로 잡아 군집 회피와의 비중은 직접 추격과 같게
+            lookahead = max(NAV_FLOW_LOOKAHEAD, distance_to_player)
+            self.target_x = self.x + direction[0] * lookahead
+            self.target_y = self.y + direction[1] * lookahead
+            self.navigating = True
+        else:
+            # 가까이 붙었거나 플로우가 닿지 않는 곳이면 직접 추격
+            self.target_x = player_x
+            self.target_y = player_y
 
-        # 다른 적군과 겹치지 않도록 회피
-        self._avoid_crowding(other_enemies)
+        # 다른 적군과 겹치지 않도록 회피 (먼 적군은 생략, 이동 전에 EnemyStore가 일괄 처리)
+        self.separating = self.full_detail
 
-    def _smart_move(self, player_x, player_y, other_enemies, obstacle_manager):
+    def _smart_move(self, player_x, player_y):
         """스마트 이동 (측면 공격, 포위 등)"""
         # 플레이어 주변으로 측면 이동
         angle_to_player = math.atan2(player_y - self.y, player_x - self.x)
 
         # 좌우 중 하나를 선택해서 측면 공격
-        side_offset = math.pi / 2 if random.random() > 0.5 else -math.pi / 2
+        side_offset = math.pi / 2 if self.rng.gameplay.random() > 0.5 else -math.pi / 2
         flank_angle = angle_to_player + side_offset
 
         flank_distance = 60
@@ -173,21 +267,7 @@ class Enemy:
         self.target_y = player_y + math.sin(flank_angle) * flank_distance
 
         # 다른 적군과 겹치지 않도록
-        self._avoid_crowding(other_enemies)
-
-    def _avoid_crowding(self, other_enemies):
-        """다른 적군과 겹치지 않도록 회피"""
-        for other in other_enemies:
-            if other != self and not other.is_dead:
-                dist = distance((self.x, self.y), (other.x, other.y))
-                if dist < 40:  # 너무 가까우면
-                    # 반대 방향으로 이동
-                    away_x = self.x - other.x
-                    away_y = self.y - other.y
-                    away_dist = math.sqrt(away_x ** 2 + away_y ** 2)
-                    if away_dist > 0:
-                        self.target_x += (away_x / away_dist) * 30
-                        self.target_y += (away_y / away_dist) * 30
+        self.separating = True
 
     def _attack(self, player_pos):
         """공격 행동"""
@@ -197,9 +277,10 @@ class Enemy:
         self.target_x = player_x
         self.target_y = player_y
 
-        # 공격 실행
+        # 공격 실행 (먼 적군은 파티클 생략)
         if self.attack_cooldown == 0 and self.can_attack:
-            self._execute_attack(player_pos)
+            if self.full_detail:
+                self._execute_attack(player_pos)
             self.attack_cooldown = 90  # 1.5초 쿨다운
 
     def _execute_attack(self, player_pos):
@@ -207,41 +288,23 @@ class Enemy:
         player_x, player_y = player_pos
 
         # 공격 파티클 생성
+        random = self.rng.cosmetic
         for _ in range(8):
             angle = math.atan2(player_y - self.y, player_x - self.x)
             angle += random.uniform(-0.3, 0.3)
             speed = random.uniform(3, 6)
 
-            self.attack_particles.append({
-                'x': self.x,
-                'y': self.y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'life': 20,
-                'max_life': 20,
-                'size': random.uniform(2, 4)
-            })
-
-    def _move_towards_target(self, obstacle_manager):
-        """목표를 향해 이동 (장애물 회피)"""
-        dx = self.target_x - self.x
-        dy = self.target_y - self.y
-        distance_to_target = math.sqrt(dx ** 2 + dy ** 2)
-
-        if distance_to_target > 8:  # 목표에 충분히 가까우면 멈춤
-            # 정규화된 방향 벡터
-            move_x = (dx / distance_to_target) * self.speed * self.aggression_level
-            move_y = (dy / distance_to_target) * self.speed * self.aggression_level
-
-            new_x = self.x + move_x
-            new_y = self.y + move_y
-
-            # 장애물 충돌 체크
-            if not obstacle_manager.check_collision_circle(new_x, new_y, self.size // 2):
-                self.x, self.y = new_x, new_y
-            else:
-                # 장애물 회피 시도
-                self._try_obstacle_avoidance(obstacle_manager, move_x, move_y)
+            self.particles.emit(self.x, self.y, math.cos(angle) * speed, math.sin(angle) * speed,
+                                20, random.uniform(2, 4), RED, drag=0.95)
+
+    def _resolve_blocked_move(self, obstacle_manager, move_x, move_y):
+        """이동 커널의 래스터가 막혔다고 한 이동 - 정밀 충돌 검사 후 안 되면 장애물 회피"""
+        new_x = self.x + move_x
+        new_y = self.y + move_y
+        if not obstacle_manager.check_collision_circle(new_x, new_y, self.size // 2):
+            self.x, self.y = new_x, new_y
+        else:
+            self._try_obstacle_avoidance(obstacle_manager, move_x, move_y)
 
     def _try_obstacle_avoidance(self, obstacle_manager, move_x, move_y):
         """장애물 회피 시도"""
@@ -267,48 +330,11 @@ class Enemy:
                 self.x, self.y = avoid_x, avoid_y
                 break
 
-    def _check_boundaries(self):
-        self.x = clamp(self.x, self.size // 2, WORLD_WIDTH - self.size // 2)
-        self.y = clamp(self.y, self.size // 2, WORLD_HEIGHT - self.size // 2)
-
-        # 경계에 닿으면 목표 위치 재설정
-        if (self.x <= self.size // 2 or self.x >= WORLD_WIDTH - self.size // 2 or
-                self.y <= self.size // 2 or self.y >= WORLD_HEIGHT - self.size // 2):
-            self.target_x = WORLD_WIDTH // 2
-            self.target_y = WORLD_HEIGHT // 2
-
-    def _check_stuck(self):
-        """스택 체크 및 해결"""
-        current_pos = (self.x, self.y)
-        if distance(current_pos, self.last_position) < 2:
-            self.stuck_timer += 1
-            if self.stuck_timer > 60:  # 1초 이상 스택
-                # 랜덤 방향으로 이동
-                angle = random.uniform(0, 2 * math.pi)
-                self.target_x = self.x + math.cos(angle) * 50
-                self.target_y = self.y + math.sin(angle) * 50
-                self.stuck_timer = 0
-        else:
-            self.stuck_timer = 0
-
-        self.last_position = current_pos
-
-    def _update_trail(self):
-        self.trail.append((self.x, self.y))
-        if len(self.trail) > 10:
-            self.trail.pop(0)
-
-    def _update_attack_particles(self):
-        """공격 파티클 업데이트"""
-        for particle in self.attack_particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['life'] -= 1
-            particle['vx'] *= 0.95
-            particle['vy'] *= 0.95
-
-            if particle['life'] <= 0:
-                self.attack_particles.remove(particle)
+    def _escape_stuck(self):
+        """오래 막혀 있던 적군 - 랜덤 방향으로 이동 목표"""
+        angle = self.rng.gameplay.uniform(0, 2 * math.pi)
+        self.target_x = self.x + math.cos(angle) * 50
+        self.target_y = self.y + math.sin(angle) * 50
 
     def take_damage(self, damage):
         self.hp -= damage
@@ -320,19 +346,18 @@ class Enemy:
                 self.aggression_level = min(2.0, self.aggression_level + 0.3)
 
     def draw(self, screen, camera):
+        x, y, size = self.x, self.y, self.size  # 배열 필드는 한 번씩만 읽음
+
         # 화면에 보이는지 체크
-        if not camera.is_visible(self.x, self.y, self.size):
+        if not camera.is_visible(x, y, size):
             return
 
-        screen_x, screen_y = camera.world_to_screen(self.x, self.y)
+        screen_x, screen_y = camera.world_to_screen(*camera.lerp_position(self.prev_x, self.prev_y, x, y))
 
         if self.is_dead:
             self._draw_death_effect(screen, screen_x, screen_y)
             return
 
-        # 공격 파티클 그리기
-        self._draw_attack_particles(screen, camera)
-
         # 트레일 그리기
         for i, (trail_x, trail_y) in enumerate(self.trail):
             if camera.is_visible(trail_x, trail_y):
@@ -340,63 +365,44 @@ class Enemy:
                 alpha = int(255 * (i / len(self.trail)) * 0.4)
                 trail_color = RED  # 빨간색으로 통일
 
-                trail_surface = pygame.Surface((self.size, self.size))
-                trail_surface.set_alpha(alpha)
-                trail_surface.fill(trail_color)
-                screen.blit(trail_surface, (trail_screen_x - self.size // 2,
-                                            trail_screen_y - self.size // 2))
+                trail_surface = surface_cache.filled(size, trail_color, alpha)
+                screen.blit(trail_surface, (trail_screen_x - size // 2,
+                                            trail_screen_y - size // 2))
 
         # 그림자
         shadow_offset = 3
         pygame.draw.rect(screen, (50, 50, 50),
-                         (screen_x - self.size // 2 + shadow_offset,
-                          screen_y - self.size // 2 + shadow_offset,
-                          self.size, self.size))
+                         (screen_x - size // 2 + shadow_offset,
+                          screen_y - size // 2 + shadow_offset,
+                          size, size))
 
         # 상태별 글로우 효과
         if self.state == "attack":
-            glow_surface = pygame.Surface((self.size + 15, self.size + 15))
-            glow_surface.set_alpha(120)
-            glow_surface.fill(RED)
-            screen.blit(glow_surface, (screen_x - self.size // 2 - 7,
-                                       screen_y - self.size // 2 - 7))
+            glow_surface = surface_cache.filled(size + 15, RED, 120)
+            screen.blit(glow_surface, (screen_x - size // 2 - 7,
+                                       screen_y - size // 2 - 7))
         elif self.state == "smart_move":
-            glow_surface = pygame.Surface((self.size + 10, self.size + 10))
-            glow_surface.set_alpha(80)
-            glow_surface.fill(ORANGE)
-            screen.blit(glow_surface, (screen_x - self.size // 2 - 5,
-                                       screen_y - self.size // 2 - 5))
+            glow_surface = surface_cache.filled(size + 10, ORANGE, 80)
+            screen.blit(glow_surface, (screen_x - size // 2 - 5,
+                                       screen_y - size // 2 - 5))
 
         # 메인 적군 - 항상 빨간 네모
         pygame.draw.rect(screen, RED,
-                         (screen_x - self.size // 2,
-                          screen_y - self.size // 2,
-                          self.size, self.size))
+                         (screen_x - size // 2,
+                          screen_y - size // 2,
+                          size, size))
 
         # 공격성 레벨에 따른 테두리
         border_thickness = int(self.aggression_level * 2)
         if border_thickness > 1:
             pygame.draw.rect(screen, DARK_RED,
-                             (screen_x - self.size // 2,
-                              screen_y - self.size // 2,
-                              self.size, self.size), border_thickness)
+                             (screen_x - size // 2,
+                              screen_y - size // 2,
+                              size, size), border_thickness)
 
         # HP 바 그리기
         self._draw_hp_bar(screen, screen_x, screen_y)
 
-    def _draw_attack_particles(self, screen, camera):
-        """공격 파티클 그리기"""
-        for particle in self.attack_particles:
-            if camera.is_visible(particle['x'], particle['y']):
-                screen_x, screen_y = camera.world_to_screen(particle['x'], particle['y'])
-                alpha = int(255 * (particle['life'] / particle['max_life']))
-                if alpha > 0:
-                    particle_surface = pygame.Surface((int(particle['size'] * 2), int(particle['size'] * 2)))
-                    particle_surface.set_alpha(alpha)
-                    particle_surface.fill(RED)
-                    screen.blit(particle_surface, (screen_x - particle['size'],
-                                                   screen_y - particle['size']))
-
     def _draw_hp_bar(self, screen, screen_x, screen_y):
         if self.hp < self.max_hp:  # HP가 풀이 아닐 때만 표시
             bar_width = self.size
@@ -418,10 +424,7 @@ class Enemy:
         size_multiplier = 1 + (self.death_animation * 0.1)
 
         if alpha > 0:
-            death_surface = pygame.Surface((int(self.size * size_multiplier),
-                                            int(self.size * size_multiplier)))
-            death_surface.set_alpha(alpha)
-            death_surface.fill(DARK_RED)
+            death_surface = surface_cache.filled(int(self.size * size_multiplier), DARK_RED, alpha)
 
             screen.blit(death_surface,
                         (screen_x - (self.size * size_multiplier) // 2,
@@ -429,10 +432,20 @@ class Enemy:
 
 
 class EnemyManager:
-    def __init__(self):
+    def __init__(self, rng, particles=null_particles):
+        self.rng = rng
+        self.particles = particles
         self.enemies = []
         self.spawn_timer = 0
         self.max_enemies = 8  # 더 많은 적군
+        self.visibility = VisibilityMap()
+        self.nav_grid = NavGrid()  # 장애물 점유 격자
+        self.flow_field = FlowField(self.nav_grid)  # 플레이어를 향한 공유 플로우 필드
+        self.path_service = PathService(self.nav_grid)  # 순찰/수색 경로 (요청은 틱마다 예산만큼 처리)
+        self.scheduler = AIScheduler()  # 적군 판단 시분할
+        self.store = EnemyStore(64)  # 등록된 적군의 이동 상태 배열 (Enemy 객체는 뷰)
+        self.obstacle_raster = ObstacleRaster()  # 이동 커널용 장애물 래스터
+        self.enemy_grid = SpatialGrid(ENEMY_GRID_CELL_SIZE)  # 살아있는 적군 공간 해시
 
     def update(self, player_pos, camera, obstacle_manager, level_system):
         # 적군 스폰 (레벨에 따른 조정)
@@ -447,19 +460,84 @@ class EnemyManager:
             self._spawn_enemy_outside_view(camera, obstacle_manager, level_system.level)
             self.spawn_timer = 0
 
-        # 적군 업데이트
-        for enemy in self.enemies[:]:
-            enemy.update(player_pos, alive_enemies, camera, obstacle_manager)
+        # 플레이어 가시성은 프레임당 한 번만 갱신 (모든 적군이 공유)
+        self.visibility.update(player_pos, obstacle_manager)
+
+        # 플로우 필드는 플레이어가 다른 셀로 옮기거나 장애물이 부서졌을 때만 다시 계산
+        self.nav_grid.update(obstacle_manager)
+        self.flow_field.update(*player_pos)
+        self.path_service.update(obstacle_manager)
+
+        # 적군 판단 (이번 차례 버킷만)
+        self.obstacle_raster.update(obstacle_manager)
+        self.store.begin_tick()
+        self._update_detail_levels(player_pos, camera)
+        thinking = self.scheduler.schedule(self.enemies)
+        for enemy in self.enemies:
+            enemy.update(player_pos, camera, obstacle_manager, self.visibility,
+                         self.flow_field, self.path_service, enemy in thinking)
+
+        # 이동은 모든 적군을 배열로 한꺼번에
+        self._move_enemies(obstacle_manager)
+
+        for enemy in [enemy for enemy in self.enemies if enemy.is_dead]:
+            self.enemy_grid.remove(enemy)
 
             # 죽은 적군 제거 (애니메이션 완료 후)
-            if enemy.is_dead and enemy.death_animation > 40:
+            if enemy.death_animation > 40:
                 self.enemies.remove(enemy)
+                self.store.detach(enemy)
+
+    def _update_detail_levels(self, player_pos, camera):
+        """화면(여백 포함) 안이거나 플레이어 근처인 적군만 전체 AI, 나머지는 간소화"""
+        area = camera.get_visible_area()
+        self.store.update_detail(area['left'] - AI_LOD_VIEW_MARGIN, area['top'] - AI_LOD_VIEW_MARGIN,
+                                 area['right'] + AI_LOD_VIEW_MARGIN, area['bottom'] + AI_LOD_VIEW_MARGIN,
+                                 player_pos[0], player_pos[1], AI_LOD_NEAR_DISTANCE)
+
+    def _move_enemies(self, obstacle_manager):
+        """이동 커널 - 군집 분리, 목표로 이동, 월드 경계, 쿨다운, 스택 검사를 배열로 일괄 처리
+
+        래스터상 장애물 근처라 확실하지 않은 이동과 스택 탈출만 적군별 파이썬 코드로 처리
+        """
+        store = self.store
+        enemies = store.enemies
+        active = ~np.fromiter((enemy.is_dead for enemy in enemies), dtype=bool, count=len(store))
+
+        store.apply_separation(active)
+        blocked = store.move(self.obstacle_raster, active)
+        for slot, move_x, move_y in zip(*(values.tolist() for values in blocked)):
+            enemies[slot]._resolve_blocked_move(obstacle_manager, move_x, move_y)
+        store.clamp_to_world(active)
+
+        # 트레일 (아무도 보지 않는 먼 적군은 생략)
+        full_detail = store.view('full_detail')
+        xs = store.view('x').tolist()
+        ys = store.view('y').tolist()
+        for slot in np.flatnonzero(active & full_detail).tolist():
+            trail = enemies[slot].trail
+            trail.append((xs[slot], ys[slot]))
+            if len(trail) > 10:
+                trail.pop(0)
+        for slot in np.flatnonzero(active & ~full_detail).tolist():
+            enemies[slot].trail = []
+
+        patrolling = np.fromiter((enemy.state == "patrol" for enemy in enemies), dtype=bool, count=len(store))
+        store.tick_timers(active, patrolling)
+        for slot in store.check_stuck(active).tolist():
+            enemies[slot]._escape_stuck()
+
+        # 공간 해시 증분 갱신 (셀이 바뀐 적군만 재등록)
+        for slot in store.moved_cells(ENEMY_GRID_CELL_SIZE, active).tolist():
+            enemy = enemies[slot]
+            self.enemy_grid.move(enemy, enemy.x, enemy.y, enemy.x, enemy.y)
 
     def _spawn_enemy_outside_view(self, camera, obstacle_manager, current_level):
         """화면 밖에서 적군 스폰 (레벨에 따른 강화)"""
         visible_area = camera.get_visible_area()
         margin = 100
 
+        random = self.rng.gameplay
         attempts = 0
         while attempts < 20:  # 최대 20번 시도
             # 4개 방향 중 랜덤 선택
@@ -487,14 +565,26 @@ class EnemyManager:
 
             # 장애물과 겹치지 않는지 체크
             if not obstacle_manager.check_collision_circle(x, y, ENEMY_SIZE // 2):
-                enemy = Enemy(x, y)
+                enemy = self.create_enemy(x, y)
                 # 레벨에 따른 적군 강화
                 enemy._apply_level_scaling(current_level)
-                self.enemies.append(enemy)
+                self.add_enemy(enemy)
                 break
 
             attempts += 1
 
+    def create_enemy(self, x, y):
+        """이 매니저의 난수, 이동 상태 배열, 파티클 풀을 쓰는 적군 생성 (등록은 add_enemy)"""
+        return Enemy(x, y, self.rng, self.store, self.particles)
+
+    def add_enemy(self, enemy):
+        """적군 등록 (공간 해시, 이동 상태 배열 포함)"""
+        self.enemies.append(enemy)
+        if enemy._store is not self.store:
+            self.store.attach(enemy)
+        self.enemy_grid.insert(enemy, enemy.x, enemy.y, enemy.x, enemy.y)
+        self.scheduler.assign(enemy)
+
     def draw(self, screen, camera):
         for enemy in self.enemies:
             enemy.draw(screen, camera)
@@ -0,0 +1,241 @@
+# enemy_store.py - 적군 이동 상태 배열 저장소와 NumPy 이동/조향 커널 (Enemy 객체는 이 배열의 뷰)
+
+import numpy as np
+from config import *
+
+# 배열로 보관하는 적군 필드 (이름 -> dtype)
+FIELDS = {
+    'x': np.float64,
+    'y': np.float64,
+    'prev_x': np.float64,        # 직전 틱 위치 (렌더링 보간용)
+    'prev_y': np.float64,
+    'target_x': np.float64,
+    'target_y': np.float64,
+    'speed': np.float64,
+    'aggression_level': np.float64,
+    'last_x': np.float64,        # 스택 검사용 직전 위치
+    'last_y': np.float64,
+    'size': np.int32,
+    'stuck_timer': np.int32,
+    'attack_cooldown': np.int32,
+    'dodge_timer': np.int32,
+    'search_timer': np.int32,
+    'smart_move_timer': np.int32,
+    'patrol_timer': np.int32,
+    'navigating': np.bool_,      # 플로우 필드나 경로를 따라 이동 중 (스택 탈출 생략)
+    'separating': np.bool_,      # 이번 틱에 주변 적군과 떨어지도록 목표를 밀어냄
+    'full_detail': np.bool_,     # 화면이나 플레이어 근처 (False면 간소화 업데이트)
+}
+
+# 저장소에 붙지 않은 적군이 아직 설정하지 않은 필드의 값 (새 슬롯과 같은 0)
+DEFAULTS = {name: dtype(0).item() for name, dtype in FIELDS.items()}
+
+SEPARATION_PUSH = 30  # 가까운 적군 하나당 목표를 밀어내는 거리 (픽셀)
+ARRIVE_DISTANCE = 8   # 목표에 이만큼 가까우면 멈춤 (픽셀)
+STUCK_DISTANCE = 2    # 한 틱에 이보다 덜 움직이면 막힌 것으로 봄 (픽셀)
+STUCK_TICKS = 60      # 이 틱 수를 넘게 막혀 있으면 탈출 목표를 잡음
+
+
+def array_field(name):
+    """Enemy 속성을 저장소 배열의 한 칸으로 연결하는 프로퍼티
+
+    저장소에 붙기 전이나 떨어진 뒤에는 적군의 _fields 딕셔너리에 보관
+    """
+    def getter(self):
+        store = self._store
+        if store is None:
+            return self._fields.get(name, DEFAULTS[name])
+        return store.arrays[name].item(self._slot)
+
+    def setter(self, value):
+        store = self._store
+        if store is None:
+            self._fields[name] = value
+        else:
+            store.arrays[name][self._slot] = value
+
+    return property(getter, setter)
+
+
+class EnemyStore:
+    """적군 필드를 슬롯별 배열로 보관 (살아있는 슬롯은 항상 앞쪽 count개)"""
+
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        self.count = 0
+        self.enemies = []  # 슬롯 순서의 적군
+        self.arrays = {name: np.zeros(capacity, dtype=dtype) for name, dtype in FIELDS.items()}
+
+    def __len__(self):
+        return self.count
+
+    def attach(self, enemy):
+        """적군을 다음 슬롯에 넣음 (저장소 밖에서 설정된 값은 옮겨 오고 나머지는 0)"""
+        if enemy._store is not None:
+            enemy._store.detach(enemy)
+        if self.count == self.capacity:
+            self._grow()
+        slot = self.count
+        fields = enemy._fields
+        for name, array in self.arrays.items():
+            array[slot] = fields.get(name, 0)
+        fields.clear()
+        enemy._store = self
+        enemy._slot = slot
+        self.enemies.append(enemy)
+        self.count += 1
+
+    def detach(self, enemy):
+        """적군을 빼고 마지막 슬롯을 빈자리로 옮김 (뺀 적군의 값은 _fields로 옮김)"""
+        slot = enemy._slot
+        last = self.count - 1
+        enemy._fields = {name: array.item(slot) for name, array in self.arrays.items()}
+        enemy._store = None
+        enemy._slot = None
+        if slot != last:
+            moved = self.enemies[last]
+            for array in self.arrays.values():
+                array[slot] = array[last]
+            moved._slot = slot
+            self.enemies[slot] = moved
+        self.enemies.pop()
+        self.count -= 1
+
+    def _grow(self):
+        self.capacity *= 2
+        for name, array in self.arrays.items():
+            grown = np.zeros(self.capacity, dtype=array.dtype)
+            grown[:len(array)] = array
+            self.arrays[name] = grown
+
+    def view(self, name):
+        """살아있는 슬롯 부분의 배열 (쓰면 저장소에 반영)"""
+        return self.arrays[name][:self.count]
+
+    def begin_tick(self):
+        """직전 틱 위치 저장 (죽은 적군 포함)"""
+        self.view('prev_x')[:] = self.view('x')
+        self.view('prev_y')[:] = self.view('y')
+
+    def update_detail(self, left, top, right, bottom, player_x, player_y, near_distance):
+        """영역 안이거나 플레이어와 near_distance 안인 적군만 full_detail"""
+        x = self.view('x')
+        y = self.view('y')
+        in_view = (x >= left) & (x <= right) & (y >= top) & (y <= bottom)
+        near = (x - player_x) ** 2 + (y - player_y) ** 2 <= near_distance ** 2
+        self.view('full_detail')[:] = in_view | near
+
+    def apply_separation(self, active):
+        """separating 표시된 적군의 목표를 ENEMY_CROWD_RADIUS 안의 적군 반대쪽으로 밀어냄
+
+        반지름 크기 셀로 살아있는 적군을 나눠 각 적군은 주변 3x3 셀 안의 적군과만 비교
+        모든 적군이 틱 시작 위치 기준으로 한꺼번에 밀림 (앞선 적군의 이동은 반영하지 않음)
+        """
+        separating = self.view('separating')
+        movers = np.flatnonzero(separating & active)
+        separating[:] = False
+        others = np.flatnonzero(active)
+        if len(movers) == 0 or len(others) == 0:
+            return
+
+        # 셀 번호 (월드 밖으로 한 칸까지 여유를 둬서 이웃 셀 번호가 겹치지 않게)
+        x = self.view('x')
+        y = self.view('y')
+        radius = ENEMY_CROWD_RADIUS
+        columns = int(WORLD_WIDTH // radius) + 4
+        rows = int(WORLD_HEIGHT // radius) + 4
+        cell_x = np.clip(np.floor(x / radius).astype(np.intp), -1, columns - 3) + 1
+        cell_y = np.clip(np.floor(y / radius).astype(np.intp), -1, rows - 3) + 1
+        cell = cell_y * columns + cell_x
+
+        # 셀 순서로 정렬한 적군에서 이웃 셀마다 해당 구간을 찾아 (이동하는 적군, 주변 적군) 쌍으로 펼침
+        order = others[np.argsort(cell[others], kind='stable')]
+        sorted_cells = cell[order]
+        offsets = np.array([dy * columns + dx for dy in (-1, 0, 1) for dx in (-1, 0, 1)])
+        wanted = (cell[movers][:, None] + offsets[None, :]).ravel()
+        begin = np.searchsorted(sorted_cells, wanted, 'left')
+        counts = np.searchsorted(sorted_cells, wanted, 'right') - begin
+        mover = np.repeat(np.repeat(movers, len(offsets)), counts)
+        local = np.arange(len(mover)) - np.repeat(np.cumsum(counts) - counts, counts)
+        other = order[np.repeat(begin, counts) + local]
+
+        away_x = x[mover] - x[other]
+        away_y = y[mover] - y[other]
+        dist_sq = away_x ** 2 + away_y ** 2
+        near = (dist_sq > 0) & (dist_sq < radius ** 2)  # 자기 자신과 완전히 겹친 적군은 제외
+        mover = mover[near]
+        dist = np.sqrt(dist_sq[near])
+        push_x = np.bincount(mover, weights=away_x[near] / dist * SEPARATION_PUSH, minlength=self.count)
+        push_y = np.bincount(mover, weights=away_y[near] / dist * SEPARATION_PUSH, minlength=self.count)
+        self.view('target_x')[movers] += push_x[movers]
+        self.view('target_y')[movers] += push_y[movers]
+
+    def move(self, raster, active):
+        """목표를 향해 한 걸음 - 래스터로 확실히 빈 자리는 바로 이동
+
+        래스터가 막혔다고 한 적군은 (슬롯, 이동량 x, 이동량 y) 배열로 돌려줘 정밀 충돌 검사로 처리
+        """
+        x = self.view('x')
+        y = self.view('y')
+        dx = self.view('target_x') - x
+        dy = self.view('target_y') - y
+        dist = np.sqrt(dx ** 2 + dy ** 2)
+
+        index = np.flatnonzero(active & (dist > ARRIVE_DISTANCE))
+        scale = self.view('speed')[index] * self.view('aggression_level')[index]
+        move_x = (dx[index] / dist[index]) * scale
+        move_y = (dy[index] / dist[index]) * scale
+        new_x = x[index] + move_x
+        new_y = y[index] + move_y
+
+        free = raster.free(new_x, new_y) & (self.view('size')[index] // 2 <= raster.radius)
+        x[index[free]] = new_x[free]
+        y[index[free]] = new_y[free]
+        blocked = ~free
+        return index[blocked], move_x[blocked], move_y[blocked]
+
+    def clamp_to_world(self, active):
+        """월드 경계 안으로 - 경계에 닿은 적군은 목표를 월드 중앙으로"""
+        x = self.view('x')
+        y = self.view('y')
+        half = self.view('size') // 2
+        x[:] = np.where(active, np.maximum(half, np.minimum(x, WORLD_WIDTH - half)), x)
+        y[:] = np.where(active, np.maximum(half, np.minimum(y, WORLD_HEIGHT - half)), y)
+
+        edge = active & ((x <= half) | (x >= WORLD_WIDTH - half) |
+                         (y <= half) | (y >= WORLD_HEIGHT - half))
+        self.view('target_x')[edge] = WORLD_WIDTH // 2
+        self.view('target_y')[edge] = WORLD_HEIGHT // 2
+
+    def tick_timers(self, active, patrolling):
+        """쿨다운 감소, 순찰 타이머 증가"""
+        for name in ('attack_cooldown', 'dodge_timer', 'search_timer', 'smart_move_timer'):
+            timer = self.view(name)
+            timer -= active & (timer > 0)
+        self.view('patrol_timer')[:] += active & patrolling
+
+    def check_stuck(self, active):
+        """거의 움직이지 못한 틱 수를 세고 STUCK_TICKS를 넘은 슬롯 반환 (그 슬롯은 0부터 다시)"""
+        x = self.view('x')
+        y = self.view('y')
+        last_x = self.view('last_x')
+        last_y = self.view('last_y')
+        stuck_timer = self.view('stuck_timer')
+
+        still = np.sqrt((x - last_x) ** 2 + (y - last_y) ** 2) < STUCK_DISTANCE
+        counting = active & ~self.view('navigating') & still
+        stuck_timer[:] = np.where(active, np.where(counting, stuck_timer + 1, 0), stuck_timer)
+        fired = np.flatnonzero(active & (stuck_timer > STUCK_TICKS))
+        stuck_timer[fired] = 0
+
+        last_x[:] = np.where(active, x, last_x)
+        last_y[:] = np.where(active, y, last_y)
+        return fired
+
+    def moved_cells(self, cell_size, active):
+        """이번 틱에 공간 해시 셀이 바뀐 살아있는 슬롯"""
+        x = self.view('x')
+        y = self.view('y')
+        changed = ((np.floor(x / cell_size) != np.floor(self.view('prev_x') / cell_size)) |
+                   (np.floor(y / cell_size) != np.floor(self.view('prev_y') / cell_size)))
+        return np.flatnonzero(active & changed)
@@ -2,13 +2,16 @@
 
 import pygame
 import math
-import random
 from config import *
 from utils import *
+from particles import null_particles
+from surface_cache import surface_cache
 
 
 class HealthPack:
-    def __init__(self, x, y):
+    def __init__(self, x, y, rng, particles=null_particles):
+        self.rng = rng
+        self.particles = particles
         self.x = x
         self.y = y
         self.size = HEALTH_PACK_SIZE
@@ -16,15 +19,14 @@ class HealthPack:
         self.collected = False
 
         # 물리 속성
-        self.vx = random.uniform(-3, 3)
-        self.vy = random.uniform(-8, -4)  # 위쪽으로 초기 속도
+        self.vx = rng.gameplay.uniform(-3, 3)
+        self.vy = rng.gameplay.uniform(-8, -4)  # 위쪽으로 초기 속도
         self.on_ground = False
         self.bounce_count = 0
 
         # 시각 효과
         self.glow_intensity = 255
         self.pulse_timer = 0
-        self.particles = []
 
     def update(self, obstacle_manager):
         if self.collected:
@@ -91,23 +93,11 @@ class HealthPack:
 
         # 치유 파티클 생성
         if self.pulse_timer % 20 == 0:
-            self.particles.append({
-                'x': self.x + self.size // 2 + random.uniform(-5, 5),
-                'y': self.y + self.size // 2 + random.uniform(-5, 5),
-                'vx': random.uniform(-1, 1),
-                'vy': random.uniform(-2, -0.5),
-                'life': 40,
-                'max_life': 40,
-                'size': random.uniform(2, 4)
-            })
-
-        # 파티클 업데이트
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['life'] -= 1
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+            random = self.rng.cosmetic
+            self.particles.emit(self.x + self.size // 2 + random.uniform(-5, 5),
+                                self.y + self.size // 2 + random.uniform(-5, 5),
+                                random.uniform(-1, 1), random.uniform(-2, -0.5),
+                                40, random.uniform(2, 4), GREEN)
 
     def check_pickup(self, player_x, player_y, player_size):
         """플레이어와의 픽업 체크"""
@@ -125,21 +115,11 @@ class HealthPack:
 
     def _create_pickup_effect(self):
         """픽업 시 파티클 효과"""
-        for _ in range(15):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 5)
-            self.particles.append({
-                'x': self.x + self.size // 2,
-                'y': self.y + self.size // 2,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'life': 30,
-                'max_life': 30,
-                'size': random.uniform(3, 6)
-            })
+        self.particles.emit_burst(self.x + self.size // 2, self.y + self.size // 2,
+                                  15, (2, 5), 30, (3, 6), GREEN)
 
     def draw(self, screen, camera):
-        if self.collected and len(self.particles) == 0:
+        if self.collected:
             return
 
         # 화면에 보이는지 체크
@@ -148,23 +128,9 @@ class HealthPack:
 
         screen_x, screen_y = camera.world_to_screen(self.x, self.y)
 
-        # 파티클 그리기
-        for particle in self.particles:
-            if camera.is_visible(particle['x'], particle['y']):
-                p_screen_x, p_screen_y = camera.world_to_screen(particle['x'], particle['y'])
-                alpha = int(255 * (particle['life'] / particle['max_life']))
-                if alpha > 0:
-                    particle_surface = pygame.Surface((int(particle['size'] * 2), int(particle['size'] * 2)))
-                    particle_surface.set_alpha(alpha)
-                    particle_surface.fill(GREEN)
-                    screen.blit(particle_surface, (p_screen_x - particle['size'],
-                                                   p_screen_y - particle['size']))
-
         if not self.collected:
             # 글로우 효과
-            glow_surface = pygame.Surface((self.size * 3, self.size * 3))
-            glow_surface.set_alpha(self.glow_intensity // 3)
-            glow_surface.fill(GREEN)
+            glow_surface = surface_cache.filled(self.size * 3, GREEN, self.glow_intensity // 3)
             screen.blit(glow_surface, (screen_x - self.size, screen_y - self.size))
 
             # 메인 체력팩 (십자가 모양)
@@ -187,7 +153,9 @@ class HealthPack:
 
 
 class ItemManager:
-    def __init__(self):
+    def __init__(self, rng, particles=null_particles):
+        self.rng = rng
+        self.particles = particles
         self.health_packs = []
         self.spawn_timer = 0
 
@@ -210,8 +178,8 @@ class ItemManager:
                     player.hp += heal_amount
                     # 픽업 효과는 health_pack에서 처리됨
 
-            # 수집된 아이템 제거 (파티클 완료 후)
-            if health_pack.collected and len(health_pack.particles) == 0:
+            # 수집된 아이템 제거 (픽업 파티클은 월드 파티클 풀이 계속 처리)
+            if health_pack.collected:
                 self.health_packs.remove(health_pack)
 
     def _spawn_health_pack(self, obstacle_manager):
@@ -219,12 +187,12 @@ class ItemManager:
         attempts = 0
         while attempts < 20:
             # 하늘에서 떨어뜨리기
-            x = random.randint(100, WORLD_WIDTH - 100)
-            y = random.randint(50, 200)  # 위쪽 공중에서
+            x = self.rng.gameplay.randint(100, WORLD_WIDTH - 100)
+            y = self.rng.gameplay.randint(50, 200)  # 위쪽 공중에서
 
             # 장애물과 겹치지 않는 위치 찾기
             if not obstacle_manager.check_collision_circle(x, y, HEALTH_PACK_SIZE):
-                health_pack = HealthPack(x, y)
+                health_pack = HealthPack(x, y, self.rng, self.particles)
                 self.health_packs.append(health_pack)
                 break
 
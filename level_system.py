@@ -1,10 +1,13 @@
 # level_system.py - 레벨 시스템
 
-import pygame
 from config import *
+from surface_cache import surface_cache
+from text_cache import text_cache
 
 
 class LevelSystem:
+    fonts_ready = False  # 레벨업 폰트를 만들었는지 (모든 인스턴스 공유)
+
     def __init__(self):
         self.level = 1
         self.kills = 0
@@ -13,6 +16,17 @@ class LevelSystem:
         self.level_up_animation = 0
         self.just_leveled_up = False
 
+    @classmethod
+    def _prepare_fonts(cls):
+        """레벨업 연출의 크기 단계별 폰트를 한 번에 생성 (헤드리스 실행에서는 만들지 않음)"""
+        if cls.fonts_ready:
+            return
+        for step in range(int(round(1.8 / LEVEL_UP_SCALE_STEP)) + 1):
+            scale = 1.0 + step * LEVEL_UP_SCALE_STEP
+            text_cache.get_font(int(72 * scale))
+            text_cache.get_font(int(36 * scale))
+        cls.fonts_ready = True
+
     def add_kill(self):
         """킬 수 추가"""
         self.kills += 1
@@ -54,36 +68,26 @@ class LevelSystem:
 
     def draw_level_up_effect(self, screen):
         """레벨업 애니메이션"""
+        self._prepare_fonts()  # 게임 시작 후 첫 그리기에서 미리 생성 (매 프레임 Font 생성 방지)
         if self.level_up_animation <= 0:
             return
 
         # 레벨업 텍스트
         alpha = min(255, self.level_up_animation * 3)
         scale = 1.0 + (180 - self.level_up_animation) * 0.01
+        # 미리 만든 폰트를 쓰도록 크기를 단계로 묶음
+        scale = 1.0 + round((scale - 1.0) / LEVEL_UP_SCALE_STEP) * LEVEL_UP_SCALE_STEP
 
         # 반투명 오버레이
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(alpha // 4)
-        overlay.fill((255, 215, 0))  # 골드 색상
+        overlay = surface_cache.filled((SCREEN_WIDTH, SCREEN_HEIGHT), (255, 215, 0), alpha // 4)  # 골드 색상
         screen.blit(overlay, (0, 0))
 
-        # 레벨업 텍스트
-        font = pygame.font.Font(None, int(72 * scale))
-        level_text = font.render(f"LEVEL {self.level}!", True, GOLD)
-        level_rect = level_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
-
-        # 텍스트에 알파 적용
-        level_surface = pygame.Surface(level_text.get_size())
-        level_surface.set_alpha(alpha)
-        level_surface.blit(level_text, (0, 0))
+        # 레벨업 텍스트 (텍스트에 알파 적용)
+        level_surface = text_cache.render_faded(f"LEVEL {self.level}!", int(72 * scale), GOLD, alpha)
+        level_rect = level_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
         screen.blit(level_surface, level_rect)
 
         # 추가 정보
-        font2 = pygame.font.Font(None, int(36 * scale))
-        info_text = font2.render(f"Enemies become stronger!", True, WHITE)
-        info_rect = info_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
-
-        info_surface = pygame.Surface(info_text.get_size())
-        info_surface.set_alpha(alpha)
-        info_surface.blit(info_text, (0, 0))
+        info_surface = text_cache.render_faded("Enemies become stronger!", int(36 * scale), WHITE, alpha)
+        info_rect = info_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
         screen.blit(info_surface, info_rect)
\ No newline at end of file
@@ -1,21 +1,17 @@
 # main.py - 메인 게임 루프 (킬 카운트 수정)
 
 import pygame
+import random
 import sys
 from config import *
-from player import Player
-from enemy import EnemyManager
-from effects import VisualEffects
-from ui import UI
-from bullet import BulletManager
-from camera import Camera
-from obstacle import ObstacleManager
-from item import ItemManager
-from level_system import LevelSystem
-from decoration import DecorationManager
-
-
-def main():
+from renderer import GameRenderer
+from profiler import Profiler, null_profiler
+from timestep import FixedTimestep
+from simulation import Simulation, PlayerInput
+from replay import InputRecorder
+
+
+def main(record_path=None, seed=None):
     # Pygame 초기화
     pygame.init()
 
@@ -28,21 +24,17 @@ def main():
     import os
     os.environ['SDL_VIDEO_WINDOW_POS'] = 'centered'
 
-    # 게임 객체 생성
-    player = Player(WORLD_WIDTH // 2, WORLD_HEIGHT // 2)
-    enemy_manager = EnemyManager()
-    bullet_manager = BulletManager()
-    obstacle_manager = ObstacleManager()
-    item_manager = ItemManager()
-    level_system = LevelSystem()
-    decoration_manager = DecorationManager()
-    effects = VisualEffects()
-    ui = UI()
-    camera = Camera()
+    # 게임 객체 생성 (시뮬레이션 + 그리기 전용 객체)
+    if record_path is not None and seed is None:
+        seed = random.randrange(1 << 31)  # 리플레이는 시드가 있어야 재현 가능
+    match = 0  # 재시작할 때마다 증가 (시드가 있으면 match번째 경기는 seed + match)
+    renderer = GameRenderer(seed)  # 장식 배치도 시드에 맞춰 재현
+    simulation = Simulation(seed, renderer.particles)  # 월드 파티클은 렌더러 풀에 생성
+    recorder = InputRecorder(record_path, seed) if record_path is not None else None
 
     # 게임 상태
-    score = 0
-    game_over = False
+    timestep = FixedTimestep(SIMULATION_TICK_RATE, MAX_CATCH_UP_STEPS)
+    profiler = Profiler(PROFILER_HISTORY)  # F3 오버레이가 켜져 있을 때만 측정
 
     print("=== Elite Combat Arena - Ultimate Edition ===")
     print("Controls:")
@@ -52,6 +44,7 @@ def main():
     print("1,2,3 - Switch weapons (Pistol/Shotgun/Sniper)")
     print("F - Dash (10s cooldown)")
     print("Q - Explode (3s cooldown)")
+    print("F3 - Toggle profiler overlay")
     print("ESC - Quit")
     print("")
     print("Features:")
@@ -72,88 +65,73 @@ def main():
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     running = False
-                elif event.key == pygame.K_r and game_over:
+                elif event.key == pygame.K_F3:
+                    # 프로파일러 오버레이 토글 (켤 때 기록을 비움)
+                    renderer.toggle_profiler()
+                    profiler.reset()
+                elif event.key == pygame.K_r and simulation.game_over:
                     # 게임 재시작
-                    player = Player(WORLD_WIDTH // 2, WORLD_HEIGHT // 2)
-                    enemy_manager = EnemyManager()
-                    bullet_manager = BulletManager()
-                    obstacle_manager = ObstacleManager()
-                    item_manager = ItemManager()
-                    level_system = LevelSystem()
-                    decoration_manager = DecorationManager()
-                    score = 0
-                    game_over = False
+                    match += 1
+                    simulation = Simulation(None if seed is None else seed + match, renderer.particles)
+                    renderer.reset()
+                    timestep.reset()
             # 우클릭 메뉴 방지
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 3:  # 우클릭
                     pass  # 아무것도 하지 않음으로 메뉴 방지
 
-        if not game_over:
-            # 입력 상태 확인
-            keys = pygame.key.get_pressed()
-            mouse_buttons = pygame.mouse.get_pressed()
-            mouse_pos = pygame.mouse.get_pos()
-
-            # 카메라 업데이트 (플레이어와 마우스 위치 고려)
-            camera.update(player.get_position(), mouse_pos)
-
-            # 게임 업데이트
-            player.update(keys, mouse_buttons, mouse_pos, bullet_manager,
-                          enemy_manager.get_enemies(), camera, obstacle_manager)
-            enemy_manager.update(player.get_position(), camera, obstacle_manager, level_system)
-            bullet_manager.update(enemy_manager.get_enemies(), obstacle_manager)
-            obstacle_manager.update()
-            item_manager.update(obstacle_manager, player)
-            level_system.update()
-            decoration_manager.update()
-            effects.update()
-
-            # 적군 처치 시 레벨 시스템 업데이트 (수정된 부분)
-            for enemy in enemy_manager.enemies:  # 모든 적군 체크 (죽은 것 포함)
-                if enemy.is_dead and not enemy.kill_counted:
-                    level_system.add_kill()
-                    score += 10 * level_system.level  # 레벨에 따른 점수 증가
-                    enemy.kill_counted = True  # 중복 카운팅 방지
-                    print(f"Enemy killed! Kills: {level_system.kills}/{level_system.kills_for_next_level}")
-
-            # 플레이어 죽음 체크
-            if player.is_dead():
-                game_over = True
+        frame_profiler = profiler if renderer.show_profiler else null_profiler
+
+        # 지난 프레임 이후 흐른 시간만큼 고정 간격 틱 실행 (렌더링이 느려져도 게임 속도 유지)
+        steps = timestep.advance(clock.get_time() / 1000)
+
+        if not simulation.game_over:
+            # 입력 상태 확인 (프레임마다 한 번, 이번 프레임의 모든 틱에 사용)
+            with frame_profiler.section('input'):
+                mouse_pos = pygame.mouse.get_pos()
+                player_input = PlayerInput(pygame.key.get_pressed(), pygame.mouse.get_pressed(),
+                                           simulation.camera.screen_to_world(mouse_pos[0], mouse_pos[1]))
+
+        for _ in range(steps):
+            if simulation.game_over:
+                break
+
+            # 게임 업데이트 (기록 중이면 입력을 리플레이 파일에 남기면서 진행)
+            if recorder is not None:
+                kills = recorder.step(simulation, player_input, frame_profiler)
+            else:
+                kills = simulation.step(player_input, frame_profiler)
+            renderer.update(frame_profiler)
+
+            level_system = simulation.level_system
+            for _ in range(kills):
+                print(f"Enemy killed! Kills: {level_system.kills}/{level_system.kills_for_next_level}")
+
+        # 리플레이는 한 경기만 기록
+        if recorder is not None and simulation.game_over:
+            recorder.close(simulation)
+            print(f"Replay saved: {recorder.path} ({recorder.ticks} ticks)")
+            recorder = None
 
         # 화면 그리기
-        screen.fill(BLACK)
-
-        if not game_over:
-            # 배경 효과 (월드 좌표)
-            effects.draw_background_effect(screen)
-
-            # 게임 객체 그리기 (카메라 적용)
-            decoration_manager.draw(screen, camera)  # 장식을 가장 먼저
-            obstacle_manager.draw(screen, camera)
-            item_manager.draw(screen, camera)
-            enemy_manager.draw(screen, camera)
-            bullet_manager.draw(screen, camera)
-            player.draw(screen, camera)
-
-            # UI 그리기 (화면 좌표, 카메라 영향 없음)
-            enemy_count = len(enemy_manager.get_enemies())
-            ui.draw_player_hud(screen, player)
-            ui.draw_level_progress(screen, level_system)  # 레벨 진행률 추가
-            ui.draw_minimap(screen, player.get_position(), enemy_manager.get_enemies(), camera)
-            ui.draw_skill_bar(screen, player)
-            ui.draw_game_info(screen, enemy_count, score, level_system.level)
-            ui.draw_fps(screen, clock)
-
-            # 레벨업 애니메이션
-            level_system.draw_level_up_effect(screen)
+        if not simulation.game_over:
+            # 마지막 두 틱 사이를 보간해서 그림
+            renderer.draw(screen, simulation, clock, timestep.alpha, frame_profiler)
+            if renderer.show_profiler:
+                renderer.draw_profiler(screen, simulation, profiler)
+            with frame_profiler.section('display'):
+                pygame.display.flip()
+            frame_profiler.end_frame()
         else:
-            # 게임 오버 화면
-            ui.draw_game_over_screen(screen, score)
+            # 게임 오버 화면 - 월드가 멈춰 있으므로 바뀐 패널 영역만 갱신
+            pygame.display.update(renderer.draw_game_over(screen, simulation.score))
 
-        # 화면 업데이트
-        pygame.display.flip()
         clock.tick(FPS)
 
+    if recorder is not None:
+        recorder.close(simulation)
+        print(f"Replay saved: {recorder.path} ({recorder.ticks} ticks)")
+
     print("Game ended. Thanks for playing Elite Combat Arena!")
     pygame.quit()
     sys.exit()
@@ -161,4 +139,10 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Elite Combat Arena")
+    parser.add_argument('--record', metavar='PATH', help="record this match's input to a replay file")
+    parser.add_argument('--seed', type=int, help="base random seed (match i of the session uses seed + i)")
+    args = parser.parse_args()
+    main(args.record, args.seed)
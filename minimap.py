@@ -0,0 +1,118 @@
+# minimap.py - 레이어 미니맵 (정적 장애물 레이어 + 낮은 주기로 갱신하는 동적 마커)
+
+import pygame
+from config import *
+
+
+class Minimap:
+    def __init__(self):
+        # 정적 레이어: 배경, 월드 경계, 장애물 (장애물이 파괴될 때만 부분 갱신)
+        self.static_surface = pygame.Surface((MINIMAP_SIZE, MINIMAP_SIZE))
+        self.obstacle_manager = None
+        self.obstacle_version = None
+        self.static_ready = False
+        self.drawn_obstacles = set()
+
+        # 합성된 미니맵 (정적 레이어 + 적군, 체력팩, 플레이어, 카메라 영역)
+        self.surface = pygame.Surface((MINIMAP_SIZE, MINIMAP_SIZE))
+        self.surface.set_alpha(200)
+        self.timer = 0
+        self.dirty = True
+
+    def _to_minimap(self, x, y):
+        return (int((x / WORLD_WIDTH) * MINIMAP_SIZE), int((y / WORLD_HEIGHT) * MINIMAP_SIZE))
+
+    def _obstacle_rect(self, obstacle):
+        left, top = self._to_minimap(obstacle.x, obstacle.y)
+        right, bottom = self._to_minimap(obstacle.x + obstacle.width, obstacle.y + obstacle.height)
+        return pygame.Rect(left, top, max(1, right - left), max(1, bottom - top))
+
+    def _draw_border(self):
+        # 월드 경계
+        pygame.draw.rect(self.static_surface, WHITE, (0, 0, MINIMAP_SIZE, MINIMAP_SIZE), 2)
+
+    def _render_static(self, obstacle_manager):
+        """정적 레이어 전체 그리기 (장애물 매니저가 바뀌었을 때)"""
+        self.static_surface.fill((10, 10, 20))
+        self.drawn_obstacles = set()
+        if obstacle_manager is not None:
+            for obstacle in obstacle_manager.get_obstacles():
+                pygame.draw.rect(self.static_surface, obstacle.color, self._obstacle_rect(obstacle))
+                self.drawn_obstacles.add(obstacle)
+        self._draw_border()
+
+    def _patch_static(self, obstacle_manager):
+        """파괴된 장애물 자리만 지우고 겹치는 장애물을 다시 그림"""
+        destroyed = [obstacle for obstacle in self.drawn_obstacles if obstacle.destroyed]
+        for obstacle in destroyed:
+            self.drawn_obstacles.discard(obstacle)
+            rect = self._obstacle_rect(obstacle)
+            self.static_surface.fill((10, 10, 20), rect)
+
+            # 같은 미니맵 픽셀에 걸치는 다른 장애물 복원
+            scale_x = WORLD_WIDTH / MINIMAP_SIZE
+            scale_y = WORLD_HEIGHT / MINIMAP_SIZE
+            for other in obstacle_manager.grid.query(rect.left * scale_x, rect.top * scale_y,
+                                                     rect.right * scale_x, rect.bottom * scale_y):
+                if not other.destroyed:
+                    pygame.draw.rect(self.static_surface, other.color, self._obstacle_rect(other))
+        if destroyed:
+            self._draw_border()
+
+    def _update_static(self, obstacle_manager):
+        if not self.static_ready or obstacle_manager is not self.obstacle_manager:
+            self.obstacle_manager = obstacle_manager
+            self._render_static(obstacle_manager)
+            self.static_ready = True
+        elif obstacle_manager is not None and obstacle_manager.version != self.obstacle_version:
+            self._patch_static(obstacle_manager)
+        else:
+            return
+        self.obstacle_version = obstacle_manager.version if obstacle_manager is not None else None
+        self.dirty = True
+
+    def _compose(self, player_pos, enemies, camera, health_packs):
+        """정적 레이어 위에 동적 마커를 그려서 합성"""
+        surface = self.surface
+        surface.blit(self.static_surface, (0, 0))
+
+        # 체력팩 위치 - 초록 십자
+        for health_pack in health_packs:
+            if not health_pack.collected:
+                pack_x, pack_y = self._to_minimap(health_pack.x, health_pack.y)
+                pygame.draw.line(surface, GREEN, (pack_x - 2, pack_y), (pack_x + 2, pack_y))
+                pygame.draw.line(surface, GREEN, (pack_x, pack_y - 2), (pack_x, pack_y + 2))
+
+        # 플레이어 위치
+        pygame.draw.circle(surface, BLUE, self._to_minimap(*player_pos), 3)
+
+        # 적군 위치 - 빨간 네모로 표시
+        for enemy in enemies:
+            if not enemy.is_dead:
+                enemy_minimap_x, enemy_minimap_y = self._to_minimap(enemy.x, enemy.y)
+
+                # 빨간 네모로 표시 (크기 4x4)
+                enemy_rect = pygame.Rect(enemy_minimap_x - 2, enemy_minimap_y - 2, 4, 4)
+                pygame.draw.rect(surface, RED, enemy_rect)
+
+        # 카메라 시야 영역
+        visible_area = camera.get_visible_area()
+        view_x = int((visible_area['left'] / WORLD_WIDTH) * MINIMAP_SIZE)
+        view_y = int((visible_area['top'] / WORLD_HEIGHT) * MINIMAP_SIZE)
+        view_w = int((SCREEN_WIDTH / WORLD_WIDTH) * MINIMAP_SIZE)
+        view_h = int((SCREEN_HEIGHT / WORLD_HEIGHT) * MINIMAP_SIZE)
+
+        pygame.draw.rect(surface, CYAN, (view_x, view_y, view_w, view_h), 1)
+
+    def draw(self, screen, position, player_pos, enemies, camera,
+             obstacle_manager=None, health_packs=()):
+        """미니맵 그리기 - 동적 마커는 MINIMAP_UPDATE_INTERVAL 프레임마다 다시 합성"""
+        self._update_static(obstacle_manager)
+
+        self.timer += 1
+        if self.dirty or self.timer >= MINIMAP_UPDATE_INTERVAL:
+            self._compose(player_pos, enemies, camera, health_packs)
+            self.timer = 0
+            self.dirty = False
+
+        screen.blit(self.surface, position)
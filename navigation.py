@@ -0,0 +1,220 @@
+# navigation.py - 장애물 점유 격자와 플레이어를 향한 플로우 필드 (모든 적군이 공유)
+
+import math
+import numpy as np
+from config import *
+
+# 이웃 셀 방향 (직교 방향을 먼저 두어 같은 거리면 직선 이동을 우선)
+NEIGHBOR_OFFSETS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+
+UNREACHED = np.iinfo(np.int32).max
+
+
+class NavGrid:
+    """장애물 매니저의 점유 격자 - 장애물과 조금이라도 겹치는 셀은 막힘"""
+
+    def __init__(self, cell_size=NAV_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cols = int(math.ceil(WORLD_WIDTH / cell_size))
+        self.rows = int(math.ceil(WORLD_HEIGHT / cell_size))
+        self.blocked = np.zeros((self.rows, self.cols), dtype=bool)  # [row, col]
+        self.clear = np.zeros((self.rows, self.cols), dtype=bool)  # 자기와 8방향 이웃이 모두 열린 셀 (경로 벽 페널티용)
+        self.obstacle_manager = None
+        self.obstacle_version = None
+        self.version = 0  # 격자가 다시 만들어질 때마다 증가
+
+    def update(self, obstacle_manager):
+        """장애물 구성이 바뀌었을 때만 격자를 다시 만듦"""
+        if (obstacle_manager is self.obstacle_manager and
+                obstacle_manager.version == self.obstacle_version):
+            return False
+
+        size = self.cell_size
+        self.blocked[:] = False
+        for obstacle in obstacle_manager.get_obstacles():
+            if obstacle.destroyed:
+                continue
+            left = max(0, int(obstacle.x // size))
+            top = max(0, int(obstacle.y // size))
+            right = min(self.cols, int(math.ceil((obstacle.x + obstacle.width) / size)))
+            bottom = min(self.rows, int(math.ceil((obstacle.y + obstacle.height) / size)))
+            self.blocked[top:bottom, left:right] = True
+
+        # 벽에서 한 셀 이상 떨어진 셀 (월드 밖은 막힘) - 경로 탐색이 나머지 셀에 벽 페널티를 줌
+        # 이동 충돌 판정은 이 격자가 아니라 ObstacleRaster가 맡음
+        padded = np.pad(self.blocked, 1, constant_values=True)
+        near_blocked = np.lib.stride_tricks.sliding_window_view(padded, (3, 3)).any(axis=(2, 3))
+        self.clear = ~near_blocked
+
+        self.obstacle_manager = obstacle_manager
+        self.obstacle_version = obstacle_manager.version
+        self.version += 1
+        return True
+
+    def cell_of(self, x, y):
+        """월드 좌표가 속한 셀 (격자 밖이면 가장자리 셀)"""
+        col = min(self.cols - 1, max(0, int(x // self.cell_size)))
+        row = min(self.rows - 1, max(0, int(y // self.cell_size)))
+        return col, row
+
+    def cell_center(self, col, row):
+        return ((col + 0.5) * self.cell_size, (row + 0.5) * self.cell_size)
+
+
+class ObstacleRaster:
+    """적군 이동 커널용 장애물 래스터 (보수적)
+
+    반지름 radius인 원의 중심이 이 칸 안 어디에 있든 장애물에 닿지 않는 칸만 열림
+    열린 칸으로의 이동은 정밀 충돌 검사 없이 허용, 막힌 칸이면 정밀 검사로 넘김
+    """
+
+    def __init__(self, resolution=ENEMY_RASTER_RESOLUTION, radius=ENEMY_SIZE // 2):
+        self.resolution = resolution
+        self.radius = radius
+        self.cols = int(math.ceil(WORLD_WIDTH / resolution))
+        self.rows = int(math.ceil(WORLD_HEIGHT / resolution))
+        self.blocked = np.ones((self.rows, self.cols), dtype=bool)  # [row, col]
+        self.obstacle_manager = None
+        self.obstacle_version = None
+
+    def update(self, obstacle_manager):
+        """장애물 구성이 바뀌었을 때만 다시 래스터화"""
+        if (obstacle_manager is self.obstacle_manager and
+                obstacle_manager.version == self.obstacle_version):
+            return False
+
+        size = self.resolution
+        radius = self.radius
+        self.blocked[:] = False
+        for obstacle in obstacle_manager.get_obstacles():
+            if obstacle.destroyed:
+                continue
+            # 장애물을 반지름만큼 키운 사각형 (모서리도 사각으로 - 원보다 넓게 막음)
+            left = max(0, int(math.floor((obstacle.x - radius) / size)))
+            top = max(0, int(math.floor((obstacle.y - radius) / size)))
+            right = min(self.cols, int(math.floor((obstacle.x + obstacle.width + radius) / size)) + 1)
+            bottom = min(self.rows, int(math.floor((obstacle.y + obstacle.height + radius) / size)) + 1)
+            self.blocked[top:bottom, left:right] = True
+
+        self.obstacle_manager = obstacle_manager
+        self.obstacle_version = obstacle_manager.version
+        return True
+
+    def free(self, xs, ys):
+        """위치 배열마다 확실히 장애물과 닿지 않는지 (월드 밖은 False)"""
+        cols = np.floor(xs / self.resolution).astype(np.intp)
+        rows = np.floor(ys / self.resolution).astype(np.intp)
+        inside = (cols >= 0) & (cols < self.cols) & (rows >= 0) & (rows < self.rows)
+        result = np.zeros(len(cols), dtype=bool)
+        result[inside] = ~self.blocked[rows[inside], cols[inside]]
+        return result
+
+
+class FlowField:
+    """목표 셀에서 BFS로 퍼져 나간 거리장 - 적군은 자기 셀에서 거리가 줄어드는 이웃 방향을 읽음
+
+    목표가 다른 셀로 옮겨가거나 격자가 바뀔 때만 다시 계산하므로
+    적군 수와 무관하게 경로 탐색은 한 번 (셀별 방향은 처음 조회할 때 계산해서 재사용)
+    계산 자체도 추격 중인 적군이 처음 방향을 물을 때까지 미룸
+    """
+
+    def __init__(self, nav_grid, max_distance=NAV_FLOW_MAX_DISTANCE, min_interval=NAV_FLOW_MIN_INTERVAL):
+        self.grid = nav_grid
+        self.max_distance = max_distance  # 이보다 먼 셀은 방향 없음 (직접 추격)
+        self.min_interval = min_interval  # 목표 이동으로 다시 계산하는 최소 간격 (틱)
+
+        # 테두리 한 칸을 덧댄 1차원 배열 (이웃 접근을 인덱스 덧셈으로, 테두리는 막힌 셀)
+        self.stride = nav_grid.cols + 2
+        size = (nav_grid.rows + 2) * self.stride
+        self.open_cells = np.zeros(size, dtype=bool)
+        self.distance = np.full(size, UNREACHED, dtype=np.int32)
+        self.distances = []   # 조회용 파이썬 리스트 (distance.tolist())
+        self.neighbors = []   # (인덱스 오프셋, 대각선 모서리 오프셋 2개 또는 None, 단위 방향)
+        for dx, dy in NEIGHBOR_OFFSETS:
+            length = math.hypot(dx, dy)
+            corners = (dx, dy * self.stride) if dx and dy else None
+            self.neighbors.append((dx + dy * self.stride, corners, (dx / length, dy / length)))
+        self.direction_cache = {}
+
+        self.goal_cell = None
+        self.grid_version = None
+        self.pending_goal = None  # 다음 조회 때 계산할 목표 셀
+        self.ticks_since_compute = 0
+        self.recomputes = 0
+
+    def update(self, goal_x, goal_y):
+        """목표 셀이나 격자가 바뀌었으면 다시 계산하도록 표시 - 표시했으면 True"""
+        self.ticks_since_compute += 1
+        goal_cell = self.grid.cell_of(goal_x, goal_y)
+        if self.grid.version == self.grid_version:
+            if goal_cell == self.goal_cell or self.ticks_since_compute < self.min_interval:
+                return False
+
+        self.goal_cell = goal_cell
+        self.grid_version = self.grid.version
+        self.pending_goal = goal_cell
+        self.ticks_since_compute = 0
+        return True
+
+    def _compute_distance(self, goal_cell):
+        """막히지 않은 셀을 따라 4방향 BFS (격자 전체를 한 번에 한 걸음씩 확장)"""
+        stride = self.stride
+        open_cells = self.open_cells
+        open_cells.reshape(-1, stride)[1:-1, 1:-1] = ~self.grid.blocked
+        distance = self.distance
+        distance.fill(UNREACHED)
+
+        col, row = goal_cell
+        goal_index = (row + 1) * stride + col + 1
+        frontier = np.zeros_like(open_cells)
+        grown = np.empty_like(open_cells)
+        frontier[goal_index] = True
+        open_cells[goal_index] = False
+        distance[goal_index] = 0
+
+        for step in range(1, self.max_distance + 1):
+            grown[:stride] = False
+            np.copyto(grown[stride:], frontier[:-stride])
+            grown[:-stride] |= frontier[stride:]
+            grown[1:] |= frontier[:-1]
+            grown[:-1] |= frontier[1:]
+            grown &= open_cells
+            if not grown.any():
+                break
+            open_cells ^= grown
+            np.copyto(distance, step, where=grown)
+            frontier, grown = grown, frontier
+
+        self.distances = distance.tolist()
+
+    def direction(self, x, y):
+        """해당 위치에서 목표로 가는 단위 방향 벡터 (방향이 없으면 None)
+
+        대각선은 양쪽 직교 셀이 모두 열려 있을 때만 (모서리를 가로지르지 않도록)
+        장애물에 걸친 막힌 셀도 가장 가까운 열린 이웃을 가리키므로 벽에 붙은 적군도 빠져나옴
+        """
+        if self.pending_goal is not None:
+            self._compute_distance(self.pending_goal)
+            self.direction_cache.clear()
+            self.pending_goal = None
+            self.recomputes += 1
+
+        col, row = self.grid.cell_of(x, y)
+        index = (row + 1) * self.stride + col + 1
+        if index in self.direction_cache:
+            return self.direction_cache[index]
+
+        distances = self.distances
+        best = distances[index] if distances else UNREACHED
+        best_direction = None
+        if distances:
+            for offset, corners, unit in self.neighbors:
+                value = distances[index + offset]
+                if value < best:
+                    if corners is not None and (distances[index + corners[0]] == UNREACHED or
+                                                distances[index + corners[1]] == UNREACHED):
+                        continue
+                    best = value
+                    best_direction = unit
+        self.direction_cache[index] = best_direction
+        return best_direction
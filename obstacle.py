@@ -1,10 +1,12 @@
 # obstacle.py - 장애물 시스템 (완전 재설계)
 
 import pygame
-import random
 import math
 from config import *
 from utils import *
+from spatial import SpatialGrid
+from static_layer import StaticLayer
+from particles import null_particles
 
 
 class Obstacle:
@@ -37,7 +39,7 @@ class Obstacle:
             self.destructible = False
 
         self.destroyed = False
-        self.destruction_particles = []
+        self.needs_redraw = False  # 정적 레이어 청크를 다시 그려야 하는지
 
     def get_rect(self):
         """충돌 검사용 사각형 반환"""
@@ -56,52 +58,40 @@ class Obstacle:
         distance = math.sqrt((center_x - closest_x) ** 2 + (center_y - closest_y) ** 2)
         return distance <= radius
 
+    def check_collision_with_segment(self, x1, y1, x2, y2):
+        """선분과의 충돌 체크 (정확한 선분-사각형 교차)"""
+        return segment_rect_entry(x1, y1, x2, y2, self.x, self.y,
+                                  self.x + self.width, self.y + self.height) is not None
+
     def take_damage(self, damage):
         """데미지 받기 (파괴 가능한 장애물만)"""
         if not self.destructible or self.destroyed:
             return False
 
         self.hp -= damage
+        self.needs_redraw = True
         if self.hp <= 0:
             self.destroyed = True
-            self._create_destruction_effect()
             return True
         return False
 
-    def _create_destruction_effect(self):
-        """파괴 효과 생성"""
+    def create_destruction_effect(self, particles):
+        """파괴 효과 생성 (ObstacleManager.update가 파괴를 처리할 때 호출)"""
         center_x = self.x + self.width // 2
         center_y = self.y + self.height // 2
 
         # 파괴 파티클 생성
-        for _ in range(15):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 6)
-            self.destruction_particles.append({
-                'x': center_x + random.uniform(-self.width // 4, self.width // 4),
-                'y': center_y + random.uniform(-self.height // 4, self.height // 4),
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'life': 30,
-                'max_life': 30,
-                'size': random.uniform(2, 5)
-            })
-
-    def update(self):
-        """업데이트 (파괴 파티클)"""
-        for particle in self.destruction_particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['life'] -= 1
-            particle['vx'] *= 0.95
-            particle['vy'] *= 0.95
+        particles.emit_burst(center_x, center_y, 15, (2, 6), 30, (2, 5), self.color,
+                             drag=0.95, spread_x=self.width // 4, spread_y=self.height // 4)
 
-            if particle['life'] <= 0:
-                self.destruction_particles.remove(particle)
+    def get_static_bounds(self):
+        """정적 레이어에 그려지는 영역 (그림자와 HP 바 포함)"""
+        top = self.y - 8 if self.destructible else self.y
+        return (self.x, top, self.x + self.width + 4, self.y + self.height + 4)
 
     def draw(self, screen, camera):
         """장애물 그리기"""
-        if self.destroyed and len(self.destruction_particles) == 0:
+        if self.destroyed:
             return
 
         # 화면에 보이는지 체크
@@ -110,43 +100,33 @@ class Obstacle:
             return
 
         screen_x, screen_y = camera.world_to_screen(self.x, self.y)
-
-        # 파괴 파티클 그리기
-        for particle in self.destruction_particles:
-            if camera.is_visible(particle['x'], particle['y']):
-                p_screen_x, p_screen_y = camera.world_to_screen(particle['x'], particle['y'])
-                alpha = int(255 * (particle['life'] / particle['max_life']))
-                if alpha > 0:
-                    particle_surface = pygame.Surface((int(particle['size'] * 2), int(particle['size'] * 2)))
-                    particle_surface.set_alpha(alpha)
-                    particle_surface.fill(self.color)
-                    screen.blit(particle_surface, (p_screen_x - particle['size'],
-                                                   p_screen_y - particle['size']))
-
-        if not self.destroyed:
-            # 그림자
-            shadow_offset = 4
-            pygame.draw.rect(screen, (50, 50, 50),
-                             (screen_x + shadow_offset, screen_y + shadow_offset,
-                              self.width, self.height))
-
-            # 메인 장애물
-            pygame.draw.rect(screen, self.color,
-                             (screen_x, screen_y, self.width, self.height))
-
-            # 테두리 (타입별)
-            border_color = WHITE
-            if self.type == "crate":
-                border_color = (101, 67, 33)  # 어두운 갈색
-            elif self.type == "metal":
-                border_color = (105, 105, 105)
-
-            pygame.draw.rect(screen, border_color,
-                             (screen_x, screen_y, self.width, self.height), 2)
-
-            # HP 바 (파괴 가능한 장애물)
-            if self.destructible and self.hp < self.max_hp:
-                self._draw_hp_bar(screen, screen_x, screen_y)
+        self.draw_static(screen, screen_x, screen_y)
+
+    def draw_static(self, surface, screen_x, screen_y):
+        """장애물 모양 그리기 (정적 레이어 청크 또는 화면)"""
+        # 그림자
+        shadow_offset = 4
+        pygame.draw.rect(surface, (50, 50, 50),
+                         (screen_x + shadow_offset, screen_y + shadow_offset,
+                          self.width, self.height))
+
+        # 메인 장애물
+        pygame.draw.rect(surface, self.color,
+                         (screen_x, screen_y, self.width, self.height))
+
+        # 테두리 (타입별)
+        border_color = WHITE
+        if self.type == "crate":
+            border_color = (101, 67, 33)  # 어두운 갈색
+        elif self.type == "metal":
+            border_color = (105, 105, 105)
+
+        draw_rect_outline(surface, border_color,
+                          (screen_x, screen_y, self.width, self.height), 2)
+
+        # HP 바 (파괴 가능한 장애물)
+        if self.destructible and self.hp < self.max_hp:
+            self._draw_hp_bar(surface, screen_x, screen_y)
 
     def _draw_hp_bar(self, screen, screen_x, screen_y):
         """HP 바 그리기"""
@@ -165,10 +145,34 @@ class Obstacle:
 
 
 class ObstacleManager:
-    def __init__(self):
+    def __init__(self, particles=null_particles):
+        self.particles = particles
         self.obstacles = []
         self._generate_meaningful_map()
 
+        # 경로 탐색용 맵 구역 (이름, 영역)
+        self.regions = self._create_map_regions()
+
+        # 정적 공간 인덱스 (맵 생성 후 한 번 구축, 파괴 시에만 갱신)
+        self.grid = SpatialGrid(OBSTACLE_GRID_CELL_SIZE)
+        self._build_spatial_index()
+
+        # 장애물 구성이 바뀔 때마다 증가 (캐시 무효화용)
+        self.version = 0
+
+        # 미리 그려둔 정적 레이어 (피격/파괴된 장애물의 청크만 다시 그림)
+        self.static_layer = StaticLayer()
+        for obstacle in self.obstacles:
+            self.static_layer.add(obstacle)
+
+    def _build_spatial_index(self):
+        """파괴되지 않은 장애물들을 그리드에 등록"""
+        self.grid.clear()
+        for obstacle in self.obstacles:
+            if not obstacle.destroyed:
+                self.grid.insert(obstacle, obstacle.x, obstacle.y,
+                                 obstacle.x + obstacle.width, obstacle.y + obstacle.height)
+
     def _generate_meaningful_map(self):
         """의미있는 맵 구조 생성"""
         # 1. 외곽 경계벽 생성
@@ -186,6 +190,31 @@ class ObstacleManager:
         # 5. 전술적 엄폐물
         self._create_tactical_cover()
 
+    def _create_map_regions(self):
+        """맵 생성 구획과 같은 구역 구분 - 앞에 있는 구역이 겹치는 영역을 차지"""
+        center_x = WORLD_WIDTH // 2
+        center_y = WORLD_HEIGHT // 2
+        complex_half = 250   # 중앙 복합체 (건물 간격 100 + 건물 120 + 여유)
+        corridor_half = 100  # 십자 통로 폭의 절반
+
+        return [
+            ("central_complex", pygame.Rect(center_x - complex_half, center_y - complex_half,
+                                            complex_half * 2, complex_half * 2)),
+            ("north_corridor", pygame.Rect(center_x - corridor_half, 0,
+                                           corridor_half * 2, center_y - complex_half)),
+            ("south_corridor", pygame.Rect(center_x - corridor_half, center_y + complex_half,
+                                           corridor_half * 2, WORLD_HEIGHT - center_y - complex_half)),
+            ("west_corridor", pygame.Rect(0, center_y - corridor_half,
+                                          center_x - complex_half, corridor_half * 2)),
+            ("east_corridor", pygame.Rect(center_x + complex_half, center_y - corridor_half,
+                                          WORLD_WIDTH - center_x - complex_half, corridor_half * 2)),
+            ("factory", pygame.Rect(0, 0, center_x, center_y)),                    # 좌상단
+            ("warehouse", pygame.Rect(center_x, 0, WORLD_WIDTH - center_x, center_y)),  # 우상단
+            ("maze", pygame.Rect(0, center_y, center_x, WORLD_HEIGHT - center_y)),  # 좌하단
+            ("open_area", pygame.Rect(center_x, center_y,
+                                      WORLD_WIDTH - center_x, WORLD_HEIGHT - center_y)),  # 우하단
+        ]
+
     def _create_boundary_walls(self):
         """외곽 경계벽 - 두껍게"""
         wall_thickness = 30
@@ -402,11 +431,21 @@ class ObstacleManager:
     def update(self):
         """장애물 업데이트"""
         for obstacle in self.obstacles:
-            obstacle.update()
+            # 피격된 장애물은 정적 레이어에서 다시 그림
+            if obstacle.needs_redraw:
+                self.static_layer.invalidate(obstacle)
+                obstacle.needs_redraw = False
+
+            # 파괴된 장애물은 파괴 효과를 남기고 인덱스와 정적 레이어에서 제거
+            if obstacle.destroyed and obstacle in self.grid:
+                obstacle.create_destruction_effect(self.particles)
+                self.grid.remove(obstacle)
+                self.static_layer.remove(obstacle)
+                self.version += 1
 
     def check_collision_circle(self, x, y, radius):
         """원형 충돌 체크 (플레이어, 적군용)"""
-        for obstacle in self.obstacles:
+        for obstacle in self.grid.query_radius(x, y, radius):
             if not obstacle.destroyed:
                 if obstacle.check_collision_with_circle(x, y, radius):
                     return obstacle
@@ -414,46 +453,46 @@ class ObstacleManager:
 
     def check_collision_rect(self, rect):
         """사각형 충돌 체크 (총알용)"""
-        for obstacle in self.obstacles:
+        for obstacle in self.grid.query(rect.left, rect.top, rect.right, rect.bottom):
             if not obstacle.destroyed:
                 if obstacle.check_collision_with_rect(rect):
                     return obstacle
         return None
 
     def check_line_collision(self, start_x, start_y, end_x, end_y):
-        """선분 충돌 체크 (AI 시야용) - 개선된 버전"""
-        for obstacle in self.obstacles:
-            if not obstacle.destroyed:
-                if self._line_rect_collision(start_x, start_y, end_x, end_y, obstacle.get_rect()):
-                    return True
+        """선분 충돌 체크 (AI 시야용) - 선분이 지나는 셀만 DDA로 순회"""
+        checked = set()
+        for key in self.grid.traverse_segment(start_x, start_y, end_x, end_y):
+            for obstacle in self.grid.cell_items(key):
+                if id(obstacle) in checked:
+                    continue
+                checked.add(id(obstacle))
+                if not obstacle.destroyed:
+                    if obstacle.check_collision_with_segment(start_x, start_y, end_x, end_y):
+                        return True
         return False
 
-    def _line_rect_collision(self, x1, y1, x2, y2, rect):
-        """선분과 사각형의 충돌 검사 - 개선된 알고리즘"""
-        # 선분의 양 끝점이 사각형 안에 있는지 체크
-        if rect.collidepoint(x1, y1) or rect.collidepoint(x2, y2):
-            return True
-
-        # 선분이 사각형의 각 변과 교차하는지 체크
-        # 간단한 바운딩 박스 체크로 최적화
-        min_x, max_x = min(x1, x2), max(x1, x2)
-        min_y, max_y = min(y1, y2), max(y1, y2)
-
-        # 바운딩 박스가 겹치지 않으면 충돌 없음
-        if (max_x < rect.left or min_x > rect.right or
-                max_y < rect.top or min_y > rect.bottom):
-            return False
-
-        # 더 정확한 선분-사각형 교차 검사가 필요하면 여기서 구현
-        # 현재는 간단한 버전으로 처리
-        return True
+    def sweep_collision(self, start_x, start_y, end_x, end_y, padding=0):
+        """이동 선분에서 가장 먼저 닿는 장애물 (padding만큼 두꺼운 선분) - (장애물, t) 반환"""
+        hit_obstacle = None
+        hit_t = None
+        for obstacle in self.grid.query(min(start_x, end_x) - padding, min(start_y, end_y) - padding,
+                                        max(start_x, end_x) + padding, max(start_y, end_y) + padding):
+            if not obstacle.destroyed:
+                t = segment_rect_entry(start_x, start_y, end_x, end_y,
+                                       obstacle.x - padding, obstacle.y - padding,
+                                       obstacle.x + obstacle.width + padding,
+                                       obstacle.y + obstacle.height + padding)
+                if t is not None and (hit_t is None or t < hit_t):
+                    hit_obstacle, hit_t = obstacle, t
+        return hit_obstacle, hit_t
 
     def get_obstacles_in_area(self, x, y, width, height):
         """특정 영역의 장애물 반환"""
         area_rect = pygame.Rect(x, y, width, height)
         result = []
 
-        for obstacle in self.obstacles:
+        for obstacle in self.grid.query(x, y, x + width, y + height):
             if not obstacle.destroyed:
                 if obstacle.get_rect().colliderect(area_rect):
                     result.append(obstacle)
@@ -461,9 +500,8 @@ class ObstacleManager:
         return result
 
     def draw(self, screen, camera):
-        """모든 장애물 그리기"""
-        for obstacle in self.obstacles:
-            obstacle.draw(screen, camera)
+        """모든 장애물 그리기 (화면에 걸치는 정적 레이어 청크만 blit)"""
+        self.static_layer.draw(screen, camera)
 
     def get_obstacles(self):
         """살아있는 장애물들 반환"""
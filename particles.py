@@ -0,0 +1,162 @@
+# particles.py - 통합 파티클 엔진 (고정 크기 풀, 배열 기반)
+
+import math
+import numpy as np
+from config import *
+from surface_cache import surface_cache
+
+
+class ParticleSystem:
+    """모든 파티클을 미리 할당된 배열 하나에 모아 일괄 업데이트/그리기"""
+
+    def __init__(self, capacity, rng):
+        self.capacity = capacity
+        self.rng = rng  # 묶음 생성에 쓰는 난수 (rng.cosmetic)
+        self.count = 0
+        self.dropped = 0  # 풀이 가득 차서 버린 파티클 수
+
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.drag = np.ones(capacity)       # 프레임당 속도 감쇠 배율
+        self.gravity = np.zeros(capacity)   # 프레임당 vy 변화량
+        self.life = np.zeros(capacity)
+        self.max_life = np.ones(capacity)
+        self.size = np.zeros(capacity)
+        self.alpha_scale = np.ones(capacity)
+        self.twinkle = np.full(capacity, -1.0)  # 깜빡임 위상 (-1 = 깜빡이지 않음)
+        self.start_color = np.zeros((capacity, 3))
+        self.end_color = np.zeros((capacity, 3))
+
+    def emit(self, x, y, vx, vy, life, size, color, drag=1.0, gravity=0.0,
+             end_color=None, alpha_scale=1.0, twinkle=-1, max_life=None):
+        """파티클 하나 생성 (풀이 가득 차면 버림)"""
+        if self.count >= self.capacity:
+            self.dropped += 1
+            return False
+
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.drag[i] = drag
+        self.gravity[i] = gravity
+        self.life[i] = life
+        self.max_life[i] = max_life if max_life is not None else life
+        self.size[i] = size
+        self.alpha_scale[i] = alpha_scale
+        self.twinkle[i] = twinkle
+        self.start_color[i] = color
+        self.end_color[i] = end_color if end_color is not None else color
+        self.count += 1
+        return True
+
+    def emit_burst(self, x, y, count, speed_range, life, size_range, color, drag=1.0,
+                   spread_x=0, spread_y=0):
+        """원형으로 퍼지는 파티클 묶음 생성"""
+        random = self.rng.cosmetic
+        for _ in range(count):
+            angle = random.uniform(0, 2 * math.pi)
+            speed = random.uniform(*speed_range)
+            self.emit(x + random.uniform(-spread_x, spread_x),
+                      y + random.uniform(-spread_y, spread_y),
+                      math.cos(angle) * speed, math.sin(angle) * speed,
+                      life, random.uniform(*size_range), color, drag=drag)
+
+    def update(self):
+        """모든 파티클을 한 번에 이동시키고 수명이 다한 것은 제거"""
+        n = self.count
+        if n == 0:
+            return
+
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.vx[:n] *= self.drag[:n]
+        self.vy[:n] *= self.drag[:n]
+        self.vy[:n] += self.gravity[:n]
+        self.life[:n] -= 1
+
+        twinkle = self.twinkle[:n]
+        twinkling = twinkle >= 0
+        twinkle[twinkling] = (twinkle[twinkling] + 1) % 120
+
+        alive = self.life[:n] > 0
+        survivors = int(np.count_nonzero(alive))
+        if survivors < n:
+            # 살아있는 파티클을 앞쪽으로 모음 (순서 유지)
+            for array in (self.x, self.y, self.vx, self.vy, self.drag, self.gravity,
+                          self.life, self.max_life, self.size, self.alpha_scale,
+                          self.twinkle, self.start_color, self.end_color):
+                array[:survivors] = array[:n][alive]
+            self.count = survivors
+
+    def draw(self, screen, camera=None):
+        """보이는 파티클을 한 번의 blits 호출로 그리기 (camera가 없으면 화면 좌표)"""
+        n = self.count
+        if n == 0:
+            return
+
+        size = self.size[:n]
+        if camera is not None:
+            offset_x = camera.shake_x - camera.view_x
+            offset_y = camera.shake_y - camera.view_y
+        else:
+            offset_x = offset_y = 0
+        screen_x = self.x[:n] + offset_x - size
+        screen_y = self.y[:n] + offset_y - size
+
+        ratio = self.life[:n] / self.max_life[:n]
+        alpha = 255 * ratio * self.alpha_scale[:n]
+        twinkle = self.twinkle[:n]
+        alpha = np.where(twinkle >= 0, alpha * (np.sin(twinkle * 0.1) * 0.5 + 0.5), alpha)
+        alpha = alpha.astype(np.int32)
+
+        margin = 50
+        visible = ((alpha > 0) &
+                   (screen_x >= -margin) & (screen_x <= SCREEN_WIDTH + margin) &
+                   (screen_y >= -margin) & (screen_y <= SCREEN_HEIGHT + margin))
+
+        # 색이 변하는 파티클은 색상을 단계로 묶어서 서피스 캐시 적중률 유지
+        start_color = self.start_color[:n]
+        end_color = self.end_color[:n]
+        colors = end_color + (start_color - end_color) * ratio[:, None]
+        fading = np.any(start_color != end_color, axis=1)
+        colors[fading] = np.round(colors[fading] / PARTICLE_COLOR_STEP) * PARTICLE_COLOR_STEP
+        colors = np.clip(colors, 0, 255).astype(np.int32)
+        diameters = (size * 2).astype(np.int32)
+
+        visible &= diameters > 0
+        get_surface = surface_cache.filled
+        blit_list = [(get_surface(diameter, tuple(color), alpha_value), (x, y))
+                     for diameter, color, alpha_value, x, y in zip(diameters[visible].tolist(),
+                                                                   colors[visible].tolist(),
+                                                                   alpha[visible].tolist(),
+                                                                   screen_x[visible].tolist(),
+                                                                   screen_y[visible].tolist())]
+        screen.blits(blit_list, doreturn=False)
+
+    def clear(self):
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+
+class NullParticles:
+    """그릴 렌더러가 없을 때 (헤드리스, 벤치, 리플레이) 쓰는 빈 파티클 풀"""
+    count = 0
+
+    def emit(self, *args, **kwargs):
+        return False
+
+    def emit_burst(self, *args, **kwargs):
+        pass
+
+    def __len__(self):
+        return 0
+
+
+# 렌더러가 없는 시뮬레이션의 기본값
+null_particles = NullParticles()
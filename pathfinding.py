@@ -0,0 +1,375 @@
+# pathfinding.py - 맵 구역 단위 계층형 A* (순찰/수색 경로, 요청은 틱마다 정해진 수만 처리)
+
+import heapq
+import math
+from collections import deque
+import numpy as np
+from config import *
+
+ORTHOGONAL_COST = 10
+DIAGONAL_COST = 14
+
+
+class PathRequest:
+    """비동기 경로 요청 - PathService가 처리하면 done이 되고 waypoints에 결과 (실패하면 None)"""
+    __slots__ = ('start', 'goal', 'done', 'cancelled', 'waypoints')
+
+    def __init__(self, start, goal):
+        self.start = start
+        self.goal = goal
+        self.done = False
+        self.cancelled = False
+        self.waypoints = None
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class PathService:
+    """NavGrid 위의 계층형 A* 경로 서비스
+
+    상위 계층은 ObstacleManager의 맵 구역(중앙 복합체, 통로, 4개 구역)과 구역 경계의 포털,
+    하위 계층은 구역 안으로 제한한 격자 A*
+    구역 간 포털 순서는 (출발 구역, 도착 구역)으로, 포털 사이 구간 경로는 포털 쌍으로 캐시
+    """
+
+    def __init__(self, nav_grid, query_budget=NAV_PATH_QUERY_BUDGET):
+        self.grid = nav_grid
+        self.query_budget = query_budget  # 틱마다 처리하는 요청 수
+        self.pending = deque()
+        self.grid_version = None
+
+        # 테두리 한 칸을 덧댄 1차원 셀 인덱스 (FlowField와 같은 배치)
+        self.stride = nav_grid.cols + 2
+        self.neighbors = []  # (인덱스 오프셋, 비용, 대각선 모서리 오프셋 2개 또는 None)
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)):
+            corners = (dx, dy * self.stride) if dx and dy else None
+            cost = DIAGONAL_COST if corners else ORTHOGONAL_COST
+            self.neighbors.append((dx + dy * self.stride, cost, corners))
+
+        self.labels = []          # 셀별 구역 번호 (막힌 셀과 테두리는 -1)
+        self.components = []      # 셀별 연결 성분 번호 (서로 다르면 경로 없음)
+        self.wall_costs = []      # 셀별 추가 비용 (장애물에 붙은 셀은 벽을 긁지 않도록 비싸게)
+        self.region_cells = []    # 구역별 열린 셀 인덱스
+        self.region_anchors = []  # 구역별 대표 셀 (구역 중심에 가장 가까운 열린 셀)
+        self.region_portals = []  # 구역별 [(이 구역 쪽 셀, 건너편 셀, 건너편 구역)]
+        self.region_neighbors = []
+        self.route_cache = {}     # (출발 구역, 도착 구역) -> [(구역, 나가는 셀, 들어가는 셀)]
+        self.leg_cache = {}       # (구역, 시작 셀, 끝 셀) -> 셀 경로
+
+        # 통계
+        self.queries = 0
+        self.route_hits = 0
+        self.route_misses = 0
+
+    def update(self, obstacle_manager):
+        """격자가 바뀌었으면 구역/포털을 다시 만들고, 대기 중인 요청을 예산만큼 처리"""
+        if self.grid.version != self.grid_version:
+            self._build(obstacle_manager.regions)
+            self.grid_version = self.grid.version
+
+        processed = 0
+        while self.pending and processed < self.query_budget:
+            request = self.pending.popleft()
+            if request.cancelled:
+                continue
+            request.waypoints = self._find_path(request.start, request.goal)
+            request.done = True
+            processed += 1
+            self.queries += 1
+
+    def request(self, start_x, start_y, goal_x, goal_y):
+        """경로 요청을 큐에 넣고 바로 반환 (결과는 이후 틱에 request.done으로 확인)"""
+        request = PathRequest((start_x, start_y), (goal_x, goal_y))
+        self.pending.append(request)
+        return request
+
+    def patrol_point(self, x, y, random_source):
+        """현재 구역이나 이웃 구역의 임의의 열린 지점 (순찰 목표)"""
+        cell = self._free_cell(x, y)
+        if cell is None:
+            return None
+        region = self.labels[cell]
+        target = random_source.choice([region] + self.region_neighbors[region])
+        for _ in range(8):
+            # 장애물 사이에 갇힌 셀은 다시 뽑음
+            candidate = random_source.choice(self.region_cells[target])
+            if self.components[candidate] == self.components[cell]:
+                return self._cell_center(candidate)
+        return None
+
+    def _build(self, regions):
+        """셀마다 구역 번호를 매기고 구역 경계의 열린 구간마다 포털 하나를 둠"""
+        grid = self.grid
+        size = grid.cell_size
+        stride = self.stride
+        centers_x = (np.arange(grid.cols) + 0.5) * size
+        centers_y = (np.arange(grid.rows) + 0.5) * size
+
+        # 앞에 있는 구역이 겹치는 영역을 차지
+        labels = np.full((grid.rows + 2, stride), -1, dtype=np.int32)
+        inner = labels[1:-1, 1:-1]
+        unassigned = np.ones((grid.rows, grid.cols), dtype=bool)
+        for number, (name, rect) in enumerate(regions):
+            inside = np.outer((centers_y >= rect.top) & (centers_y < rect.bottom),
+                              (centers_x >= rect.left) & (centers_x < rect.right)) & unassigned
+            inner[inside] = number
+            unassigned &= ~inside
+        inner[grid.blocked] = -1
+        flat = labels.ravel()
+        self.labels = flat.tolist()
+        self.components = self._label_components(flat >= 0)
+        wall_costs = np.full((grid.rows + 2, stride), NAV_PATH_WALL_PENALTY, dtype=np.int32)
+        wall_costs[1:-1, 1:-1][grid.clear] = 0
+        self.wall_costs = wall_costs.ravel().tolist()
+
+        self.region_cells = []
+        self.region_anchors = []
+        for number, (name, rect) in enumerate(regions):
+            cells = np.flatnonzero(flat == number)
+            self.region_cells.append(cells.tolist())
+            if len(cells) == 0:
+                self.region_anchors.append(None)
+                continue
+            cols = cells % stride - 1
+            rows = cells // stride - 1
+            distance_sq = ((cols + 0.5) * size - rect.centerx) ** 2 + ((rows + 0.5) * size - rect.centery) ** 2
+            self.region_anchors.append(int(cells[np.argmin(distance_sq)]))
+
+        # 가로로 이웃한 경계는 세로로 이어지는 구간, 세로로 이웃한 경계는 가로 구간
+        self.region_portals = [[] for _ in regions]
+        for offset, step in ((1, stride), (stride, 1)):
+            first = flat[:-offset]
+            second = flat[offset:]
+            border = np.flatnonzero((first >= 0) & (second >= 0) & (first != second)).tolist()
+            runs = []
+            open_runs = {}  # (구역 쌍, 다음에 이어질 셀) -> 진행 중인 구간
+            for index in border:
+                key = (self.labels[index], self.labels[index + offset])
+                run = open_runs.pop((key, index), None)
+                if run is None:
+                    run = []
+                    runs.append((key, run))
+                run.append(index)
+                open_runs[(key, index + step)] = run
+
+            for (region_a, region_b), run in runs:
+                cell_a = run[len(run) // 2]
+                cell_b = cell_a + offset
+                self.region_portals[region_a].append((cell_a, cell_b, region_b))
+                self.region_portals[region_b].append((cell_b, cell_a, region_a))
+
+        self.region_neighbors = [sorted({portal[2] for portal in portals})
+                                 for portals in self.region_portals]
+        self.route_cache.clear()
+        self.leg_cache.clear()
+
+    def _label_components(self, free):
+        """열린 셀을 4방향으로 이어진 덩어리별로 번호 매김 (덩어리마다 한 번씩 확장)"""
+        stride = self.stride
+        components = np.full(free.shape, -1, dtype=np.int32)
+        remaining = free.copy()
+        frontier = np.zeros_like(free)
+        grown = np.empty_like(free)
+        number = 0
+        while True:
+            seed = int(remaining.argmax())
+            if not remaining[seed]:
+                break
+            frontier[:] = False
+            frontier[seed] = True
+            remaining[seed] = False
+            components[seed] = number
+            while True:
+                grown[:stride] = False
+                np.copyto(grown[stride:], frontier[:-stride])
+                grown[:-stride] |= frontier[stride:]
+                grown[1:] |= frontier[:-1]
+                grown[:-1] |= frontier[1:]
+                grown &= remaining
+                if not grown.any():
+                    break
+                remaining ^= grown
+                components[grown] = number
+                frontier, grown = grown, frontier
+            number += 1
+        return components.tolist()
+
+    def _cell_center(self, index):
+        col = index % self.stride - 1
+        row = index // self.stride - 1
+        return self.grid.cell_center(col, row)
+
+    def _cell_distance(self, a, b):
+        stride = self.stride
+        return math.hypot(a % stride - b % stride, a // stride - b // stride)
+
+    def _free_cell(self, x, y):
+        """위치가 속한 열린 셀 (장애물에 걸친 셀이면 가장 가까운 열린 이웃)"""
+        col, row = self.grid.cell_of(x, y)
+        index = (row + 1) * self.stride + col + 1
+        if self.labels[index] >= 0:
+            return index
+        best = None
+        best_distance = None
+        for dy in range(-2, 3):
+            for dx in range(-2, 3):
+                candidate = index + dx + dy * self.stride
+                if 0 <= candidate < len(self.labels) and self.labels[candidate] >= 0:
+                    candidate_distance = dx * dx + dy * dy
+                    if best is None or candidate_distance < best_distance:
+                        best, best_distance = candidate, candidate_distance
+        return best
+
+    def _find_path(self, start, goal):
+        """시작 위치에서 목표 위치까지의 웨이포인트 목록 (도달할 수 없으면 None)"""
+        start_cell = self._free_cell(*start)
+        goal_cell = self._free_cell(*goal)
+        if start_cell is None or goal_cell is None:
+            return None
+        if self.components[start_cell] != self.components[goal_cell]:
+            return None  # 갇힌 곳이라 어떤 경로로도 닿지 않음
+
+        start_region = self.labels[start_cell]
+        goal_region = self.labels[goal_cell]
+        if start_region == goal_region:
+            cells = self._leg(start_region, start_cell, goal_cell)
+        else:
+            key = (start_region, goal_region)
+            if key in self.route_cache:
+                self.route_hits += 1
+            else:
+                self.route_misses += 1
+                self.route_cache[key] = self._route(start_region, goal_region)
+            route = self.route_cache[key]
+            if route is None:
+                return None
+
+            # 출발 구간과 마지막 구간만 위치마다 탐색, 포털 사이 구간은 캐시에서
+            cells = []
+            current = start_cell
+            for region, exit_cell, entry_cell in route:
+                leg = self._leg(region, current, exit_cell, cache=current != start_cell)
+                if leg is None:
+                    return None
+                cells.extend(leg)
+                current = entry_cell
+            leg = self._leg(goal_region, current, goal_cell)
+            if leg is None:
+                return None
+            cells.extend(leg)
+
+        if cells is None:
+            return None
+        return self._waypoints(cells, goal, goal_cell)
+
+    def _route(self, start_region, goal_region):
+        """구역 대표 셀 사이를 포털로 잇는 상위 계층 A* - [(구역, 나가는 셀, 들어가는 셀)]"""
+        start = self.region_anchors[start_region]
+        goal = self.region_anchors[goal_region]
+        if start is None or goal is None:
+            return None
+
+        # 상태는 (현재 셀, 현재 구역), 비용은 셀 단위 직선 거리
+        open_heap = [(self._cell_distance(start, goal), 0.0, start, start_region)]
+        came_from = {(start, start_region): None}
+        best_cost = {(start, start_region): 0.0}
+        while open_heap:
+            _, cost, cell, region = heapq.heappop(open_heap)
+            if cost > best_cost[(cell, region)]:
+                continue
+            if region == goal_region:
+                route = []
+                state = (cell, region)
+                while came_from[state] is not None:
+                    previous, exit_cell = came_from[state]
+                    route.append((previous[1], exit_cell, state[0]))
+                    state = previous
+                route.reverse()
+                return route
+
+            for exit_cell, entry_cell, next_region in self.region_portals[region]:
+                state = (entry_cell, next_region)
+                new_cost = cost + self._cell_distance(cell, exit_cell) + 1.0
+                if state not in best_cost or new_cost < best_cost[state]:
+                    best_cost[state] = new_cost
+                    came_from[state] = ((cell, region), exit_cell)
+                    estimate = new_cost + self._cell_distance(entry_cell, goal)
+                    heapq.heappush(open_heap, (estimate, new_cost, entry_cell, next_region))
+        return None
+
+    def _leg(self, region, start, goal, cache=False):
+        """구역 안의 격자 경로 (구역이 장애물로 갈라져 있으면 격자 전체에서 다시 탐색)"""
+        key = (region, start, goal)
+        if cache and key in self.leg_cache:
+            return self.leg_cache[key]
+        cells = self._search(start, goal, region)
+        if cells is None:
+            cells = self._search(start, goal, None)
+        if cache:
+            self.leg_cache[key] = cells
+        return cells
+
+    def _search(self, start, goal, region):
+        """8방향 격자 A* (모서리 통과 금지) - region이 None이 아니면 그 구역 셀과 목표 셀만 지남"""
+        if start == goal:
+            return [start]
+
+        labels = self.labels
+        wall_costs = self.wall_costs
+        stride = self.stride
+        goal_col = goal % stride
+        goal_row = goal // stride
+
+        def heuristic(index):
+            dx = abs(index % stride - goal_col)
+            dy = abs(index // stride - goal_row)
+            return ORTHOGONAL_COST * max(dx, dy) + (DIAGONAL_COST - ORTHOGONAL_COST) * min(dx, dy)
+
+        open_heap = [(heuristic(start), 0, start)]
+        came_from = {start: None}
+        best_cost = {start: 0}
+        expansions = 0
+        while open_heap:
+            _, cost, current = heapq.heappop(open_heap)
+            if current == goal:
+                break
+            if cost > best_cost[current]:
+                continue
+            expansions += 1
+            if expansions > NAV_PATH_MAX_EXPANSIONS:
+                return None
+
+            for offset, step_cost, corners in self.neighbors:
+                neighbor = current + offset
+                label = labels[neighbor]
+                if label < 0 or (region is not None and label != region and neighbor != goal):
+                    continue
+                if corners is not None and (labels[current + corners[0]] < 0 or
+                                            labels[current + corners[1]] < 0):
+                    continue
+                new_cost = cost + step_cost + wall_costs[neighbor]
+                if neighbor not in best_cost or new_cost < best_cost[neighbor]:
+                    best_cost[neighbor] = new_cost
+                    came_from[neighbor] = current
+                    heapq.heappush(open_heap, (new_cost + heuristic(neighbor), new_cost, neighbor))
+        else:
+            return None
+
+        cells = []
+        current = goal
+        while current is not None:
+            cells.append(current)
+            current = came_from[current]
+        cells.reverse()
+        return cells
+
+    def _waypoints(self, cells, goal, goal_cell):
+        """셀 경로에서 방향이 꺾이는 셀만 남긴 월드 좌표 목록 (마지막은 실제 목표 위치)"""
+        waypoints = []
+        for previous, current, following in zip(cells, cells[1:], cells[2:]):
+            if current - previous != following - current:
+                waypoints.append(self._cell_center(current))
+        waypoints.append(goal if self.labels[goal_cell] >= 0 and
+                         self._free_cell(*goal) == goal_cell else self._cell_center(goal_cell))
+        return waypoints
@@ -2,16 +2,21 @@
 
 import pygame
 import math
-import random
 from config import *
 from utils import *
 from weapon import WeaponManager
+from particles import null_particles
+from surface_cache import surface_cache
 
 
 class Player:
-    def __init__(self, x, y):
+    def __init__(self, x, y, rng, particles=null_particles):
+        self.rng = rng  # 발사 효과 등 연출은 rng.cosmetic
+        self.particles = particles  # 월드 파티클 풀 (렌더러가 없으면 빈 풀)
         self.x = x
         self.y = y
+        self.prev_x = x  # 직전 틱 위치 (렌더링 보간용)
+        self.prev_y = y
         self.size = PLAYER_SIZE
         self.speed = PLAYER_SPEED
         self.trail = []
@@ -25,7 +30,6 @@ class Player:
         # 점멸 관련 (즉시 실행)
         self.blink_cooldown = 0
         self.blink_max_cooldown = BLINK_COOLDOWN
-        self.blink_particles = []
         self.afterimage_effects = []
 
         # 대시 관련
@@ -48,10 +52,12 @@ class Player:
 
         # 애니메이션 효과
         self.power_aura = 0
-        self.combat_particles = []
         self.hit_flash = 0  # 피격 시 깜빡임
 
-    def update(self, keys, mouse_buttons, mouse_pos, bullet_manager, enemies, camera, obstacle_manager):
+    def update(self, keys, mouse_buttons, world_mouse_pos, bullet_manager, enemies, camera, obstacle_manager):
+        """한 틱 진행 (마우스 위치는 월드 좌표)"""
+        self.prev_x, self.prev_y = self.x, self.y
+
         # 쿨다운 업데이트
         if self.blink_cooldown > 0:
             self.blink_cooldown -= 1
@@ -72,7 +78,6 @@ class Player:
             self.dash_duration -= 1
 
         # 스킬 및 공격 처리
-        world_mouse_pos = camera.screen_to_world(mouse_pos[0], mouse_pos[1])
         self._handle_skills(keys, mouse_buttons, world_mouse_pos, bullet_manager, enemies, camera, obstacle_manager)
 
         # 기본 이동
@@ -150,8 +155,9 @@ class Player:
         # 출발지 파티클 폭발
         self._create_blink_exit_effect()
 
-        # 순간이동 실행
+        # 순간이동 실행 (보간 없이 바로 도착 지점에 그림)
         self.x, self.y = target_pos
+        self.prev_x, self.prev_y = self.x, self.y
 
         # 도착지 파티클 폭발
         self._create_blink_arrival_effect()
@@ -164,35 +170,13 @@ class Player:
 
     def _create_blink_exit_effect(self):
         """점멸 출발 효과"""
-        for _ in range(PARTICLE_COUNT_HIGH):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(3, 8)
-            self.blink_particles.append({
-                'x': self.x,
-                'y': self.y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'life': 40,
-                'max_life': 40,
-                'size': random.uniform(3, 6),
-                'color': PURPLE
-            })
+        self.particles.emit_burst(self.x, self.y, PARTICLE_COUNT_HIGH, (3, 8), 40, (3, 6),
+                                  PURPLE, drag=0.96)
 
     def _create_blink_arrival_effect(self):
         """점멸 도착 효과"""
-        for _ in range(PARTICLE_COUNT_HIGH):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 6)
-            self.blink_particles.append({
-                'x': self.x + random.uniform(-20, 20),
-                'y': self.y + random.uniform(-20, 20),
-                'vx': math.cos(angle) * speed * 0.5,
-                'vy': math.sin(angle) * speed * 0.5,
-                'life': 35,
-                'max_life': 35,
-                'size': random.uniform(2, 5),
-                'color': CYAN
-            })
+        self.particles.emit_burst(self.x, self.y, PARTICLE_COUNT_HIGH, (1, 3), 35, (2, 5),
+                                  CYAN, drag=0.96, spread_x=20, spread_y=20)
 
     def _create_shoot_effect(self):
         """총 발사 효과"""
@@ -204,19 +188,12 @@ class Player:
         if weapon_info['name'] == 'Sniper':
             particle_count = 20
 
+        random = self.rng.cosmetic
         for _ in range(particle_count):
             angle = random.uniform(-0.8, 0.8)
             speed = random.uniform(2, 6)
-            self.combat_particles.append({
-                'x': self.x,
-                'y': self.y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'life': 15,
-                'max_life': 15,
-                'size': random.uniform(2, 5),
-                'color': weapon_info['color']
-            })
+            self.particles.emit(self.x, self.y, math.cos(angle) * speed, math.sin(angle) * speed,
+                                15, random.uniform(2, 5), weapon_info['color'], drag=0.98)
 
     def _create_dash_effect(self):
         """대시 효과"""
@@ -281,19 +258,7 @@ class Player:
         self.hit_flash = 20
 
         # 피격 효과
-        for _ in range(10):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 5)
-            self.combat_particles.append({
-                'x': self.x,
-                'y': self.y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'life': 20,
-                'max_life': 20,
-                'size': random.uniform(2, 4),
-                'color': RED
-            })
+        self.particles.emit_burst(self.x, self.y, 10, (2, 5), 20, (2, 4), RED, drag=0.98)
 
     def is_dead(self):
         return self.hp <= 0
@@ -306,17 +271,6 @@ class Player:
         if len(self.trail) > trail_length:
             self.trail.pop(0)
 
-        # 점멸 파티클 업데이트
-        for particle in self.blink_particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['life'] -= 1
-            particle['vx'] *= 0.96
-            particle['vy'] *= 0.96
-
-            if particle['life'] <= 0:
-                self.blink_particles.remove(particle)
-
         # 잔상 효과 업데이트
         for afterimage in self.afterimage_effects[:]:
             afterimage['life'] -= 1
@@ -324,16 +278,6 @@ class Player:
             if afterimage['life'] <= 0 or afterimage['alpha'] <= 0:
                 self.afterimage_effects.remove(afterimage)
 
-        # 전투 파티클 업데이트
-        for particle in self.combat_particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['life'] -= 1
-            particle['vx'] *= 0.98
-            particle['vy'] *= 0.98
-            if particle['life'] <= 0:
-                self.combat_particles.remove(particle)
-
         # 폭발 효과 업데이트
         self._update_explosions()
 
@@ -341,20 +285,23 @@ class Player:
         if self.power_aura > 0:
             self.power_aura -= 2
 
-    def _create_explosion(self, enemies, camera):
+    def _create_explosion(self, enemies, camera, position=None):
+        """폭발 생성 (위치를 주지 않으면 플레이어 위치)"""
+        x, y = position if position is not None else (self.x, self.y)
         explosion = {
-            'x': self.x,
-            'y': self.y,
+            'x': x,
+            'y': y,
             'radius': 0,
             'max_radius': EXPLOSION_RADIUS,
-            'duration': EXPLOSION_DURATION,
-            'particles': create_explosion_particles((self.x, self.y), PARTICLE_COUNT_HIGH)
+            'duration': EXPLOSION_DURATION
         }
         self.explosion_effects.append(explosion)
+        self.particles.emit_burst(x, y, PARTICLE_COUNT_HIGH, (2, 7), 60, (2, 6),
+                                  ORANGE, drag=0.95)
 
         # 적군에게 데미지
         for enemy in enemies:
-            dist = distance((self.x, self.y), (enemy.x, enemy.y))
+            dist = distance((x, y), (enemy.x, enemy.y))
             if dist <= EXPLOSION_RADIUS:
                 enemy.take_damage(EXPLOSION_DAMAGE)
 
@@ -367,17 +314,6 @@ class Player:
             explosion['radius'] = (explosion['max_radius'] *
                                    (1 - explosion['duration'] / EXPLOSION_DURATION))
 
-            # 파티클 업데이트
-            for particle in explosion['particles'][:]:
-                particle['x'] += particle['vx']
-                particle['y'] += particle['vy']
-                particle['life'] -= 1
-                particle['vx'] *= 0.95
-                particle['vy'] *= 0.95
-
-                if particle['life'] <= 0:
-                    explosion['particles'].remove(particle)
-
             if explosion['duration'] <= 0:
                 self.explosion_effects.remove(explosion)
 
@@ -388,15 +324,9 @@ class Player:
 
         screen_x, screen_y = camera.world_to_screen(self.x, self.y)
 
-        # 점멸 관련 효과 그리기
-        self._draw_blink_effects(screen, camera)
-
-        # 폭발 효과 그리기
+        # 폭발 효과 그리기 (파티클은 렌더러의 월드 파티클 풀에서 일괄 처리)
         self._draw_explosions(screen, camera)
 
-        # 전투 파티클 그리기
-        self._draw_combat_particles(screen, camera)
-
         # 잔상 효과 그리기
         self._draw_afterimages(screen, camera)
 
@@ -409,40 +339,15 @@ class Player:
         # 점멸 범위 표시
         self._draw_blink_range(screen, camera)
 
-    def _draw_blink_effects(self, screen, camera):
-        # 점멸 파티클
-        for particle in self.blink_particles:
-            if camera.is_visible(particle['x'], particle['y']):
-                screen_x, screen_y = camera.world_to_screen(particle['x'], particle['y'])
-                alpha = int(255 * (particle['life'] / particle['max_life']))
-                if alpha > 0:
-                    particle_surface = pygame.Surface((int(particle['size'] * 2), int(particle['size'] * 2)))
-                    particle_surface.set_alpha(alpha)
-                    particle_surface.fill(particle['color'])
-                    screen.blit(particle_surface, (screen_x - particle['size'], screen_y - particle['size']))
-
     def _draw_afterimages(self, screen, camera):
         for afterimage in self.afterimage_effects:
             if camera.is_visible(afterimage['x'], afterimage['y']):
                 screen_x, screen_y = camera.world_to_screen(afterimage['x'], afterimage['y'])
                 if afterimage['alpha'] > 0:
-                    afterimage_surface = pygame.Surface((afterimage['size'], afterimage['size']))
-                    afterimage_surface.set_alpha(afterimage['alpha'])
-                    afterimage_surface.fill(PURPLE)
+                    afterimage_surface = surface_cache.filled(afterimage['size'], PURPLE, afterimage['alpha'])
                     screen.blit(afterimage_surface,
                                 (screen_x - afterimage['size'] // 2, screen_y - afterimage['size'] // 2))
 
-    def _draw_combat_particles(self, screen, camera):
-        for particle in self.combat_particles:
-            if camera.is_visible(particle['x'], particle['y']):
-                screen_x, screen_y = camera.world_to_screen(particle['x'], particle['y'])
-                alpha = int(255 * (particle['life'] / particle['max_life']))
-                if alpha > 0:
-                    particle_surface = pygame.Surface((int(particle['size'] * 2), int(particle['size'] * 2)))
-                    particle_surface.set_alpha(alpha)
-                    particle_surface.fill(particle['color'])
-                    screen.blit(particle_surface, (screen_x - particle['size'], screen_y - particle['size']))
-
     def _draw_explosions(self, screen, camera):
         for explosion in self.explosion_effects:
             if camera.is_visible(explosion['x'], explosion['y'], explosion['radius']):
@@ -454,18 +359,6 @@ class Player:
                     draw_circle_outline(screen, ORANGE, (int(screen_x), int(screen_y)),
                                         int(explosion['radius']), 5, alpha)
 
-                # 폭발 파티클 그리기
-                for particle in explosion['particles']:
-                    if camera.is_visible(particle['x'], particle['y']):
-                        p_screen_x, p_screen_y = camera.world_to_screen(particle['x'], particle['y'])
-                        alpha = int(255 * (particle['life'] / particle['max_life']))
-                        if alpha > 0:
-                            particle_surface = pygame.Surface((int(particle['size'] * 2), int(particle['size'] * 2)))
-                            particle_surface.set_alpha(alpha)
-                            particle_surface.fill(ORANGE)
-                            screen.blit(particle_surface, (p_screen_x - particle['size'],
-                                                           p_screen_y - particle['size']))
-
     def _draw_trail(self, screen, camera):
         for i, (trail_x, trail_y) in enumerate(self.trail):
             if camera.is_visible(trail_x, trail_y):
@@ -473,13 +366,12 @@ class Player:
                 alpha = int(255 * (i / len(self.trail)) * 0.5)
                 trail_color = RED if self.dash_duration > 0 else CYAN
 
-                trail_surface = pygame.Surface((self.size, self.size))
-                trail_surface.set_alpha(alpha)
-                trail_surface.fill(trail_color)
+                trail_surface = surface_cache.filled(self.size, trail_color, alpha)
                 screen.blit(trail_surface, (screen_x - self.size // 2, screen_y - self.size // 2))
 
     def _draw_player(self, screen, camera):
-        screen_x, screen_y = camera.world_to_screen(self.x, self.y)
+        screen_x, screen_y = camera.world_to_screen(*camera.lerp_position(self.prev_x, self.prev_y,
+                                                                           self.x, self.y))
 
         # 피격 시 깜빡임 효과
         if self.hit_flash > 0 and self.hit_flash % 6 < 3:
@@ -488,16 +380,12 @@ class Player:
         # 파워 오라 (대시 중)
         if self.power_aura > 0:
             aura_alpha = int(self.power_aura * 2)
-            aura_surface = pygame.Surface((self.size + 30, self.size + 30))
-            aura_surface.set_alpha(aura_alpha)
-            aura_surface.fill(RED)
+            aura_surface = surface_cache.filled(self.size + 30, RED, aura_alpha)
             screen.blit(aura_surface, (screen_x - self.size // 2 - 15, screen_y - self.size // 2 - 15))
 
         # 무적 상태 글로우
         if self.invincible_time > 0:
-            invincible_surface = pygame.Surface((self.size + 15, self.size + 15))
-            invincible_surface.set_alpha(100)
-            invincible_surface.fill(BLUE)
+            invincible_surface = surface_cache.filled(self.size + 15, BLUE, 100)
             screen.blit(invincible_surface, (screen_x - self.size // 2 - 7, screen_y - self.size // 2 - 7))
 
         # 그림자
@@ -509,9 +397,7 @@ class Player:
 
         # 대시 글로우 효과
         if self.dash_duration > 0:
-            glow_surface = pygame.Surface((self.size + 20, self.size + 20))
-            glow_surface.set_alpha(150)
-            glow_surface.fill(RED)
+            glow_surface = surface_cache.filled(self.size + 20, RED, 150)
             screen.blit(glow_surface, (screen_x - self.size // 2 - 10, screen_y - self.size // 2 - 10))
 
         # 메인 플레이어
@@ -529,7 +415,8 @@ class Player:
         """점멸 범위 표시 (우클릭 중일 때만)"""
         mouse_buttons = pygame.mouse.get_pressed()
         if mouse_buttons[2] and self.blink_cooldown == 0:  # 우클릭 중
-            screen_x, screen_y = camera.world_to_screen(self.x, self.y)
+            screen_x, screen_y = camera.world_to_screen(*camera.lerp_position(self.prev_x, self.prev_y,
+                                                                               self.x, self.y))
             mouse_pos = pygame.mouse.get_pos()
             world_mouse_pos = camera.screen_to_world(mouse_pos[0], mouse_pos[1])
             target_dist = distance((self.x, self.y), world_mouse_pos)
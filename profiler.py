@@ -0,0 +1,103 @@
+# profiler.py - 서브시스템별 구간 시간 측정 (벤치마크, 프로파일러 오버레이용)
+
+from collections import deque
+from time import perf_counter
+import numpy as np
+
+
+class _Section:
+    """with 블록 하나의 시간을 재서 프로파일러에 더함"""
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.add(self.name, perf_counter() - self.start)
+        return False
+
+
+class _NullSection:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class Profiler:
+    """프레임(또는 틱)마다 구간별 시간을 모아 최근 history개를 보관"""
+
+    def __init__(self, history=None):
+        self.frames = deque(maxlen=history)  # 프레임별 {구간 이름: 초} (history가 None이면 전부 보관)
+        self.current = {}
+        self.names = []                      # 처음 측정된 순서 (그래프 쌓는 순서)
+        self.frame_count = 0                 # 지금까지 기록한 프레임 수 (오버레이가 새 프레임을 찾는 데 사용)
+
+    def section(self, name):
+        """with profiler.section('enemies'): ... 형태로 구간 측정"""
+        return _Section(self, name)
+
+    def add(self, name, seconds):
+        current = self.current
+        if name in current:
+            current[name] += seconds
+        else:
+            current[name] = seconds
+            if name not in self.names:
+                self.names.append(name)
+
+    def end_frame(self):
+        """이번 프레임 측정을 기록으로 넘김"""
+        self.frames.append(self.current)
+        self.current = {}
+        self.frame_count += 1
+
+    def reset(self):
+        self.frames.clear()
+        self.current = {}
+        self.frame_count = 0
+
+    def series(self, name):
+        """구간 하나의 프레임별 시간 (초, 측정 안 된 프레임은 0)"""
+        return [frame.get(name, 0.0) for frame in self.frames]
+
+    def summary(self):
+        """구간별 평균 / p95 / p99 / 최대 (밀리초)"""
+        result = {}
+        for name in self.names:
+            samples = np.array(self.series(name)) * 1000.0
+            if len(samples) == 0:
+                continue
+            result[name] = {
+                'mean_ms': float(samples.mean()),
+                'p95_ms': float(np.percentile(samples, 95)),
+                'p99_ms': float(np.percentile(samples, 99)),
+                'max_ms': float(samples.max()),
+            }
+        return result
+
+
+class NullProfiler:
+    """측정하지 않을 때 쓰는 빈 프로파일러 (구간 호출 비용만 남음)"""
+    _section = _NullSection()
+
+    def section(self, name):
+        return self._section
+
+    def add(self, name, seconds):
+        pass
+
+    def end_frame(self):
+        pass
+
+
+# 프로파일링을 끈 상태의 기본값
+null_profiler = NullProfiler()
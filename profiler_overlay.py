@@ -0,0 +1,126 @@
+# profiler_overlay.py - 게임 내 프로파일러 오버레이 (서브시스템별 누적 막대 그래프 + 엔티티 수)
+
+import pygame
+from config import *
+from text_cache import text_cache
+from ui import RetainedPanel
+
+# 구간별 그래프 색상 (구간이 처음 측정된 순서대로 배정)
+SECTION_COLORS = [
+    (255, 99, 71), (255, 165, 0), (255, 215, 0), (154, 205, 50), (60, 179, 113),
+    (64, 224, 208), (30, 144, 255), (123, 104, 238), (218, 112, 214), (255, 105, 180),
+    (205, 133, 63), (176, 196, 222), (240, 230, 140), (127, 255, 212), (221, 160, 221),
+    (250, 128, 114), (100, 149, 237), (189, 183, 107), (144, 238, 144), (211, 211, 211),
+]
+
+
+class ProfilerOverlay:
+    """최근 몇 초간의 프레임 시간을 구간별로 쌓아 그리는 그래프
+
+    그래프는 새 프레임이 들어올 때마다 왼쪽으로 스크롤하고 새 열만 그림
+    범례와 엔티티 수는 PROFILER_LEGEND_INTERVAL 프레임마다만 다시 합성
+    """
+
+    def __init__(self, position=(10, 80)):
+        x, y = position
+        self.graph_rect = pygame.Rect(x, y, PROFILER_GRAPH_WIDTH, PROFILER_GRAPH_HEIGHT)
+        self.graph = pygame.Surface(self.graph_rect.size)
+        self.graph.set_alpha(210)
+        self.legend = RetainedPanel((x, y + PROFILER_GRAPH_HEIGHT, PROFILER_GRAPH_WIDTH, 190))
+        self.font_size = 18
+        self.colors = {}
+        self.plotted = 0         # 그래프에 그린 프로파일러 프레임 수
+        self.legend_timer = 0
+        self.legend_key = None
+        self.peak_surfaces = 0   # 범례 갱신 간격 동안 한 프레임에 새로 만든 서피스 최대 수
+        self.reset()
+
+    def reset(self):
+        self.graph.fill((15, 15, 25))
+        self.plotted = 0
+        self.legend_timer = 0
+        self.legend_key = None
+        self.peak_surfaces = 0
+        self.legend.invalidate()
+
+    def _color(self, name):
+        color = self.colors.get(name)
+        if color is None:
+            color = SECTION_COLORS[len(self.colors) % len(SECTION_COLORS)]
+            self.colors[name] = color
+        return color
+
+    def _plot_frame(self, frame, names):
+        """그래프를 한 열만큼 스크롤하고 오른쪽 끝에 프레임 하나를 쌓아 그림"""
+        graph = self.graph
+        width, height = graph.get_size()
+        column = PROFILER_COLUMN_WIDTH
+        graph.scroll(-column, 0)
+        graph.fill((15, 15, 25), (width - column, 0, column, height))
+
+        scale = height / PROFILER_GRAPH_SCALE_MS
+        bottom = float(height)
+        for name in names:
+            seconds = frame.get(name)
+            if not seconds:
+                continue
+            bar = seconds * 1000.0 * scale
+            top = max(0.0, bottom - bar)
+            graph.fill(self._color(name), (width - column, int(top), column, int(bottom) - int(top) or 1))
+            bottom = top
+            if bottom <= 0:
+                break
+
+        # 60fps 예산선
+        budget_y = height - int(1000.0 / FPS * scale)
+        graph.fill((200, 200, 200), (width - column, budget_y, column, 1))
+
+    def _render_legend(self, surface, sections, counts):
+        """구간별 평균 시간 (두 줄 배치) + 엔티티 수"""
+        counts = dict(counts)
+        surface.fill((0, 0, 0, 170))
+        row_height = 15
+        rows = (len(sections) + 1) // 2
+        for i, (name, mean_ms) in enumerate(sections):
+            x = 6 + (i // rows) * (surface.get_width() // 2)
+            y = 4 + (i % rows) * row_height
+            surface.fill(self._color(name), (x, y + 3, 8, 8))
+            text = text_cache.render(f"{name} {mean_ms:.2f}ms", self.font_size, WHITE)
+            surface.blit(text, (x + 12, y))
+
+        y = 8 + rows * row_height
+        for line in (f"enemies {counts['enemies']}  bullets {counts['bullets']}  "
+                     f"particles {counts['particles']}",
+                     f"new surfaces/frame (max) {counts['surfaces']}  "
+                     f"frame {counts['frame_ms']:.2f}ms"):
+            surface.blit(text_cache.render(line, self.font_size, YELLOW), (6, y))
+            y += row_height
+
+    def draw(self, screen, profiler, counts):
+        """profiler의 지난 프레임들을 그래프에 반영하고 오버레이 전체를 blit"""
+        names = profiler.names
+        new_frames = min(profiler.frame_count - self.plotted, len(profiler.frames))
+        if new_frames > 0:
+            frames = list(profiler.frames)[-new_frames:]
+            for frame in frames:
+                self._plot_frame(frame, names)
+        self.plotted = profiler.frame_count
+        self.peak_surfaces = max(self.peak_surfaces, counts['surfaces'])
+
+        # 범례는 일정 간격으로만 값 갱신 (매 프레임 다른 문자열을 렌더링하지 않도록)
+        self.legend_timer -= 1
+        if self.legend_timer <= 0 or self.legend_key is None:
+            recent = list(profiler.frames)[-PROFILER_LEGEND_INTERVAL:]
+            count = max(1, len(recent))
+            sections = tuple(
+                (name, round(sum(frame.get(name, 0.0) for frame in recent) * 1000.0 / count, 2))
+                for name in names)
+            frame_ms = sum(sum(frame.values()) for frame in recent) * 1000.0 / count
+            shown = dict(counts, surfaces=self.peak_surfaces, frame_ms=round(frame_ms, 2))
+            self.legend_key = (sections, tuple(sorted(shown.items())))
+            self.legend_timer = PROFILER_LEGEND_INTERVAL
+            self.peak_surfaces = 0
+
+        self.legend.update(self.legend_key, self._render_legend)
+        screen.blit(self.graph, self.graph_rect)
+        screen.blit(self.legend.surface, self.legend.rect)
@@ -0,0 +1,118 @@
+# renderer.py - 시뮬레이션 상태를 화면에 그리기 (장식, 배경 효과, 월드 파티클, UI)
+
+from config import *
+from rng import RandomStreams
+from effects import VisualEffects
+from ui import UI
+from decoration import DecorationManager
+from particles import ParticleSystem
+from surface_cache import surface_cache
+from text_cache import text_cache
+from profiler import null_profiler
+from profiler_overlay import ProfilerOverlay
+
+
+class GameRenderer:
+    """게임 결과에 영향을 주지 않는 연출 객체와 그리기 순서를 관리"""
+
+    def __init__(self, seed=None):
+        # 연출 전용 난수 (시뮬레이션 난수와 따로 진행하므로 그리기가 경기 결과를 바꾸지 않음)
+        self.rng = RandomStreams(seed)
+        self.decoration_manager = DecorationManager(self.rng)
+        self.effects = VisualEffects(self.rng)
+        self.ui = UI()
+        # 월드 좌표 파티클 풀 (Simulation에 넘기면 플레이어, 적군, 총알, 장애물, 아이템이 여기에 생성)
+        self.particles = ParticleSystem(PARTICLE_POOL_SIZE, self.rng)
+
+        # 프로파일러 오버레이 (F3)
+        self.profiler_overlay = ProfilerOverlay()
+        self.show_profiler = False
+        self.surface_allocations = 0  # 지난 오버레이 이후 캐시가 새로 만든 서피스 수 계산용
+
+    def reset(self):
+        """새 경기 시작 (장식 재배치, 월드 파티클 비우기) - 새 Simulation을 만든 뒤 호출"""
+        self.decoration_manager = DecorationManager(self.rng)
+        self.particles.clear()
+
+    def update(self, profiler=null_profiler):
+        """연출 객체를 한 틱 진행"""
+        with profiler.section('update.decorations'):
+            self.decoration_manager.update()
+        with profiler.section('update.effects'):
+            self.effects.update()
+        with profiler.section('update.particles'):
+            self.particles.update()
+
+    def draw(self, screen, simulation, clock, alpha=1.0, profiler=null_profiler):
+        """게임 화면 한 프레임 (마지막 두 틱 사이 alpha 지점으로 보간)"""
+        player = simulation.player
+        enemy_manager = simulation.enemy_manager
+        item_manager = simulation.item_manager
+        obstacle_manager = simulation.obstacle_manager
+        level_system = simulation.level_system
+        camera = simulation.camera
+        ui = self.ui
+
+        camera.interpolate(alpha)
+
+        # 배경 효과 (월드 좌표)
+        with profiler.section('draw.background'):
+            screen.fill(BLACK)
+            self.effects.draw_background_effect(screen)
+
+        # 게임 객체 그리기 (카메라 적용)
+        with profiler.section('draw.decorations'):
+            self.decoration_manager.draw(screen, camera)  # 장식을 가장 먼저
+        with profiler.section('draw.obstacles'):
+            obstacle_manager.draw(screen, camera)
+        with profiler.section('draw.items'):
+            item_manager.draw(screen, camera)
+        with profiler.section('draw.enemies'):
+            enemy_manager.draw(screen, camera)
+        with profiler.section('draw.bullets'):
+            simulation.bullet_manager.draw(screen, camera)
+        with profiler.section('draw.particles'):
+            self.particles.draw(screen, camera)  # 모든 월드 파티클을 한 번에
+        with profiler.section('draw.player'):
+            player.draw(screen, camera)
+
+        # UI 그리기 (화면 좌표, 카메라 영향 없음)
+        with profiler.section('draw.ui'):
+            ui.begin_frame()
+            enemy_count = len(enemy_manager.get_enemies())
+            ui.draw_player_hud(screen, player)
+            ui.draw_level_progress(screen, level_system)  # 레벨 진행률 추가
+            ui.draw_minimap(screen, player.get_position(), enemy_manager.get_enemies(), camera,
+                            obstacle_manager, item_manager.get_health_packs())
+            ui.draw_skill_bar(screen, player)
+            ui.draw_game_info(screen, enemy_count, simulation.score, level_system.level)
+            ui.draw_fps(screen, clock)
+
+            # 레벨업 애니메이션
+            level_system.draw_level_up_effect(screen)
+
+    def toggle_profiler(self):
+        self.show_profiler = not self.show_profiler
+        self.profiler_overlay.reset()
+        return self.show_profiler
+
+    def draw_profiler(self, screen, simulation, profiler):
+        """프로파일러 오버레이 (지난 프레임까지의 측정값 + 현재 엔티티 수)"""
+        # 동적으로 만드는 서피스는 모두 서피스/텍스트 캐시를 거치므로 캐시 미스 수로 집계
+        allocations = surface_cache.misses + text_cache.misses
+        counts = {
+            'enemies': len(simulation.enemy_manager.get_enemies()),
+            'bullets': len(simulation.bullet_manager),
+            'particles': self.particles.count + self.effects.particles.count,
+            'surfaces': allocations - self.surface_allocations,
+        }
+        self.profiler_overlay.draw(screen, profiler, counts)
+        # 오버레이 자신이 만든 텍스트는 다음 프레임 집계에서 제외
+        self.surface_allocations = surface_cache.misses + text_cache.misses
+
+    def draw_game_over(self, screen, score):
+        """게임 오버 화면 - 월드가 멈춰 있으므로 바뀐 패널 영역만 반환"""
+        if self.ui.begin_frame(static=True):
+            screen.fill(BLACK)
+        self.ui.draw_game_over_screen(screen, score)
+        return self.ui.dirty_rects
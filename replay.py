@@ -0,0 +1,158 @@
+# replay.py - 틱 단위 입력 기록 / 재생 (주기적인 상태 해시로 디싱크 검출)
+
+import struct
+import sys
+import pygame
+from config import *
+from simulation import Simulation, PlayerInput, KeyState
+from profiler import null_profiler
+
+# 게임이 읽는 키만 비트마스크로 기록 (순서를 바꾸면 기존 리플레이와 호환되지 않음)
+RECORDED_KEYS = (pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d,
+                 pygame.K_UP, pygame.K_LEFT, pygame.K_DOWN, pygame.K_RIGHT,
+                 pygame.K_f, pygame.K_q, pygame.K_1, pygame.K_2, pygame.K_3)
+
+REPLAY_MAGIC = b'ECAR'
+REPLAY_VERSION = 1
+
+HEADER = struct.Struct('<4sHqH')                # 매직, 버전, 시드, 해시 간격
+INPUT_RECORD = struct.Struct('<BHBff')          # 태그, 키 비트마스크, 마우스 버튼, 마우스 월드 x, y
+HASH_RECORD = struct.Struct(f'<BI{STATE_HASH_SIZE}s')  # 태그, 틱, 상태 해시
+
+TAG_INPUT = 0
+TAG_HASH = 1
+
+
+def encode_input(player_input):
+    """PlayerInput -> 입력 레코드 바이트열"""
+    keys = player_input.keys
+    key_mask = 0
+    for bit, key in enumerate(RECORDED_KEYS):
+        if keys[key]:
+            key_mask |= 1 << bit
+    buttons = player_input.mouse_buttons
+    button_mask = (1 if buttons[0] else 0) | (2 if buttons[1] else 0) | (4 if buttons[2] else 0)
+    mouse_x, mouse_y = player_input.mouse_world
+    return INPUT_RECORD.pack(TAG_INPUT, key_mask, button_mask, mouse_x, mouse_y)
+
+
+def decode_input(key_mask, button_mask, mouse_x, mouse_y):
+    """입력 레코드 필드 -> PlayerInput"""
+    pressed = [key for bit, key in enumerate(RECORDED_KEYS) if key_mask & (1 << bit)]
+    buttons = (bool(button_mask & 1), bool(button_mask & 2), bool(button_mask & 4))
+    return PlayerInput(KeyState(pressed), buttons, (mouse_x, mouse_y))
+
+
+class InputRecorder:
+    """시뮬레이션에 들어가는 입력을 틱마다 파일에 기록"""
+
+    def __init__(self, path, seed, hash_interval=REPLAY_HASH_INTERVAL):
+        self.path = path
+        self.hash_interval = hash_interval
+        self.file = open(path, 'wb')
+        self.file.write(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, seed, hash_interval))
+        self.ticks = 0
+        self.last_hash_tick = 0
+
+    def step(self, simulation, player_input, profiler=null_profiler):
+        """입력을 기록하고 시뮬레이션을 한 틱 진행 - 처치한 적군 수 반환
+
+        마우스 좌표는 float32로 기록되므로, 재생과 결과가 같도록 기록된 값을 시뮬레이션에 넣음
+        """
+        record = encode_input(player_input)
+        self.file.write(record)
+        kills = simulation.step(decode_input(*INPUT_RECORD.unpack(record)[1:]), profiler)
+        self.ticks += 1
+
+        if simulation.tick % self.hash_interval == 0:
+            self._write_hash(simulation)
+        return kills
+
+    def _write_hash(self, simulation):
+        self.file.write(HASH_RECORD.pack(TAG_HASH, simulation.tick, simulation.state_hash()))
+        self.last_hash_tick = simulation.tick
+
+    def close(self, simulation=None):
+        """파일 닫기 (시뮬레이션을 주면 마지막 틱의 해시도 기록)"""
+        if self.file.closed:
+            return
+        if simulation is not None and simulation.tick != self.last_hash_tick:
+            self._write_hash(simulation)
+        self.file.close()
+
+
+class Replay:
+    """기록된 리플레이 파일 (시드, 틱별 입력, 틱별 기대 해시)"""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        magic, version, self.seed, self.hash_interval = HEADER.unpack_from(data, 0)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError(f"{path}: not a replay file (version {REPLAY_VERSION})")
+
+        self.inputs = []   # 틱 순서대로 PlayerInput
+        self.hashes = {}   # 틱 -> 기대 상태 해시
+        offset = HEADER.size
+        while offset < len(data):
+            tag = data[offset]
+            if tag == TAG_INPUT:
+                fields = INPUT_RECORD.unpack_from(data, offset)
+                self.inputs.append(decode_input(*fields[1:]))
+                offset += INPUT_RECORD.size
+            elif tag == TAG_HASH:
+                _, tick, state_hash = HASH_RECORD.unpack_from(data, offset)
+                self.hashes[tick] = state_hash
+                offset += HASH_RECORD.size
+            else:
+                raise ValueError(f"{path}: unknown record tag {tag} at byte {offset}")
+
+    def __len__(self):
+        return len(self.inputs)
+
+    def play(self, simulation=None, verify=True):
+        """헤드리스로 재생 - 해시가 처음 어긋난 틱을 'desync_tick'으로 반환 (없으면 None)"""
+        if simulation is None:
+            simulation = Simulation(self.seed)
+
+        checked = 0
+        desync_tick = None
+        for player_input in self.inputs:
+            simulation.step(player_input)
+            expected = self.hashes.get(simulation.tick) if verify else None
+            if expected is not None:
+                checked += 1
+                if simulation.state_hash() != expected:
+                    desync_tick = simulation.tick
+                    break
+
+        return {
+            'ticks': simulation.tick,
+            'hashes_checked': checked,
+            'desync_tick': desync_tick,
+            'result': simulation.result(),
+        }
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Replay a recorded Elite Combat Arena session headlessly")
+    parser.add_argument('path', help="replay file written by main.py --record")
+    parser.add_argument('--no-verify', action='store_true', help="skip state hash checks")
+    args = parser.parse_args(argv)
+
+    replay = Replay(args.path)
+    report = replay.play(verify=not args.no_verify)
+    print(f"{args.path}: {len(replay)} ticks, seed {replay.seed}, "
+          f"{report['hashes_checked']} hashes checked")
+    if report['desync_tick'] is not None:
+        print(f"DESYNC at tick {report['desync_tick']}")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
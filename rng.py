@@ -0,0 +1,14 @@
+# rng.py - 게임플레이용 / 연출용 난수 스트림 (시드를 고정하면 같은 경기를 재현)
+
+import random
+
+
+class RandomStreams:
+    """게임플레이 / 연출 난수 스트림 한 쌍 (Simulation과 GameRenderer가 각자 소유하고 생성자로 넘겨줌)"""
+
+    def __init__(self, seed=None):
+        # 시드가 None이면 두 스트림 모두 OS 난수로 초기화
+        # 게임 결과에 영향을 주는 값 (스폰 위치, 적 AI, 아이템 물리)
+        self.gameplay = random.Random(seed)
+        # 화면에만 보이는 값 (파티클, 화면 흔들림, 장식 배치) - 그리기 여부와 상관없이 게임플레이 스트림을 건드리지 않음
+        self.cosmetic = random.Random(None if seed is None else f"cosmetic:{seed}")
@@ -0,0 +1,342 @@
+# simulation.py - 화면 없이 돌릴 수 있는 게임 시뮬레이션 (헤드리스 실행, 자동 플레이)
+
+import copyreg
+import hashlib
+import io
+import math
+import os
+import pickle
+import random
+import sys
+import time
+import zlib
+import pygame
+from config import *
+from utils import *
+from player import Player
+from enemy import EnemyManager
+from bullet import create_bullet_manager
+from camera import Camera
+from obstacle import ObstacleManager
+from item import ItemManager
+from level_system import LevelSystem
+from particles import ParticleSystem, NullParticles, null_particles
+from profiler import null_profiler
+from rng import RandomStreams
+
+
+class KeyState:
+    """pygame.key.get_pressed()처럼 키 상수로 조회할 수 있는 눌린 키 집합"""
+
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+class PlayerInput:
+    """한 틱 동안의 플레이어 입력 (마우스 위치는 월드 좌표)"""
+
+    def __init__(self, keys=None, mouse_buttons=(False, False, False), mouse_world=(0, 0)):
+        self.keys = keys if keys is not None else KeyState()
+        self.mouse_buttons = mouse_buttons
+        self.mouse_world = mouse_world
+
+
+def _attached_particles():
+    """스냅샷 안의 파티클 풀 자리 (복원할 때 _SnapshotUnpickler가 실제 풀로 바꿈)"""
+    return null_particles
+
+
+def _reduce_particles(particles):
+    return _attached_particles, ()
+
+
+class _SnapshotPickler(pickle.Pickler):
+    """시뮬레이션 상태를 피클링하되 파티클 풀(연출용 외부 객체)은 자리만 남김"""
+
+    def __init__(self, file):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        # 타입별 리듀서만 추가하므로 나머지 객체는 그대로 C 구현이 처리
+        self.dispatch_table = copyreg.dispatch_table.copy()
+        self.dispatch_table[ParticleSystem] = _reduce_particles
+        self.dispatch_table[NullParticles] = _reduce_particles
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """_SnapshotPickler가 남긴 파티클 풀 자리를 주어진 풀로 연결"""
+
+    def __init__(self, file, particles):
+        super().__init__(file)
+        self.particles = particles
+
+    def find_class(self, module, name):
+        if module == __name__ and name == '_attached_particles':
+            return lambda: self.particles
+        return super().find_class(module, name)
+
+
+class Simulation:
+    """게임 규칙과 월드 상태 (그리기와 무관, 틱 단위로 진행)"""
+
+    def __init__(self, seed=None, particles=null_particles):
+        # 시드를 주면 맵/스폰/AI가 모두 같은 순서로 재현됨 (None이면 OS 난수로 시작)
+        # 난수 스트림은 이 시뮬레이션만 쓰고 상태에 포함됨 (스냅샷, 여러 시뮬레이션 동시 실행)
+        self.seed = seed
+        self.rng = RandomStreams(seed)
+
+        # 월드 파티클을 생성할 풀 (보통 GameRenderer.particles, 헤드리스면 빈 풀) - 상태에는 포함하지 않음
+        self.particles = particles
+
+        rng = self.rng
+        self.player = Player(WORLD_WIDTH // 2, WORLD_HEIGHT // 2, rng, particles)
+        self.enemy_manager = EnemyManager(rng, particles)
+        self.bullet_manager = create_bullet_manager(rng, particles)
+        self.obstacle_manager = ObstacleManager(particles)
+        self.item_manager = ItemManager(rng, particles)
+        self.level_system = LevelSystem()
+        self.camera = Camera(rng)  # 적 스폰 위치가 시야에 의존하므로 시뮬레이션 상태에 포함
+
+        self.score = 0
+        self.tick = 0
+        self.game_over = False
+
+    def step(self, player_input, profiler=null_profiler):
+        """한 틱 진행 - 이번 틱에 처치한 적군 수 반환 (profiler에 서브시스템별 시간 기록)"""
+        if self.game_over:
+            return 0
+
+        player = self.player
+        enemy_manager = self.enemy_manager
+        obstacle_manager = self.obstacle_manager
+        level_system = self.level_system
+        camera = self.camera
+
+        # 카메라 업데이트 (플레이어와 마우스 위치 고려)
+        with profiler.section('update.camera'):
+            camera.update(player.get_position(), player_input.mouse_world)
+
+        # 게임 업데이트
+        with profiler.section('update.player'):
+            player.update(player_input.keys, player_input.mouse_buttons, player_input.mouse_world,
+                          self.bullet_manager, enemy_manager.get_enemies(), camera, obstacle_manager)
+        with profiler.section('update.enemies'):
+            enemy_manager.update(player.get_position(), camera, obstacle_manager, level_system)
+        with profiler.section('update.bullets'):
+            self.bullet_manager.update(enemy_manager.get_enemies(), obstacle_manager,
+                                       enemy_manager.enemy_grid, enemy_manager.store)
+        with profiler.section('update.obstacles'):
+            obstacle_manager.update()
+        with profiler.section('update.items'):
+            self.item_manager.update(obstacle_manager, player)
+        level_system.update()
+
+        # 적군 처치 시 레벨 시스템 업데이트
+        kills = 0
+        for enemy in enemy_manager.enemies:  # 모든 적군 체크 (죽은 것 포함)
+            if enemy.is_dead and not enemy.kill_counted:
+                level_system.add_kill()
+                self.score += 10 * level_system.level  # 레벨에 따른 점수 증가
+                enemy.kill_counted = True  # 중복 카운팅 방지
+                kills += 1
+
+        # 플레이어 죽음 체크
+        if player.is_dead():
+            self.game_over = True
+
+        self.tick += 1
+        return kills
+
+    def snapshot(self):
+        """전체 시뮬레이션 상태 (AI 타이머, 쿨다운, 총알, 장애물 체력, 난수 상태)를 압축한 바이트열"""
+        buffer = io.BytesIO()
+        _SnapshotPickler(buffer).dump(self.__dict__)
+        return zlib.compress(buffer.getvalue(), SNAPSHOT_COMPRESS_LEVEL)
+
+    def restore(self, data, particles=None):
+        """snapshot()으로 만든 상태로 되돌림 (이후 진행은 스냅샷 시점부터 그대로 재현됨)"""
+        # 파티클 풀은 스냅샷에 들어있지 않으므로 particles (기본값은 현재 풀)에 다시 연결
+        if particles is None:
+            particles = getattr(self, 'particles', null_particles)
+        buffer = io.BytesIO(zlib.decompress(data))
+        self.__dict__.update(_SnapshotUnpickler(buffer, particles).load())
+
+    @classmethod
+    def from_snapshot(cls, data, particles=null_particles):
+        simulation = cls.__new__(cls)
+        simulation.restore(data, particles)
+        return simulation
+
+    def state_hash(self):
+        """디싱크 검출용 상태 해시 (플레이어, 적군, 총알, 장애물 체력, 체력팩, 게임플레이 난수 상태)"""
+        player = self.player
+        digest = hashlib.blake2b(digest_size=STATE_HASH_SIZE)
+        digest.update(repr((self.tick, self.score, self.level_system.level, self.level_system.kills,
+                            player.x, player.y, player.hp, player.blink_cooldown, player.dash_cooldown,
+                            player.explosion_cooldown, player.weapon_manager.current_weapon)).encode())
+        for enemy in self.enemy_manager.enemies:
+            digest.update(repr((enemy.x, enemy.y, enemy.hp, enemy.state, enemy.attack_cooldown,
+                                enemy.is_dead)).encode())
+        for bullet in self.bullet_manager.get_bullets():
+            digest.update(repr((bullet.x, bullet.y, bullet.vx, bullet.vy, bullet.damage)).encode())
+        for obstacle in self.obstacle_manager.obstacles:
+            digest.update(repr((obstacle.hp, obstacle.destroyed)).encode())
+        for health_pack in self.item_manager.get_health_packs():
+            digest.update(repr((health_pack.x, health_pack.y, health_pack.collected)).encode())
+        digest.update(repr(self.rng.gameplay.getstate()).encode())
+        return digest.digest()
+
+    def result(self):
+        """경기 결과 요약 (헤드리스 실행 리포트용)"""
+        return {
+            'ticks': self.tick,
+            'score': self.score,
+            'level': self.level_system.level,
+            'kills': self.level_system.total_kills,
+            'hp': self.player.hp,
+            'alive': not self.game_over,
+        }
+
+
+class ScriptedController:
+    """미리 정한 입력 목록을 틱마다 차례로 내보냄 (끝나면 처음부터 반복하거나 입력 없음)"""
+
+    def __init__(self, inputs, loop=True):
+        self.inputs = list(inputs)
+        self.loop = loop
+        self.index = 0
+
+    def next_input(self, simulation):
+        if not self.inputs or (not self.loop and self.index >= len(self.inputs)):
+            return PlayerInput(mouse_world=simulation.player.get_position())
+        player_input = self.inputs[self.index % len(self.inputs)]
+        self.index += 1
+        return player_input
+
+
+class BotController:
+    """가까운 적을 쏘면서 거리를 유지하는 간단한 자동 플레이어"""
+
+    def __init__(self, seed=None):
+        self.random = random.Random(seed)
+        self.strafe = 1
+        self.strafe_timer = 0
+        self.fire_held = False
+
+    def _nearest(self, position, items):
+        best, best_dist = None, float('inf')
+        for item in items:
+            dist = distance(position, (item.x, item.y))
+            if dist < best_dist:
+                best, best_dist = item, dist
+        return best, best_dist
+
+    def next_input(self, simulation):
+        player = simulation.player
+        position = player.get_position()
+        enemies = [enemy for enemy in simulation.enemy_manager.get_enemies() if not enemy.is_dead]
+        target, target_dist = self._nearest(position, enemies)
+
+        pressed = set()
+        move_x, move_y = 0.0, 0.0
+        mouse_world = position
+        fire = False
+
+        # 체력이 낮으면 가장 가까운 체력팩으로 이동
+        health_packs = [pack for pack in simulation.item_manager.get_health_packs() if not pack.collected]
+        pack, _ = self._nearest(position, health_packs)
+        if pack is not None and player.get_hp_ratio() < 0.5:
+            move_x, move_y = pack.x - player.x, pack.y - player.y
+
+        if target is not None:
+            mouse_world = (target.x, target.y)
+            fire = True
+            dx, dy = target.x - player.x, target.y - player.y
+
+            # 거리에 맞는 무기 선택 (가까우면 샷건, 멀면 저격총)
+            if target_dist < 150:
+                pressed.add(pygame.K_2)
+            elif target_dist > 450:
+                pressed.add(pygame.K_3)
+            else:
+                pressed.add(pygame.K_1)
+
+            if pack is None or player.get_hp_ratio() >= 0.5:
+                # 너무 가까우면 물러나고, 멀면 다가가고, 적당하면 옆으로 돎
+                self.strafe_timer -= 1
+                if self.strafe_timer <= 0:
+                    self.strafe = self.random.choice((-1, 1))
+                    self.strafe_timer = self.random.randint(30, 120)
+                if target_dist < 200:
+                    move_x, move_y = -dx, -dy
+                elif target_dist > 400:
+                    move_x, move_y = dx, dy
+                else:
+                    move_x, move_y = -dy * self.strafe, dx * self.strafe
+
+            # 둘러싸이면 폭발, 붙으면 대시
+            close = sum(1 for enemy in enemies if distance(position, (enemy.x, enemy.y)) < EXPLOSION_RADIUS)
+            if close >= 2 and player.explosion_cooldown == 0:
+                pressed.add(pygame.K_q)
+            elif target_dist < 60 and player.dash_cooldown == 0:
+                pressed.add(pygame.K_f)
+
+        # 이동 방향을 WASD로 변환 (축별 데드존)
+        length = math.hypot(move_x, move_y)
+        if length > 0:
+            if move_x / length > 0.3:
+                pressed.add(pygame.K_d)
+            elif move_x / length < -0.3:
+                pressed.add(pygame.K_a)
+            if move_y / length > 0.3:
+                pressed.add(pygame.K_s)
+            elif move_y / length < -0.3:
+                pressed.add(pygame.K_w)
+
+        # 클릭할 때만 발사되므로 버튼을 한 틱씩 번갈아 누름
+        self.fire_held = fire and not self.fire_held
+        return PlayerInput(KeyState(pressed), (self.fire_held, False, False), mouse_world)
+
+
+def run_headless(matches=1, max_ticks=HEADLESS_MAX_TICKS, controller_factory=BotController, seed=None):
+    """화면 없이 경기를 최대 속도로 돌리고 경기별 결과 목록 반환"""
+    results = []
+    for match in range(matches):
+        simulation = Simulation(None if seed is None else seed + match)
+        controller = controller_factory(None if seed is None else seed + match)
+        started = time.perf_counter()
+        while not simulation.game_over and simulation.tick < max_ticks:
+            simulation.step(controller.next_input(simulation))
+        elapsed = time.perf_counter() - started
+
+        result = simulation.result()
+        result['match'] = match
+        result['seconds'] = elapsed
+        result['ticks_per_second'] = simulation.tick / elapsed if elapsed > 0 else 0.0
+        results.append(result)
+    return results
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Elite Combat Arena headless simulation")
+    parser.add_argument('--matches', type=int, default=1, help="number of matches to run")
+    parser.add_argument('--ticks', type=int, default=HEADLESS_MAX_TICKS, help="tick limit per match")
+    parser.add_argument('--seed', type=int, default=None, help="base random seed (match i uses seed + i)")
+    args = parser.parse_args(argv)
+
+    # 창을 만들지 않도록 더미 드라이버 지정 (디스플레이 초기화 없이도 시뮬레이션은 동작)
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+    results = run_headless(args.matches, args.ticks, seed=args.seed)
+    for result in results:
+        print(f"Match {result['match']}: ticks={result['ticks']} score={result['score']} "
+              f"level={result['level']} kills={result['kills']} alive={result['alive']} "
+              f"({result['ticks_per_second']:.0f} ticks/s)")
+    return results
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
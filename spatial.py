@@ -0,0 +1,121 @@
+# spatial.py - 균일 그리드 공간 분할 (충돌 쿼리 가속)
+
+import math
+
+
+class SpatialGrid:
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}       # (cell_x, cell_y) -> 아이템 리스트
+        self.item_cells = {}  # 아이템 -> 등록된 셀 키 튜플
+
+    def _cell_keys(self, left, top, right, bottom):
+        """사각형 영역이 걸치는 셀 키들"""
+        min_cx = int(math.floor(left / self.cell_size))
+        max_cx = int(math.floor(right / self.cell_size))
+        min_cy = int(math.floor(top / self.cell_size))
+        max_cy = int(math.floor(bottom / self.cell_size))
+        return tuple((cx, cy)
+                     for cy in range(min_cy, max_cy + 1)
+                     for cx in range(min_cx, max_cx + 1))
+
+    def insert(self, item, left, top, right, bottom):
+        """아이템을 영역에 등록"""
+        keys = self._cell_keys(left, top, right, bottom)
+        for key in keys:
+            self.cells.setdefault(key, []).append(item)
+        self.item_cells[item] = keys
+
+    def remove(self, item):
+        """아이템 등록 해제"""
+        keys = self.item_cells.pop(item, None)
+        if keys is None:
+            return False
+        for key in keys:
+            bucket = self.cells[key]
+            bucket.remove(item)
+            if not bucket:
+                del self.cells[key]
+        return True
+
+    def move(self, item, left, top, right, bottom):
+        """아이템 영역 갱신 (셀이 바뀔 때만 재등록)"""
+        keys = self._cell_keys(left, top, right, bottom)
+        if self.item_cells.get(item) == keys:
+            return
+        self.remove(item)
+        for key in keys:
+            self.cells.setdefault(key, []).append(item)
+        self.item_cells[item] = keys
+
+    def clear(self):
+        self.cells.clear()
+        self.item_cells.clear()
+
+    def __contains__(self, item):
+        return item in self.item_cells
+
+    def __len__(self):
+        return len(self.item_cells)
+
+    def query(self, left, top, right, bottom):
+        """영역과 겹치는 셀의 아이템들 (중복 제거) - 셀을 행 우선으로 돌며 셀 안에서는 등록 순서
+
+        전체 등록 순서는 아니지만 같은 그리드 상태와 영역이면 항상 같은 순서 (동점 처리가 재현됨)
+        """
+        keys = self._cell_keys(left, top, right, bottom)
+        if len(keys) == 1:
+            return list(self.cells.get(keys[0], ()))
+
+        result = []
+        seen = set()
+        for key in keys:
+            for item in self.cells.get(key, ()):
+                if id(item) not in seen:
+                    seen.add(id(item))
+                    result.append(item)
+        return result
+
+    def query_radius(self, x, y, radius):
+        """원을 감싸는 영역의 아이템들 (정밀 판정은 호출자가 수행)"""
+        return self.query(x - radius, y - radius, x + radius, y + radius)
+
+    def cell_items(self, key):
+        """특정 셀에 등록된 아이템들"""
+        return self.cells.get(key, ())
+
+    def traverse_segment(self, x1, y1, x2, y2):
+        """선분이 지나가는 셀 키들을 시작점부터 순서대로 반환 (DDA 순회)"""
+        size = self.cell_size
+        cell_x = int(math.floor(x1 / size))
+        cell_y = int(math.floor(y1 / size))
+        end_cell_x = int(math.floor(x2 / size))
+        end_cell_y = int(math.floor(y2 / size))
+        dx = x2 - x1
+        dy = y2 - y1
+
+        # 축별로 다음 셀 경계까지의 t와 셀 하나를 지나는 데 드는 t
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        if dx != 0:
+            boundary_x = (cell_x + 1) * size if dx > 0 else cell_x * size
+            t_max_x = (boundary_x - x1) / dx
+            t_delta_x = size / abs(dx)
+        else:
+            t_max_x = t_delta_x = math.inf
+        if dy != 0:
+            boundary_y = (cell_y + 1) * size if dy > 0 else cell_y * size
+            t_max_y = (boundary_y - y1) / dy
+            t_delta_y = size / abs(dy)
+        else:
+            t_max_y = t_delta_y = math.inf
+
+        yield (cell_x, cell_y)
+        for _ in range(abs(end_cell_x - cell_x) + abs(end_cell_y - cell_y)):
+            if t_max_x < t_max_y:
+                cell_x += step_x
+                t_max_x += t_delta_x
+            else:
+                cell_y += step_y
+                t_max_y += t_delta_y
+            yield (cell_x, cell_y)
@@ -0,0 +1,98 @@
+# static_layer.py - 움직이지 않는 월드 요소를 청크 단위로 미리 그려두는 레이어
+
+import math
+import pygame
+from config import *
+from spatial import SpatialGrid
+
+
+class StaticLayer:
+    """월드를 고정 크기 청크로 나누고, 청크마다 정적 요소를 한 번만 그려서 재사용
+
+    등록되는 아이템은 get_static_bounds() -> (left, top, right, bottom)과
+    draw_static(surface, x, y)를 제공해야 함 (x, y는 서피스 안에서의 아이템 좌표)
+    """
+
+    def __init__(self, chunk_size=STATIC_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.grid = SpatialGrid(chunk_size)  # 청크 키 -> 겹치는 아이템 (등록 순서 = 그리기 순서)
+        self.chunks = {}                     # 청크 키 -> 미리 그린 서피스
+        self.dirty = set()                   # 다시 그려야 하는 청크 키
+        self.renders = 0                     # 청크를 새로 그린 횟수 (프로파일용)
+
+    def add(self, item):
+        """아이템 등록 (겹치는 청크는 다음 그리기 때 다시 그림)"""
+        self.grid.insert(item, *item.get_static_bounds())
+        self.dirty.update(self.grid.item_cells[item])
+
+    def remove(self, item):
+        """아이템 등록 해제 (파괴된 장애물 등)"""
+        keys = self.grid.item_cells.get(item)
+        if keys is None:
+            return False
+        self.dirty.update(keys)
+        return self.grid.remove(item)
+
+    def invalidate(self, item):
+        """아이템 모양이 바뀌었을 때 겹치는 청크를 다시 그리도록 표시"""
+        self.dirty.update(self.grid.item_cells.get(item, ()))
+
+    def __getstate__(self):
+        """스냅샷에는 서피스를 넣지 않음 (복원 후 화면에 걸치는 청크부터 다시 그림)"""
+        state = self.__dict__.copy()
+        state['chunks'] = {}
+        state['dirty'] = set()
+        return state
+
+    def clear(self):
+        self.grid.clear()
+        self.chunks.clear()
+        self.dirty.clear()
+
+    def _render_chunk(self, key):
+        """청크 하나를 다시 그림 (아이템이 없으면 서피스를 버림)"""
+        items = self.grid.cell_items(key)
+        if not items:
+            self.chunks.pop(key, None)
+            return None
+
+        surface = self.chunks.get(key)
+        if surface is None:
+            surface = pygame.Surface((self.chunk_size, self.chunk_size))
+            surface.set_colorkey(STATIC_LAYER_COLORKEY, pygame.RLEACCEL)
+            self.chunks[key] = surface
+        surface.fill(STATIC_LAYER_COLORKEY)
+
+        origin_x = key[0] * self.chunk_size
+        origin_y = key[1] * self.chunk_size
+        for item in items:
+            item.draw_static(surface, item.x - origin_x, item.y - origin_y)
+        self.renders += 1
+        return surface
+
+    def draw(self, screen, camera):
+        """화면에 걸치는 청크만 blit"""
+        size = self.chunk_size
+        left, top = camera.screen_to_world(0, 0)
+        min_cx = int(math.floor(left / size))
+        min_cy = int(math.floor(top / size))
+        max_cx = int(math.floor((left + SCREEN_WIDTH) / size))
+        max_cy = int(math.floor((top + SCREEN_HEIGHT) / size))
+
+        blit_list = []
+        for cy in range(min_cy, max_cy + 1):
+            for cx in range(min_cx, max_cx + 1):
+                key = (cx, cy)
+                if key in self.dirty:
+                    self.dirty.discard(key)
+                    surface = self._render_chunk(key)
+                else:
+                    surface = self.chunks.get(key)
+                    if surface is None and self.grid.cell_items(key):
+                        surface = self._render_chunk(key)
+                if surface is not None:
+                    blit_list.append((surface, camera.world_to_screen(cx * size, cy * size)))
+        screen.blits(blit_list, doreturn=False)
+
+    def __len__(self):
+        return len(self.chunks)
@@ -0,0 +1,80 @@
+# surface_cache.py - 반투명 서피스 캐시 (LRU)
+
+from collections import OrderedDict
+import pygame
+from config import *
+
+
+class SurfaceCache:
+    """(크기, 색상, 알파 단계)별로 만들어 둔 반투명 서피스를 재사용"""
+
+    def __init__(self, max_entries=SURFACE_CACHE_SIZE, alpha_step=SURFACE_CACHE_ALPHA_STEP):
+        self.max_entries = max_entries
+        self.alpha_step = alpha_step
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0  # 새로 할당한 서피스 수
+
+    def _alpha_bucket(self, alpha):
+        """알파 값을 단계로 양자화 (0~255)"""
+        bucket = int(alpha + self.alpha_step // 2) // self.alpha_step * self.alpha_step
+        return 0 if bucket < 0 else 255 if bucket > 255 else bucket
+
+    def _store(self, key, surface):
+        self.misses += 1
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surface
+
+    def filled(self, size, color, alpha):
+        """색상으로 채운 반투명 사각형 서피스 (size는 정수 또는 (너비, 높이))"""
+        alpha = self._alpha_bucket(alpha)
+        key = (size, color, alpha)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        width, height = size if isinstance(size, tuple) else (size, size)
+        surface = pygame.Surface((max(0, int(width)), max(0, int(height))))
+        surface.set_alpha(alpha)
+        surface.fill(color)
+        return self._store(key, surface)
+
+    def circle_outline(self, radius, color, width, alpha):
+        """원 테두리를 그린 반투명 서피스 (크기: radius * 2 + width * 2)"""
+        alpha = self._alpha_bucket(alpha)
+        key = ('circle', radius, width, color, alpha)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        size = radius * 2 + width * 2
+        surface = pygame.Surface((size, size))
+        surface.set_alpha(alpha)
+        pygame.draw.circle(surface, color, (radius + width, radius + width), radius, width)
+        return self._store(key, surface)
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self):
+        """프로파일러용 캐시 통계"""
+        total = self.hits + self.misses
+        return {
+            'entries': len(self.entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+    def __len__(self):
+        return len(self.entries)
+
+
+# 모든 그리기 코드가 공유하는 서피스 캐시
+surface_cache = SurfaceCache()
@@ -0,0 +1,78 @@
+# text_cache.py - 폰트 객체와 렌더링된 텍스트 캐시 (LRU)
+
+from collections import OrderedDict
+import pygame
+from config import *
+
+
+class TextCache:
+    """(폰트, 크기, 문자열, 색상)별로 렌더링한 텍스트 서피스를 재사용"""
+
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.fonts = {}  # (폰트 이름, 크기) -> pygame.font.Font (개수가 적으므로 버리지 않음)
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_font(self, size, name=None):
+        """크기별 폰트 객체 (처음 요청할 때 한 번만 생성)"""
+        key = (name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(name, size)
+            self.fonts[key] = font
+        return font
+
+    def _get(self, key, build):
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        surface = build()
+        self.misses += 1
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surface
+
+    def render(self, text, size, color, name=None):
+        """안티앨리어싱된 텍스트 서피스"""
+        return self._get((name, size, text, color),
+                         lambda: self.get_font(size, name).render(text, True, color))
+
+    def render_faded(self, text, size, color, alpha, name=None):
+        """텍스트를 검은 바탕 서피스에 얹고 전체 알파를 적용 (레벨업 연출용)"""
+        # 바탕 서피스는 알파와 무관하게 캐시하고, 호출할 때마다 알파만 다시 지정
+        def build():
+            text_surface = self.render(text, size, color, name)
+            surface = pygame.Surface(text_surface.get_size())
+            surface.blit(text_surface, (0, 0))
+            return surface
+
+        surface = self._get((name, size, text, color, 'faded'), build)
+        surface.set_alpha(alpha)
+        return surface
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self):
+        """프로파일러용 캐시 통계"""
+        total = self.hits + self.misses
+        return {
+            'entries': len(self.entries),
+            'fonts': len(self.fonts),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+    def __len__(self):
+        return len(self.entries)
+
+
+# UI와 레벨 시스템이 공유하는 텍스트 캐시
+text_cache = TextCache()
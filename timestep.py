@@ -0,0 +1,34 @@
+# timestep.py - 고정 간격 시뮬레이션 스텝 (렌더링 속도와 분리)
+
+
+class FixedTimestep:
+    """실제 경과 시간을 누적해서 고정 길이 틱 단위로 시뮬레이션을 진행"""
+
+    def __init__(self, tick_rate, max_steps):
+        self.step_time = 1.0 / tick_rate
+        self.max_steps = max_steps  # 한 프레임에 따라잡을 최대 틱 수
+        self.accumulator = 0.0
+        self.alpha = 0.0            # 마지막 틱과 다음 틱 사이의 위치 (렌더링 보간용, 0~1)
+        self.total_steps = 0
+        self.dropped_time = 0.0     # 따라잡기 상한 때문에 버린 시간 (초)
+
+    def advance(self, elapsed):
+        """경과 시간(초)을 더하고 이번 프레임에 실행할 틱 수를 반환"""
+        self.accumulator += elapsed
+        steps = int(self.accumulator / self.step_time)
+
+        # 너무 밀렸으면 상한까지만 실행하고 나머지는 버림 (느려지되 멈추지 않도록)
+        if steps > self.max_steps:
+            dropped = (steps - self.max_steps) * self.step_time
+            self.accumulator -= dropped
+            self.dropped_time += dropped
+            steps = self.max_steps
+
+        self.accumulator -= steps * self.step_time
+        self.alpha = min(1.0, self.accumulator / self.step_time)
+        self.total_steps += steps
+        return steps
+
+    def reset(self):
+        self.accumulator = 0.0
+        self.alpha = 0.0
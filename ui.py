@@ -3,16 +3,77 @@
 import pygame
 import math
 from config import *
+from surface_cache import surface_cache
+from text_cache import text_cache
+from minimap import Minimap
+
+
+class RetainedPanel:
+    """입력 값(key)이 바뀔 때만 다시 합성하는 UI 패널"""
+
+    def __init__(self, rect):
+        self.rect = pygame.Rect(rect)
+        self.surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        self.key = None
+        self.rebuilds = 0  # 다시 합성한 횟수 (프로파일용)
+
+    def update(self, key, render):
+        """key가 바뀌었으면 render(surface, *key)로 다시 합성 - 다시 합성했으면 True"""
+        if key == self.key:
+            return False
+        self.key = key
+        self.surface.fill((0, 0, 0, 0))
+        render(self.surface, *key)
+        self.rebuilds += 1
+        return True
+
+    def invalidate(self):
+        self.key = None
 
 
 class UI:
     def __init__(self):
-        # 폰트 설정
-        self.title_font = pygame.font.Font(None, 48)
-        self.skill_font = pygame.font.Font(None, 28)
-        self.cooldown_font = pygame.font.Font(None, 22)
-        self.info_font = pygame.font.Font(None, 24)
-        self.weapon_font = pygame.font.Font(None, 36)
+        # 폰트 크기 (폰트 객체와 렌더링된 텍스트는 text_cache가 공유)
+        self.title_font_size = 48
+        self.skill_font_size = 28
+        self.cooldown_font_size = 22
+        self.info_font_size = 24
+        self.weapon_font_size = 36
+
+        # 합성해 둔 패널들 (화면 좌표 영역)
+        level_bar_x = SCREEN_WIDTH // 2 - 150
+        self.panels = {
+            'health': RetainedPanel((15, -5, 210, 70)),
+            'weapon': RetainedPanel((SCREEN_WIDTH - 220, 20, 200, 80)),
+            'level': RetainedPanel((level_bar_x - 10, -20, 320, 90)),
+            'skills': RetainedPanel((0, SCREEN_HEIGHT - UI_HEIGHT, SCREEN_WIDTH, UI_HEIGHT)),
+            'info': RetainedPanel((20, SCREEN_HEIGHT - 120, 280, 90)),
+            'fps': RetainedPanel((SCREEN_WIDTH - 100, SCREEN_HEIGHT - 35, 100, 35)),
+            'game_over': RetainedPanel((0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)),
+        }
+        self.minimap = Minimap()
+        self.dirty_rects = []       # 이번 프레임에 내용이 바뀐 패널 영역
+        self.static_screen = False  # True면 화면이 유지되므로 바뀐 패널만 blit
+
+    def begin_frame(self, static=False):
+        """프레임 시작 - 정적 화면 모드로 들어가면 모든 패널을 무효화하고 True 반환 (호출자가 배경을 다시 그림)"""
+        self.dirty_rects = []
+        entered = static and not self.static_screen
+        self.static_screen = static
+        if entered:
+            for panel in self.panels.values():
+                panel.invalidate()
+        return entered
+
+    def _draw_panel(self, screen, name, key, render):
+        """패널을 필요할 때만 다시 합성하고 화면에 blit"""
+        panel = self.panels[name]
+        changed = panel.update(key, render)
+        if changed:
+            self.dirty_rects.append(panel.rect.clip(screen.get_rect()))
+        # 정적 화면에서는 이전 프레임 내용이 남아 있으므로 바뀐 패널만 blit
+        if changed or not self.static_screen:
+            screen.blit(panel.surface, panel.rect)
 
     def draw_player_hud(self, screen, player):
         """플레이어 HUD (체력바, 무기 정보 등)"""
@@ -24,190 +85,162 @@ class UI:
 
     def _draw_health_bar(self, screen, player):
         """체력바 그리기"""
+        hp_ratio = player.get_hp_ratio()
+        if hp_ratio > 0.6:
+            hp_color = GREEN
+        elif hp_ratio > 0.3:
+            hp_color = YELLOW
+        else:
+            hp_color = RED
+
+        key = (int(player.hp), int(player.max_hp), int(200 * hp_ratio), hp_color,
+               player.invincible_time > 0)
+        self._draw_panel(screen, 'health', key, self._render_health_bar)
+
+    def _render_health_bar(self, surface, hp, max_hp, current_width, hp_color, invincible):
         bar_width = 200
         bar_height = 20
-        bar_x = 20
-        bar_y = 20
+        bar_x = 5   # 화면 좌표 (20, 20)
+        bar_y = 25
 
         # 배경
-        bg_surface = pygame.Surface((bar_width + 10, bar_height + 30))
-        bg_surface.set_alpha(200)
-        bg_surface.fill((20, 20, 40))
-        screen.blit(bg_surface, (bar_x - 5, bar_y - 5))
+        surface.fill((20, 20, 40, 200), (bar_x - 5, bar_y - 5, bar_width + 10, bar_height + 30))
 
         # HP 텍스트
-        hp_text = self.info_font.render(f"HP: {int(player.hp)}/{int(player.max_hp)}", True, WHITE)
-        screen.blit(hp_text, (bar_x, bar_y - 25))
+        hp_text = text_cache.render(f"HP: {hp}/{max_hp}", self.info_font_size, WHITE)
+        surface.blit(hp_text, (bar_x, bar_y - 25))
 
         # HP 바 배경 (빨간색)
-        pygame.draw.rect(screen, DARK_RED, (bar_x, bar_y, bar_width, bar_height))
+        pygame.draw.rect(surface, DARK_RED, (bar_x, bar_y, bar_width, bar_height))
 
         # HP 바 (초록색 -> 노란색 -> 빨간색)
-        hp_ratio = player.get_hp_ratio()
-        current_width = int(bar_width * hp_ratio)
-
-        if hp_ratio > 0.6:
-            hp_color = GREEN
-        elif hp_ratio > 0.3:
-            hp_color = YELLOW
-        else:
-            hp_color = RED
-
         if current_width > 0:
-            pygame.draw.rect(screen, hp_color, (bar_x, bar_y, current_width, bar_height))
+            pygame.draw.rect(surface, hp_color, (bar_x, bar_y, current_width, bar_height))
 
         # 테두리
-        pygame.draw.rect(screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
+        pygame.draw.rect(surface, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
 
         # 무적 상태 표시
-        if player.invincible_time > 0:
-            invincible_text = self.cooldown_font.render("INVINCIBLE", True, CYAN)
-            screen.blit(invincible_text, (bar_x, bar_y + bar_height + 5))
+        if invincible:
+            invincible_text = text_cache.render("INVINCIBLE", self.cooldown_font_size, CYAN)
+            surface.blit(invincible_text, (bar_x, bar_y + bar_height + 5))
 
     def _draw_weapon_info(self, screen, player):
         """현재 무기 정보"""
         weapon_info = player.weapon_manager.get_current_weapon_info()
+        cooldown_sec = (weapon_info['cooldown'] // 60) + 1 if weapon_info['cooldown'] > 0 else 0
+        key = (weapon_info['name'], weapon_info['color'], weapon_info['ready'],
+               weapon_info['damage'], cooldown_sec)
+        self._draw_panel(screen, 'weapon', key, self._render_weapon_info)
 
-        # 배경 - FPS와 겹치지 않게 위치 조정
+    def _render_weapon_info(self, surface, name, color, ready, damage, cooldown_sec):
+        # 배경 - FPS와 겹치지 않게 위치 조정 (화면 좌표: 우상단)
         info_width = 200
         info_height = 80
-        info_x = SCREEN_WIDTH - info_width - 20
-        info_y = 20  # 기존과 동일
+        info_x = 0
+        info_y = 0
 
-        bg_surface = pygame.Surface((info_width, info_height))
-        bg_surface.set_alpha(200)
-        bg_surface.fill((20, 20, 40))
-        screen.blit(bg_surface, (info_x, info_y))
+        surface.fill((20, 20, 40, 200))
 
         # 테두리 (무기 색상)
-        border_color = weapon_info['color'] if weapon_info['ready'] else GRAY
-        pygame.draw.rect(screen, border_color, (info_x, info_y, info_width, info_height), 3)
+        border_color = color if ready else GRAY
+        pygame.draw.rect(surface, border_color, (info_x, info_y, info_width, info_height), 3)
 
         # 무기 이름
-        weapon_text = self.weapon_font.render(weapon_info['name'], True, weapon_info['color'])
-        screen.blit(weapon_text, (info_x + 10, info_y + 10))
+        weapon_text = text_cache.render(name, self.weapon_font_size, color)
+        surface.blit(weapon_text, (info_x + 10, info_y + 10))
 
         # 데미지 정보
-        damage_text = self.cooldown_font.render(f"DMG: {weapon_info['damage']}", True, WHITE)
-        screen.blit(damage_text, (info_x + 10, info_y + 45))
+        damage_text = text_cache.render(f"DMG: {damage}", self.cooldown_font_size, WHITE)
+        surface.blit(damage_text, (info_x + 10, info_y + 45))
 
         # 쿨다운 상태
-        if weapon_info['cooldown'] > 0:
-            cooldown_sec = (weapon_info['cooldown'] // 60) + 1
-            status_text = self.cooldown_font.render(f"Reload: {cooldown_sec}s", True, RED)
+        if cooldown_sec > 0:
+            status_text = text_cache.render(f"Reload: {cooldown_sec}s", self.cooldown_font_size, RED)
         else:
-            status_text = self.cooldown_font.render("READY", True, GREEN)
-        screen.blit(status_text, (info_x + 100, info_y + 45))
+            status_text = text_cache.render("READY", self.cooldown_font_size, GREEN)
+        surface.blit(status_text, (info_x + 100, info_y + 45))
 
         # 무기 변경 힌트
-        hint_text = self.cooldown_font.render("1,2,3 to switch", True, GRAY)
-        screen.blit(hint_text, (info_x + 10, info_y + 65))
+        hint_text = text_cache.render("1,2,3 to switch", self.cooldown_font_size, GRAY)
+        surface.blit(hint_text, (info_x + 10, info_y + 65))
 
     def draw_level_progress(self, screen, level_system):
         """레벨 진행률 바 (상단 중앙)"""
+        progress_width = int(300 * level_system.get_progress_ratio())
+        key = (level_system.level, progress_width,
+               level_system.kills, level_system.kills_for_next_level)
+        self._draw_panel(screen, 'level', key, self._render_level_progress)
+
+    def _render_level_progress(self, surface, level, progress_width, kills, kills_for_next_level):
         bar_width = 300
         bar_height = 20
-        bar_x = SCREEN_WIDTH // 2 - bar_width // 2
-        bar_y = 20
+        bar_x = 10   # 화면 좌표 (SCREEN_WIDTH // 2 - 150, 20)
+        bar_y = 40
+        center_x = bar_x + bar_width // 2
 
         # 배경
-        bg_surface = pygame.Surface((bar_width + 20, bar_height + 40))
-        bg_surface.set_alpha(200)
-        bg_surface.fill((20, 20, 40))
-        screen.blit(bg_surface, (bar_x - 10, bar_y - 10))
+        surface.fill((20, 20, 40, 200), (bar_x - 10, bar_y - 10, bar_width + 20, bar_height + 40))
 
         # 레벨 텍스트
-        level_text = self.info_font.render(f"LEVEL {level_system.level}", True, GOLD)
-        level_rect = level_text.get_rect(center=(SCREEN_WIDTH // 2, bar_y - 25))
-        screen.blit(level_text, level_rect)
+        level_text = text_cache.render(f"LEVEL {level}", self.info_font_size, GOLD)
+        level_rect = level_text.get_rect(center=(center_x, bar_y - 25))
+        surface.blit(level_text, level_rect)
 
         # 진행률 바 배경
-        pygame.draw.rect(screen, DARK_GRAY, (bar_x, bar_y, bar_width, bar_height))
+        pygame.draw.rect(surface, DARK_GRAY, (bar_x, bar_y, bar_width, bar_height))
 
         # 진행률 바
-        progress = level_system.get_progress_ratio()
-        progress_width = int(bar_width * progress)
-
         if progress_width > 0:
-            pygame.draw.rect(screen, GOLD, (bar_x, bar_y, progress_width, bar_height))
+            pygame.draw.rect(surface, GOLD, (bar_x, bar_y, progress_width, bar_height))
 
         # 테두리
-        pygame.draw.rect(screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
+        pygame.draw.rect(surface, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
 
         # 킬 수 텍스트
-        kill_text = self.cooldown_font.render(
-            f"{level_system.kills}/{level_system.kills_for_next_level} kills",
-            True, WHITE)
-        kill_rect = kill_text.get_rect(center=(SCREEN_WIDTH // 2, bar_y + bar_height + 15))
-        screen.blit(kill_text, kill_rect)
+        kill_text = text_cache.render(f"{kills}/{kills_for_next_level} kills", self.cooldown_font_size, WHITE)
+        kill_rect = kill_text.get_rect(center=(center_x, bar_y + bar_height + 15))
+        surface.blit(kill_text, kill_rect)
 
-    def draw_minimap(self, screen, player_pos, enemies, camera):
+    def draw_minimap(self, screen, player_pos, enemies, camera, obstacle_manager=None, health_packs=()):
         """미니맵 (우하단) - 위치 수정"""
         minimap_x = SCREEN_WIDTH - MINIMAP_SIZE - 20
         # FPS 표시와 겹치지 않게 위치 조정
         minimap_y = SCREEN_HEIGHT - MINIMAP_SIZE - 60  # 기존 -20에서 -60으로 변경
 
-        # 배경
-        minimap_surface = pygame.Surface((MINIMAP_SIZE, MINIMAP_SIZE))
-        minimap_surface.set_alpha(200)
-        minimap_surface.fill((10, 10, 20))
-
-        # 월드 경계
-        pygame.draw.rect(minimap_surface, WHITE,
-                         (0, 0, MINIMAP_SIZE, MINIMAP_SIZE), 2)
-
-        # 플레이어 위치
-        player_minimap_x = int((player_pos[0] / WORLD_WIDTH) * MINIMAP_SIZE)
-        player_minimap_y = int((player_pos[1] / WORLD_HEIGHT) * MINIMAP_SIZE)
-        pygame.draw.circle(minimap_surface, BLUE,
-                           (player_minimap_x, player_minimap_y), 3)
-
-        # 적군 위치 - 빨간 네모로 표시
-        for enemy in enemies:
-            if not enemy.is_dead:
-                enemy_minimap_x = int((enemy.x / WORLD_WIDTH) * MINIMAP_SIZE)
-                enemy_minimap_y = int((enemy.y / WORLD_HEIGHT) * MINIMAP_SIZE)
-
-                # 빨간 네모로 표시 (크기 4x4)
-                enemy_rect = pygame.Rect(enemy_minimap_x - 2, enemy_minimap_y - 2, 4, 4)
-                pygame.draw.rect(minimap_surface, RED, enemy_rect)
-
-        # 카메라 시야 영역
-        visible_area = camera.get_visible_area()
-        view_x = int((visible_area['left'] / WORLD_WIDTH) * MINIMAP_SIZE)
-        view_y = int((visible_area['top'] / WORLD_HEIGHT) * MINIMAP_SIZE)
-        view_w = int((SCREEN_WIDTH / WORLD_WIDTH) * MINIMAP_SIZE)
-        view_h = int((SCREEN_HEIGHT / WORLD_HEIGHT) * MINIMAP_SIZE)
-
-        pygame.draw.rect(minimap_surface, CYAN, (view_x, view_y, view_w, view_h), 1)
-
-        screen.blit(minimap_surface, (minimap_x, minimap_y))
+        # 장애물 레이어는 캐시, 적군/체력팩/카메라 마커는 낮은 주기로 갱신
+        self.minimap.draw(screen, (minimap_x, minimap_y), player_pos, enemies, camera,
+                          obstacle_manager, health_packs)
 
         # 미니맵 라벨
-        minimap_label = self.cooldown_font.render("MAP", True, WHITE)
+        minimap_label = text_cache.render("MAP", self.cooldown_font_size, WHITE)
         screen.blit(minimap_label, (minimap_x, minimap_y - 25))
 
     def draw_skill_bar(self, screen, player):
         """스킬바 (하단)"""
-        # UI 배경
-        ui_y = SCREEN_HEIGHT - UI_HEIGHT
-        ui_surface = pygame.Surface((SCREEN_WIDTH, UI_HEIGHT))
-        ui_surface.set_alpha(220)
-
-        # 그라디언트 배경
-        for y in range(UI_HEIGHT):
-            alpha = int(80 - (y * 0.5))
-            color = (15, 15, 35)
-            pygame.draw.line(ui_surface, color, (0, y), (SCREEN_WIDTH, y))
+        cooldowns = [
+            (player.blink_cooldown, player.blink_max_cooldown),
+            (player.dash_cooldown, player.dash_max_cooldown),
+            (player.explosion_cooldown, player.explosion_max_cooldown),
+            (0, 1),
+        ]
+        # 스킬별 (남은 초, 쿨다운 오버레이 높이) - 바뀔 때만 다시 합성
+        key = tuple(((cooldown // 60) + 1 if cooldown > 0 else 0,
+                     int(65 * cooldown / max_cooldown) if cooldown > 0 else 0)
+                    for cooldown, max_cooldown in cooldowns)
+        self._draw_panel(screen, 'skills', key, self._render_skill_bar)
 
-        screen.blit(ui_surface, (0, ui_y))
+    def _render_skill_bar(self, surface, *skill_states):
+        # UI 배경 (화면 좌표: 하단 UI_HEIGHT 영역)
+        ui_y = 0
+        surface.fill((15, 15, 35, 220))
 
         # 테두리
-        pygame.draw.line(screen, CYAN, (0, ui_y), (SCREEN_WIDTH, ui_y), 2)
+        pygame.draw.line(surface, CYAN, (0, ui_y), (SCREEN_WIDTH, ui_y), 2)
 
         # 제목
-        title_text = self.title_font.render("COMBAT SKILLS", True, GOLD)
-        screen.blit(title_text, (20, ui_y + 10))
+        title_text = text_cache.render("COMBAT SKILLS", self.title_font_size, GOLD)
+        surface.blit(title_text, (20, ui_y + 10))
 
         # 스킬 박스들
         skill_boxes = [
@@ -215,8 +248,6 @@ class UI:
                 "key": "R-CLICK",
                 "name": "BLINK",
                 "description": "Instant teleport",
-                "cooldown": player.blink_cooldown,
-                "max_cooldown": player.blink_max_cooldown,
                 "color": PURPLE,
                 "x": 50
             },
@@ -224,8 +255,6 @@ class UI:
                 "key": "F",
                 "name": "DASH",
                 "description": "Speed boost",
-                "cooldown": player.dash_cooldown,
-                "max_cooldown": player.dash_max_cooldown,
                 "color": RED,
                 "x": 280
             },
@@ -233,8 +262,6 @@ class UI:
                 "key": "Q",
                 "name": "EXPLODE",
                 "description": "Area damage",
-                "cooldown": player.explosion_cooldown,
-                "max_cooldown": player.explosion_max_cooldown,
                 "color": ORANGE,
                 "x": 510
             },
@@ -242,123 +269,114 @@ class UI:
                 "key": "L-CLICK",
                 "name": "SHOOT",
                 "description": "Fire weapon",
-                "cooldown": 0,
-                "max_cooldown": 1,
                 "color": CYAN,
                 "x": 740
             }
         ]
 
-        for skill in skill_boxes:
-            self._draw_skill_box(screen, skill, ui_y)
+        for skill, (cooldown_sec, overlay_height) in zip(skill_boxes, skill_states):
+            self._draw_skill_box(surface, skill, cooldown_sec, overlay_height, ui_y)
 
-    def _draw_skill_box(self, screen, skill, ui_y):
+    def _draw_skill_box(self, surface, skill, cooldown_sec, overlay_height, ui_y):
         x = skill["x"]
         y = ui_y + 55
         box_width = 180
         box_height = 65
 
         # 스킬 박스 배경
-        is_ready = skill["cooldown"] == 0
+        is_ready = cooldown_sec == 0
         box_color = (40, 40, 80) if is_ready else (60, 30, 30)
         border_color = skill["color"] if is_ready else (100, 100, 100)
 
         # 메인 박스
-        pygame.draw.rect(screen, box_color, (x, y, box_width, box_height), 0)
-        pygame.draw.rect(screen, border_color, (x, y, box_width, box_height), 2)
+        pygame.draw.rect(surface, box_color, (x, y, box_width, box_height), 0)
+        pygame.draw.rect(surface, border_color, (x, y, box_width, box_height), 2)
 
         # 쿨다운 오버레이
-        if skill["cooldown"] > 0:
-            cooldown_ratio = skill["cooldown"] / skill["max_cooldown"]
-            overlay_height = int(box_height * cooldown_ratio)
-
-            overlay_surface = pygame.Surface((box_width, overlay_height))
-            overlay_surface.set_alpha(120)
-            overlay_surface.fill((80, 20, 20))
-            screen.blit(overlay_surface, (x, y + box_height - overlay_height))
+        if overlay_height > 0:
+            overlay_surface = surface_cache.filled((box_width, overlay_height), (80, 20, 20), 120)
+            surface.blit(overlay_surface, (x, y + box_height - overlay_height))
 
         # 키 텍스트 (큰 글씨)
-        key_text = self.skill_font.render(skill["key"], True, skill["color"])
-        screen.blit(key_text, (x + 8, y + 8))
+        key_text = text_cache.render(skill["key"], self.skill_font_size, skill["color"])
+        surface.blit(key_text, (x + 8, y + 8))
 
         # 스킬 이름
-        name_text = self.cooldown_font.render(skill["name"], True, WHITE)
-        screen.blit(name_text, (x + 8, y + 32))
+        name_text = text_cache.render(skill["name"], self.cooldown_font_size, WHITE)
+        surface.blit(name_text, (x + 8, y + 32))
 
         # 설명
-        desc_text = self.cooldown_font.render(skill["description"], True, (180, 180, 180))
-        screen.blit(desc_text, (x + 8, y + 48))
+        desc_text = text_cache.render(skill["description"], self.cooldown_font_size, (180, 180, 180))
+        surface.blit(desc_text, (x + 8, y + 48))
 
         # 상태 표시
-        if skill["cooldown"] > 0:
-            cooldown_sec = (skill["cooldown"] // 60) + 1
-            status_text = self.cooldown_font.render(f"{cooldown_sec}s", True, RED)
-            screen.blit(status_text, (x + box_width - 35, y + 8))
+        if cooldown_sec > 0:
+            status_text = text_cache.render(f"{cooldown_sec}s", self.cooldown_font_size, RED)
+            surface.blit(status_text, (x + box_width - 35, y + 8))
         else:
-            status_text = self.cooldown_font.render("RDY", True, GREEN)
-            screen.blit(status_text, (x + box_width - 35, y + 8))
+            status_text = text_cache.render("RDY", self.cooldown_font_size, GREEN)
+            surface.blit(status_text, (x + box_width - 35, y + 8))
 
     def draw_game_info(self, screen, enemy_count, score=0, level=1):
         """게임 정보 (좌하단)"""
-        info_x = 20
-        info_y = SCREEN_HEIGHT - 120
+        self._draw_panel(screen, 'info', (enemy_count, score, level), self._render_game_info)
+
+    def _render_game_info(self, surface, enemy_count, score, level):
+        info_x = 0   # 화면 좌표 (20, SCREEN_HEIGHT - 120)
+        info_y = 0
 
         # 배경
-        info_bg = pygame.Surface((280, 90))
-        info_bg.set_alpha(150)
-        info_bg.fill((20, 20, 40))
-        screen.blit(info_bg, (info_x, info_y))
+        surface.fill((20, 20, 40, 150))
 
         # 게임 정보
-        controls_text = self.info_font.render("WASD: Move | L-Click: Shoot", True, WHITE)
-        screen.blit(controls_text, (info_x + 5, info_y + 5))
+        controls_text = text_cache.render("WASD: Move | L-Click: Shoot", self.info_font_size, WHITE)
+        surface.blit(controls_text, (info_x + 5, info_y + 5))
 
-        controls_text2 = self.info_font.render("1,2,3: Weapons | ESC: Quit", True, WHITE)
-        screen.blit(controls_text2, (info_x + 5, info_y + 25))
+        controls_text2 = text_cache.render("1,2,3: Weapons | ESC: Quit", self.info_font_size, WHITE)
+        surface.blit(controls_text2, (info_x + 5, info_y + 25))
 
         # 적군 수와 레벨 정보
-        enemy_text = self.info_font.render(f"Enemies: {enemy_count} | Level: {level}", True, RED)
-        screen.blit(enemy_text, (info_x + 5, info_y + 45))
+        enemy_text = text_cache.render(f"Enemies: {enemy_count} | Level: {level}", self.info_font_size, RED)
+        surface.blit(enemy_text, (info_x + 5, info_y + 45))
 
         # 점수
-        score_text = self.info_font.render(f"Score: {score}", True, GOLD)
-        screen.blit(score_text, (info_x + 5, info_y + 65))
+        score_text = text_cache.render(f"Score: {score}", self.info_font_size, GOLD)
+        surface.blit(score_text, (info_x + 5, info_y + 65))
 
     def draw_fps(self, screen, clock):
         """FPS 표시 (우하단) - 위치 수정"""
-        fps = int(clock.get_fps())
-        fps_text = self.cooldown_font.render(f"FPS: {fps}", True, WHITE)
+        self._draw_panel(screen, 'fps', (int(clock.get_fps()),), self._render_fps)
+
+    def _render_fps(self, surface, fps):
+        fps_text = text_cache.render(f"FPS: {fps}", self.cooldown_font_size, WHITE)
         fps_rect = fps_text.get_rect()
-        # 미니맵과 겹치지 않게 위치 조정
-        fps_rect.bottomright = (SCREEN_WIDTH - 10, SCREEN_HEIGHT - 10)
+        # 미니맵과 겹치지 않게 위치 조정 (화면 좌표: 우하단에서 10픽셀 안쪽)
+        fps_rect.bottomright = (surface.get_width() - 10, surface.get_height() - 10)
 
         # 반투명 배경
-        bg_surface = pygame.Surface((fps_rect.width + 10, fps_rect.height + 6))
-        bg_surface.set_alpha(150)
-        bg_surface.fill((0, 0, 0))
-        screen.blit(bg_surface, (fps_rect.x - 5, fps_rect.y - 3))
+        surface.fill((0, 0, 0, 150), (fps_rect.x - 5, fps_rect.y - 3, fps_rect.width + 10, fps_rect.height + 6))
 
-        screen.blit(fps_text, fps_rect)
+        surface.blit(fps_text, fps_rect)
 
     def draw_game_over_screen(self, screen, final_score):
         """게임 오버 화면"""
+        self._draw_panel(screen, 'game_over', (final_score,), self._render_game_over_screen)
+
+    def _render_game_over_screen(self, surface, final_score):
         # 반투명 오버레이
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill(BLACK)
-        screen.blit(overlay, (0, 0))
+        surface.fill((0, 0, 0, 180))
 
         # 게임 오버 텍스트
-        game_over_text = self.title_font.render("GAME OVER", True, RED)
+        game_over_text = text_cache.render("GAME OVER", self.title_font_size, RED)
         game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
-        screen.blit(game_over_text, game_over_rect)
+        surface.blit(game_over_text, game_over_rect)
 
         # 점수
-        score_text = self.skill_font.render(f"Final Score: {final_score}", True, WHITE)
+        score_text = text_cache.render(f"Final Score: {final_score}", self.skill_font_size, WHITE)
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        screen.blit(score_text, score_rect)
+        surface.blit(score_text, score_rect)
 
         # 재시작 안내
-        restart_text = self.info_font.render("Press R to restart or ESC to quit", True, WHITE)
+        restart_text = text_cache.render("Press R to restart or ESC to quit", self.info_font_size, WHITE)
         restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
-        screen.blit(restart_text, restart_rect)
\ No newline at end of file
+        surface.blit(restart_text, restart_rect)
\ No newline at end of file
@@ -2,7 +2,7 @@
 
 import math
 import pygame
-import random
+from surface_cache import surface_cache
 
 def distance(pos1, pos2):
     """두 점 사이의 거리를 계산"""
@@ -23,29 +23,69 @@ def clamp(value, min_val, max_val):
     """값을 범위 내로 제한"""
     return max(min_val, min(max_val, value))
 
-def create_explosion_particles(center, count=20):
-    """폭발 파티클 생성"""
-    particles = []
-    for _ in range(count):
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(2, 7)
-        particles.append({
-            'x': center[0],
-            'y': center[1],
-            'vx': math.cos(angle) * speed,
-            'vy': math.sin(angle) * speed,
-            'life': 60,
-            'max_life': 60,
-            'size': random.uniform(2, 6)
-        })
-    return particles
+def segment_rect_entry(x1, y1, x2, y2, left, top, right, bottom):
+    """선분과 사각형(AABB)의 교차 검사 - 처음 닿는 지점의 t(0~1) 반환, 없으면 None"""
+    dx = x2 - x1
+    dy = y2 - y1
+    t_enter = 0.0
+    t_exit = 1.0
+
+    # 슬랩(slab) 방식: 축별로 선분이 사각형 범위 안에 있는 구간을 좁혀 나감
+    for start, delta, low, high in ((x1, dx, left, right), (y1, dy, top, bottom)):
+        if delta == 0:
+            if start < low or start > high:
+                return None
+            continue
+        t1 = (low - start) / delta
+        t2 = (high - start) / delta
+        if t1 > t2:
+            t1, t2 = t2, t1
+        if t1 > t_enter:
+            t_enter = t1
+        if t2 < t_exit:
+            t_exit = t2
+        if t_enter > t_exit:
+            return None
+
+    return t_enter
+
+def segment_circle_entry(x1, y1, x2, y2, center_x, center_y, radius):
+    """선분과 원의 교차 검사 - 처음 닿는 지점의 t(0~1) 반환, 없으면 None"""
+    dx = x2 - x1
+    dy = y2 - y1
+    fx = x1 - center_x
+    fy = y1 - center_y
+
+    # 시작점이 이미 원 안에 있음
+    c = fx * fx + fy * fy - radius * radius
+    if c <= 0:
+        return 0.0
+
+    a = dx * dx + dy * dy
+    if a == 0:
+        return None
+    b = 2 * (fx * dx + fy * dy)
+    discriminant = b * b - 4 * a * c
+    if discriminant < 0:
+        return None
+
+    t = (-b - math.sqrt(discriminant)) / (2 * a)
+    if 0 <= t <= 1:
+        return t
+    return None
 
 def draw_circle_outline(surface, color, center, radius, width=3, alpha=255):
     """투명도가 적용된 원 테두리 그리기"""
     if alpha < 255:
-        temp_surface = pygame.Surface((radius * 2 + width * 2, radius * 2 + width * 2))
-        temp_surface.set_alpha(alpha)
-        pygame.draw.circle(temp_surface, color, (radius + width, radius + width), radius, width)
+        temp_surface = surface_cache.circle_outline(radius, color, width, alpha)
         surface.blit(temp_surface, (center[0] - radius - width, center[1] - radius - width))
     else:
-        pygame.draw.circle(surface, color, center, radius, width)
\ No newline at end of file
+        pygame.draw.circle(surface, color, center, radius, width)
+
+def draw_rect_outline(surface, color, rect, width=1):
+    """사각형 테두리 그리기 - 서피스 밖으로 잘린 변에 테두리가 생기지 않도록 네 변을 따로 채움"""
+    x, y, w, h = rect
+    pygame.draw.rect(surface, color, (x, y, w, width))
+    pygame.draw.rect(surface, color, (x, y + h - width, w, width))
+    pygame.draw.rect(surface, color, (x, y, width, h))
+    pygame.draw.rect(surface, color, (x + w - width, y, width, h))
\ No newline at end of file
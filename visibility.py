@@ -0,0 +1,44 @@
+# visibility.py - 플레이어 가시성 캐시 (모든 적군이 공유)
+
+from config import *
+
+
+class VisibilityMap:
+    def __init__(self, cell_size=VISIBILITY_CELL_SIZE):
+        self.cell_size = cell_size
+        self.origin_cell = None
+        self.origin_x = 0
+        self.origin_y = 0
+        self.obstacle_version = -1
+        self.obstacle_manager = None
+        self.cells = {}  # (cell_x, cell_y) -> 플레이어가 보이는지
+
+    def update(self, player_pos, obstacle_manager):
+        """프레임마다 한 번 호출 - 플레이어 셀이나 장애물이 바뀌었을 때만 캐시 초기화"""
+        origin_cell = (int(player_pos[0] // self.cell_size),
+                       int(player_pos[1] // self.cell_size))
+
+        if (origin_cell != self.origin_cell or
+                obstacle_manager is not self.obstacle_manager or
+                obstacle_manager.version != self.obstacle_version):
+            self.cells.clear()
+            self.origin_cell = origin_cell
+            self.origin_x, self.origin_y = self._cell_center(origin_cell)
+            self.obstacle_manager = obstacle_manager
+            self.obstacle_version = obstacle_manager.version
+
+    def _cell_center(self, cell):
+        return ((cell[0] + 0.5) * self.cell_size,
+                (cell[1] + 0.5) * self.cell_size)
+
+    def can_see_player(self, x, y):
+        """해당 위치에서 플레이어가 보이는지 (셀 단위로 한 번만 계산)"""
+        cell = (int(x // self.cell_size), int(y // self.cell_size))
+        visible = self.cells.get(cell)
+        if visible is None:
+            # 플레이어 셀 중심과 대상 셀 중심 사이의 시야선 검사
+            target_x, target_y = self._cell_center(cell)
+            visible = not self.obstacle_manager.check_line_collision(
+                self.origin_x, self.origin_y, target_x, target_y)
+            self.cells[cell] = visible
+        return visible
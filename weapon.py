@@ -2,7 +2,6 @@
 
 import pygame
 import math
-import random
 from config import *
 from utils import *
 